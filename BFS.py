@@ -2,6 +2,7 @@ import sys
 import pygame
 import math
 from queue import PriorityQueue
+from grid_engine import _record
 
 # Define colors
 WHITE = (255, 255, 255)
@@ -50,17 +51,25 @@ def heuristic(node1, node2):
     x2, y2 = node2
     return abs(x1 - x2) + abs(y1 - y2)
 
-# Define A* search
-def astar_search():
+# Define A* search. stats, if given, gets the grid_engine counts (see
+# _record there); a cell is never queued twice, so duplicates count the
+# cells put back after a cheaper path reopened them.
+def astar_search(stats=None):
     open_set = PriorityQueue()
     open_set.put((0, start))
     came_from = {}
-    g_score = {node: float("inf") for row in grid for node in row}
+    g_score = {(x, y): float("inf") for y in range(GRID_HEIGHT) for x in range(GRID_WIDTH)}
     g_score[start] = 0
-    f_score = {node: float("inf") for row in grid for node in row}
+    f_score = {(x, y): float("inf") for y in range(GRID_HEIGHT) for x in range(GRID_WIDTH)}
     f_score[start] = heuristic(start, end)
+    found = False
+    track = stats is not None
+    generated = 1
+    expanded = duplicates = peak_open = 0
 
     while not open_set.empty():
+        if track and open_set.qsize() > peak_open:
+            peak_open = open_set.qsize()
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
@@ -69,39 +78,56 @@ def astar_search():
 
         if current == end:
             reconstruct_path(came_from, end)
-            return True
+            found = True
+            break
 
+        expanded += 1
         for neighbor in get_neighbors(current):
             temp_g_score = g_score[current] + 1
 
             if temp_g_score < g_score[neighbor]:
+                reopened = g_score[neighbor] != float("inf")
                 came_from[neighbor] = current
                 g_score[neighbor] = temp_g_score
                 f_score[neighbor] = temp_g_score + heuristic(neighbor, end)
                 if neighbor not in [item[1] for item in open_set.queue]:
                     open_set.put((f_score[neighbor], neighbor))
                     grid[neighbor[1]][neighbor[0]] = OPEN
+                    generated += 1
+                    duplicates += reopened
 
         draw()
 
         if current != start:
             grid[current[1]][current[0]] = CLOSED
 
-    return False
+    if track:
+        _record(stats, expanded, generated, duplicates, peak_open)
+    return found
+
+# Define neighbor retrieval: the free neighbors of every cell, built once
+# walls are placed. Searches only mark cells OPEN/CLOSED/PATH, never WALL,
+# so the table stays valid until build_neighbor_table is called again.
+neighbor_table = []
+
+def build_neighbor_table():
+    neighbor_table[:] = [[() for _ in range(GRID_WIDTH)] for _ in range(GRID_HEIGHT)]
+    for y in range(GRID_HEIGHT):
+        for x in range(GRID_WIDTH):
+            neighbors = []
+            if x > 0 and grid[y][x - 1] != WALL:
+                neighbors.append((x - 1, y))
+            if x < GRID_WIDTH - 1 and grid[y][x + 1] != WALL:
+                neighbors.append((x + 1, y))
+            if y > 0 and grid[y - 1][x] != WALL:
+                neighbors.append((x, y - 1))
+            if y < GRID_HEIGHT - 1 and grid[y + 1][x] != WALL:
+                neighbors.append((x, y + 1))
+            neighbor_table[y][x] = tuple(neighbors)
 
-# Define neighbor retrieval
 def get_neighbors(node):
-    neighbors = []
     x, y = node
-    if x > 0 and grid[y][x - 1] != WALL:
-        neighbors.append((x - 1, y))
-    if x < GRID_WIDTH - 1 and grid[y][x + 1] != WALL:
-        neighbors.append((x + 1, y))
-    if y > 0 and grid[y - 1][x] != WALL:
-        neighbors.append((x, y - 1))
-    if y < GRID_HEIGHT - 1 and grid[y + 1][x] != WALL:
-        neighbors.append((x, y + 1))
-    return neighbors
+    return neighbor_table[y][x]
 
 # Define path reconstruction
 def reconstruct_path(came_from, current):
@@ -143,6 +169,7 @@ for y in range(GRID_HEIGHT):
             grid[y][x] = END
         elif x == 0 or x == GRID_WIDTH - 1 or y == 0 or y == GRID_HEIGHT - 1 or (x % 3 == 0 and y % 3 == 0):
             grid[y][x] = WALL
+build_neighbor_table()
 
 # Main loop
 running = True
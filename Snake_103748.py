@@ -1,6 +1,6 @@
 import pygame
 import random
-import heapq
+from grid_engine import Grid, a_star_search, bfs_search, dfs_search, greedy_best_first_search, snake_heading
 import sys
 
 # Constants
@@ -9,6 +9,7 @@ GRID_SIZE = 20
 GRID_WIDTH = WIDTH // GRID_SIZE
 GRID_HEIGHT = HEIGHT // GRID_SIZE
 SNAKE_SPEED = 3
+GAME_SEED = None  # Seed for the food positions; None draws a new one (printed at the start)
 
 # Colors
 WHITE = (255, 255, 255)
@@ -53,154 +54,6 @@ obstacle_positions = [
     # Add more obstacle positions as needed
 ]
 
-def heuristic(pos1, pos2):
-    x1, y1 = pos1
-    x2, y2 = pos2
-    return abs(x1 - x2) + abs(y1 - y2)  # Manhattan distance
-
-# Define a function for Greedy Best First Search
-def greedy_best_first_search(start, goal, obstacles):
-    # Convert start, goal, and obstacle positions to tuples
-    start = tuple(start)
-    goal = tuple(goal)
-    obstacles = set(tuple(pos) for pos in obstacles)
-
-    open_list = []
-    closed_list = set()
-    came_from = {}
-
-    def greedy_heuristic(pos):
-        return heuristic(pos, goal)
-
-    open_list.append((greedy_heuristic(start), start))
-
-    while open_list:
-        open_list.sort()  # Sort the open list based on the heuristic value
-        current = open_list.pop(0)[1]
-
-        if current == goal:
-            path = []
-            while current in came_from:
-                path.append(current)
-                current = came_from[current]
-            path.reverse()
-            return path
-
-        closed_list.add(current)
-
-        for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-            neighbor = (current[0] + dx, current[1] + dy)
-
-            if neighbor in closed_list or neighbor in obstacles:
-                continue
-
-            if neighbor not in [n[1] for n in open_list]:
-                came_from[neighbor] = current
-                open_list.append((greedy_heuristic(neighbor), neighbor))
-
-    return None  # No path found
-
-
-# Define a function for DFS search
-def a_star_search(start, goal, obstacles):
-    # Convert start, goal, and obstacle positions to tuples
-    start = tuple(start)
-    goal = tuple(goal)
-    obstacles = set(tuple(pos) for pos in obstacles)
-
-    open_list = []
-    closed_list = set()
-    came_from = {}
-    g_score = {start: 0}
-    f_score = {start: heuristic(start, goal)}
-
-    heapq.heappush(open_list, (f_score[start], start))
-
-    while open_list:
-        _, current = heapq.heappop(open_list)
-
-        if current == goal:
-            path = []
-            while current in came_from:
-                path.append(current)
-                current = came_from[current]
-            path.reverse()
-            return path
-
-        closed_list.add(current)
-
-        for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-            neighbor = (current[0] + dx, current[1] + dy)
-
-            if neighbor in closed_list or neighbor in obstacles:
-                continue
-
-            tentative_g_score = g_score[current] + 1
-
-            if neighbor not in [n[1] for n in open_list] or tentative_g_score < g_score[neighbor]:
-                came_from[neighbor] = current
-                g_score[neighbor] = tentative_g_score
-                f_score[neighbor] = g_score[neighbor] + heuristic(neighbor, goal)
-                heapq.heappush(open_list, (f_score[neighbor], neighbor))
-
-    return None  # No path found
-
-# Define a function for DFS search
-def dfs_search(start, goal, obstacles):
-    stack = [(start, [])]  # Initialize a stack with the start position and an empty path
-    visited = set()  # Keep track of visited positions to avoid loops
-
-    while stack:
-        current_position, path = stack.pop()  # Get the current position and path
-
-        if current_position == goal:
-            # Found a path to the goal
-            return path
-        
-        visited.add(current_position)
-
-        for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-            neighbor = (current_position[0] + dx, current_position[1] + dy)
-
-            if (
-                neighbor not in visited and
-                neighbor not in obstacles and
-                0 <= neighbor[0] < GRID_WIDTH and 0 <= neighbor[1] < GRID_HEIGHT
-            ):
-                # Add the neighbor to the stack with the updated path
-                stack.append((neighbor, path + [current_position]))
-
-    # If no path is found, return an empty path
-    return []
-
-# Define a function for BFS search
-def bfs_search(start, goal, obstacles):
-    queue = [(start, [])]  # Initialize a queue with the start position and an empty path
-    visited = set()  # Keep track of visited positions to avoid loops
-
-    while queue:
-        current_position, path = queue.pop(0)  # Get the current position and path
-
-        if current_position == goal:
-            # Found a path to the goal
-            return path
-
-        visited.add(current_position)
-
-        for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-            neighbor = (current_position[0] + dx, current_position[1] + dy)
-
-            if (
-                neighbor not in visited and
-                neighbor not in obstacles and
-                0 <= neighbor[0] < GRID_WIDTH and 0 <= neighbor[1] < GRID_HEIGHT
-            ):
-                # Add the neighbor to the queue with the updated path
-                queue.append((neighbor, path + [current_position]))
-
-    # If no path is found, return an empty path
-    return []
-
 # Main game loop
 running = True
 clock = pygame.time.Clock()
@@ -209,14 +62,22 @@ clock = pygame.time.Clock()
 boundary = [(x, 0) for x in range(GRID_WIDTH)] + [(x, GRID_HEIGHT - 1) for x in range(GRID_WIDTH)] + \
            [(0, y) for y in range(1, GRID_HEIGHT - 1)] + [(GRID_WIDTH - 1, y) for y in range(1, GRID_HEIGHT - 1)]
 
+# Build the search grid once; obstacles and boundary never move during a game
+grid = Grid(GRID_WIDTH, GRID_HEIGHT, obstacle_positions + boundary)
+
 def check_collision(new_head):
     if new_head in snake[1:] or new_head in boundary:
         return True
     return False
 
+# Every random draw in the game comes from this generator, so a seed replays it
+game_seed = GAME_SEED if GAME_SEED is not None else random.getrandbits(63)
+rng = random.Random(game_seed)
+print(f"Game seed: {game_seed}")
+
 def generate_random_food(obstacle_positions):
     while True:
-        food = (random.randint(1, GRID_WIDTH - 2), random.randint(1, GRID_HEIGHT - 2))
+        food = (rng.randint(1, GRID_WIDTH - 2), rng.randint(1, GRID_HEIGHT - 2))
         if food not in obstacle_positions:
             return food
         
@@ -267,31 +128,31 @@ while running and eaten_food_count < 3:  # Run the game until the snake eats foo
 
     if eaten_food_count == 0:
         if search_algorithm == "A*":
-            direction = a_star_search(snake[0], food, obstacle_positions)
+            direction = a_star_search(grid, snake[0], food)
         elif search_algorithm == "DFS":
-            direction = dfs_search(snake[0], food2, obstacle_positions)
+            direction = dfs_search(grid, snake[0], food2)
         elif search_algorithm == "BFS":
-            direction = bfs_search(snake[0], food3, obstacle_positions)
+            direction = bfs_search(grid, snake[0], food3)
         else:
-            direction = greedy_best_first_search(snake[0], food, obstacle_positions)
+            direction = greedy_best_first_search(grid, snake[0], food, heading=snake_heading(snake))
     elif eaten_food_count == 1:
         if search_algorithm == "A*":
-            direction = a_star_search(snake[0], food, obstacle_positions)
+            direction = a_star_search(grid, snake[0], food)
         elif search_algorithm == "DFS":
-            direction = dfs_search(snake[0], food2, obstacle_positions)
+            direction = dfs_search(grid, snake[0], food2)
         elif search_algorithm == "BFS":
-            direction = bfs_search(snake[0], food3, obstacle_positions)
+            direction = bfs_search(grid, snake[0], food3)
         else:
-            direction = greedy_best_first_search(snake[0], food2, obstacle_positions)
+            direction = greedy_best_first_search(grid, snake[0], food2, heading=snake_heading(snake))
     elif eaten_food_count == 2:
         if search_algorithm == "A*":
-            direction = a_star_search(snake[0], food, obstacle_positions)
+            direction = a_star_search(grid, snake[0], food)
         elif search_algorithm == "DFS":
-            direction = dfs_search(snake[0], food2, obstacle_positions)
+            direction = dfs_search(grid, snake[0], food2)
         elif search_algorithm == "BFS":
-            direction = bfs_search(snake[0], food3, obstacle_positions)
+            direction = bfs_search(grid, snake[0], food3)
         else:
-            direction = greedy_best_first_search(snake[0], food3, obstacle_positions)
+            direction = greedy_best_first_search(grid, snake[0], food3, heading=snake_heading(snake))
     
     # Check if direction is not None
     if direction is not None:
@@ -319,7 +180,7 @@ while running and eaten_food_count < 3:  # Run the game until the snake eats foo
                 food = generate_random_food(obstacle_positions)  # Generate a new food position
             else:
                 # Update the direction to move towards the second food
-                direction = a_star_search(snake[0], food, obstacle_positions)
+                direction = a_star_search(grid, snake[0], food)
                 # Optionally, you can also check if there's no possible path to the second food and handle that case.
         else:
             # If food is not eaten, continue moving the snake
@@ -1,7 +1,16 @@
-import pygame
-import random
-import heapq
-import sys
+import atexit
+from grid_engine import (SEARCH_ALGORITHMS, a_star_bucket_search, a_star_search, bfs_search, dfs_search,
+                         greedy_best_first_search, snake_heading)
+from distance_field import DistanceField
+from dstar_lite import DStarLite
+from path_follower import PathFollower
+from landmarks import LandmarkHeuristic
+from hamiltonian import HamiltonianCycle
+from free_space import FreeSpaceTracker
+from snake_env import OBSTACLES, SnakeEnv
+from snake_renderer import SnakeRenderer
+from replay import save_replay
+from search_stats import SearchRecorder
 
 # Constants
 WIDTH, HEIGHT = 400, 400
@@ -9,481 +18,168 @@ GRID_SIZE = 20
 GRID_WIDTH = WIDTH // GRID_SIZE
 GRID_HEIGHT = HEIGHT // GRID_SIZE
 SNAKE_SPEED = 3
-
-# Colors
-WHITE = (255, 255, 255)
-GREEN = (0, 255, 0)
-RED = (255, 0, 0)
-BLACK = (0, 0, 0)
+A_STAR_ALGORITHM = "A*"  # "A*" uses a binary heap, "A* Bucket" the bucket queue (Dial's algorithm),
+                        # "JPS" Jump Point Search, "Bidirectional A*" and "Bidirectional BFS" search
+                        # from both ends at once,
+                        # "Wavefront" a NumPy distance field recomputed only when the food moves,
+                        # "D* Lite" an incremental planner repaired each tick around the snake's body,
+                        # "Hamiltonian" a precomputed cycle with shortcuts, no search at all
+FOLLOW_PATHS = True  # Reuse the planned route until it goes stale instead of searching every tick
+USE_LANDMARKS = True  # Guide A* and GBFS with landmark distances instead of plain Manhattan distance
+AVOID_DEAD_POCKETS = True  # Refuse moves that cut the head off from the tail in a region too small for the body
+GAME_SEED = None  # Seed for the food positions; None draws a new one (printed at the start)
+REPLAY_FILE = "last_game.snkr"  # Where the game's replay is saved on exit, even after a crash; None to skip
+SEARCH_STATS_FILE = None  # JSON file for per-search counts and timings, written on exit; None runs the searches uninstrumented
+
+# Name shown while chasing each food
+STAGE_NAMES = ["A* Algorithm", "DFS Algorithm", "BFS Algorithm", "GBFS Algorithm"]
+# Modes that keep their own planner for the whole game instead of moving on to DFS and BFS
+UNSTAGED_MODES = ("Hamiltonian", "D* Lite", "Wavefront")
+# Stages that chase a later food, so the game cannot start in them
+LATER_STAGES = ("DFS", "BFS", "GBFS")
+
+if A_STAR_ALGORITHM in LATER_STAGES or (A_STAR_ALGORITHM not in SEARCH_ALGORITHMS and A_STAR_ALGORITHM not in UNSTAGED_MODES):
+    raise ValueError(f"Unknown A_STAR_ALGORITHM: {A_STAR_ALGORITHM!r}")
+
+# The game state and rules live in SnakeEnv; this script picks the moves and draws
+env = SnakeEnv(GRID_WIDTH, GRID_HEIGHT, OBSTACLES)
+
+# Build the search grid once; obstacles and boundary never move during a game
+grid = env.grid
+distance_field = DistanceField(grid)
+planner = None  # D* Lite planner for the current food
+path_follower = PathFollower(grid)
+landmarks = LandmarkHeuristic(grid) if USE_LANDMARKS else None  # None falls back to Manhattan
+cycle = HamiltonianCycle(grid)
+
+# The Hamiltonian mode can only reach food on its cycle
+if A_STAR_ALGORITHM == "Hamiltonian":
+    env.food_blocked.update(cycle.uncovered)
+env.reset(GAME_SEED)
+snake = env.snake
+print(f"Game seed: {env.seed}")
+if REPLAY_FILE is not None:
+    atexit.register(save_replay, REPLAY_FILE, env)
+search_recorder = SearchRecorder() if SEARCH_STATS_FILE is not None else None
+if search_recorder is not None:
+    atexit.register(search_recorder.save, SEARCH_STATS_FILE)
+free_space = FreeSpaceTracker(grid, snake)  # Free-cell connectivity, updated as the head and tail move
 
 # Initialize Pygame
-pygame.init()
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption('Snake Game')
-
-# Load the food image
-food_image = pygame.image.load('food.png')  # Make sure to place your food image file in the same directory as your script.
-
-# Snake and Food
-snake = [(5, 5)]
-food = (15, 15)
-
-# Obstacle Positions
-# Define the positions of obstacles in a predetermined pattern
-obstacle_positions = [
-    (9, 7),
-    (10, 8),
-    (11, 9),
-    (12, 10),
-    (13, 11),
-    (5, 8),
-    (5, 9),
-    (5, 10),
-    (5, 11),
-    (5, 12),
-    (5, 13),
-    (5, 14),
-    (6, 14),
-    (7, 14),
-    (8, 14),
-    (9, 14),
-    (10, 14),
-    (11, 14),
-    (12, 14),
-    # Add more obstacle positions as needed
-]
-
-def heuristic(pos1, pos2):
-    x1, y1 = pos1
-    x2, y2 = pos2
-    return abs(x1 - x2) + abs(y1 - y2)  # Manhattan distance
-
-# Define a function for A* search
-def a_star_search(start, goal, obstacles):
-    # Convert start, goal, and obstacle positions to tuples
-    start = tuple(start)
-    goal = tuple(goal)
-    obstacles = set(tuple(pos) for pos in obstacles)
-
-    open_list = []
-    closed_list = set()
-    came_from = {}
-    g_score = {start: 0}
-    f_score = {start: heuristic(start, goal)}
-
-    heapq.heappush(open_list, (f_score[start], start))
-
-    while open_list:
-        _, current = heapq.heappop(open_list)
-
-        if current == goal:
-            path = []
-            while current in came_from:
-                path.append(current)
-                current = came_from[current]
-            path.reverse()
-            return path
-
-        closed_list.add(current)
-
-        for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-            neighbor = (current[0] + dx, current[1] + dy)
-
-            if neighbor in closed_list or neighbor in obstacles:
-                continue
-
-            tentative_g_score = g_score[current] + 1
-
-            if neighbor not in [n[1] for n in open_list] or tentative_g_score < g_score[neighbor]:
-                came_from[neighbor] = current
-                g_score[neighbor] = tentative_g_score
-                f_score[neighbor] = g_score[neighbor] + heuristic(neighbor, goal)
-                heapq.heappush(open_list, (f_score[neighbor], neighbor))
-
-    return None  # No path found
-
-# Define a function for DFS search
-def dfs_search(start, goal, obstacles):
-    stack = [(start, [])]  # Initialize a stack with the start position and an empty path
-    visited = set()  # Keep track of visited positions to avoid loops
-
-    while stack:
-        current_position, path = stack.pop()  # Get the current position and path
-
-        if current_position == goal:
-            # Found a path to the goal
-            return path
-        
-        visited.add(current_position)
-
-        for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-            neighbor = (current_position[0] + dx, current_position[1] + dy)
-
-            if (
-                neighbor not in visited and
-                neighbor not in obstacles and
-                0 <= neighbor[0] < GRID_WIDTH and 0 <= neighbor[1] < GRID_HEIGHT
-            ):
-                # Add the neighbor to the stack with the updated path
-                stack.append((neighbor, path + [current_position]))
-
-    # If no path is found, return an empty path
-    return []
-
-# Define a function for BFS search
-def bfs_search(start, goal, obstacles):
-    queue = [(start, [])]  # Initialize a queue with the start position and an empty path
-    visited = set()  # Keep track of visited positions to avoid loops
-
-    while queue:
-        current_position, path = queue.pop(0)  # Get the current position and path
+renderer = SnakeRenderer(env, GRID_SIZE)
+
+# Run a search for the snake's head, or step along the route it planned earlier
+def plan_route(search, goal, *args, **kwargs):
+    if search_recorder is not None:
+        search = search_recorder.wrap(search_algorithm, search)
+    if FOLLOW_PATHS:
+        next_step = path_follower.next_step(search, snake, goal, *args, **kwargs)
+        return [next_step] if next_step is not None else None
+    return search(grid, snake[0], goal, *args, **kwargs)
+
+# Swap a move into a dead pocket for a neighbor that keeps the tail in reach
+def avoid_dead_pockets(next_position):
+    if free_space.is_safe(next_position, snake):
+        return next_position
+    for dx, dy in ((0, 1), (0, -1), (1, 0), (-1, 0)):
+        step = (snake[0][0] + dx, snake[0][1] + dy)
+        if not grid.is_blocked(step) and step not in snake[1:] and free_space.is_safe(step, snake):
+            return step
+    return next_position
 
-        if current_position == goal:
-            # Found a path to the goal
-            return path
-
-        visited.add(current_position)
-
-        for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-            neighbor = (current_position[0] + dx, current_position[1] + dy)
-
-            if (
-                neighbor not in visited and
-                neighbor not in obstacles and
-                0 <= neighbor[0] < GRID_WIDTH and 0 <= neighbor[1] < GRID_HEIGHT
-            ):
-                # Add the neighbor to the queue with the updated path
-                queue.append((neighbor, path + [current_position]))
-
-    # If no path is found, return an empty path
-    return []
-
-# Define a function for Greedy Best First Search
-def greedy_best_first_search(start, goal, obstacles):
-    open_list = []
-    closed_list = set()
-    came_from = {}
-
-    def greedy_heuristic(pos):
-        # Define your heuristic here; for GBFS, it's an estimate of the remaining cost (e.g., Manhattan distance)
-        return abs(pos[0] - goal[0]) + abs(pos[1] - goal[1])
-
-    open_list.append((greedy_heuristic(start), start))
-
-    while open_list:
-        open_list.sort()  # Sort the open list based on the heuristic value
-        current = open_list.pop(0)[1]
-
-        if current == goal:
-            path = []
-            while current in came_from:
-                path.append(current)
-                current = came_from[current]
-            path.reverse()
-            return path
-
-        closed_list.add(current)
-
-        for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-            neighbor = (current[0] + dx, current[1] + dy)
-
-            if neighbor in closed_list or neighbor in obstacles:
-                continue
-
-            if neighbor not in [n[1] for n in open_list]:
-                came_from[neighbor] = current
-                open_list.append((greedy_heuristic(neighbor), neighbor))
-
-    return None  # No path found
-
-# Main game loop
-running = True
-clock = pygame.time.Clock()
-
-# Set up boundaries around the screen
-boundary = [(x, 0) for x in range(GRID_WIDTH)] + [(x, GRID_HEIGHT - 1) for x in range(GRID_WIDTH)] + \
-           [(0, y) for y in range(1, GRID_HEIGHT - 1)] + [(GRID_WIDTH - 1, y) for y in range(1, GRID_HEIGHT - 1)]
-
-def check_collision(new_head):
-    if new_head in snake[1:] or new_head in boundary:
-        return True
-    return False
-
-def generate_random_food(obstacle_positions):
-    while True:
-        food = (random.randint(1, GRID_WIDTH - 2), random.randint(1, GRID_HEIGHT - 2))
-        if food not in obstacle_positions:
-            return food
-        
-# Initialize the food position
-food = generate_random_food(obstacle_positions)
-
-# eaten_food_count = False  # Variable to track if the snake has eaten the food
-eaten_food_count = 0  # Variable to track how many times the snake has eaten food
-path = []  # Initialize a list to store the path coordinates
 total_path_length = 0  # Initialize total path length
 
 # Initialize a variable to track the type of search algorithm
-search_algorithm = "A*"  # Start with A* search
-
-# Add a new variable for the second food
-food2 = None
-
-# Add a new variable for the third food
-food3 = None
-
-# Add a new variable for the fourth food
-food4 = None
+search_algorithm = A_STAR_ALGORITHM  # Start with A* search
 
-while running and eaten_food_count < 4:  # Run the game until the snake eats food three times
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-
-    # # Snake Movement (manual control)
-    # keys = pygame.key.get_pressed()
-    # if keys[pygame.K_UP] and (len(snake) < 2 or (snake[0][0], snake[0][1] - 1) != snake[1]):
-    #     direction = (0, -1)
-    # elif keys[pygame.K_DOWN] and (len(snake) < 2 or (snake[0][0], snake[0][1] + 1) != snake[1]):
-    #     direction = (0, 1)
-    # elif keys[pygame.K_LEFT] and (len(snake) < 2 or (snake[0][0] - 1, snake[0][1]) != snake[1]):
-    #     direction = (-1, 0)
-    # elif keys[pygame.K_RIGHT] and (len(snake) < 2 or (snake[0][0] + 1, snake[0][1]) != snake[1]):
-    #     direction = (1, 0)
-
-    # Check if the snake has eaten both foods to end the game
-    if eaten_food_count >= 4:
-        running = False
-
-    if food2 is None and eaten_food_count == 1:
-        # Generate the second food after eating the first
-        food2 = generate_random_food(obstacle_positions)
-
-    if food3 is None and eaten_food_count == 2:
-        # Generate the third food after eating the second
-        food3 = generate_random_food(obstacle_positions)
-    
-    if food4 is None and eaten_food_count == 3:
-        # Generate the fourth food after eating the third
-        food4 = generate_random_food(obstacle_positions)
-
-    if eaten_food_count == 0:
-        if search_algorithm == "A*":
-            direction = a_star_search(snake[0], food, obstacle_positions)
-        elif search_algorithm == "DFS":
-            direction = dfs_search(snake[0], food2, obstacle_positions)
-        elif search_algorithm == "BFS":
-            direction = bfs_search(snake[0], food3, obstacle_positions)
-        else:
-            direction = greedy_best_first_search(snake[0], food4, obstacle_positions)
-    elif eaten_food_count == 1:
-        if search_algorithm == "A*":
-            direction = a_star_search(snake[0], food, obstacle_positions)
-        elif search_algorithm == "DFS":
-            direction = dfs_search(snake[0], food2, obstacle_positions)
-        elif search_algorithm == "BFS":
-            direction = bfs_search(snake[0], food3, obstacle_positions)
-        else:
-            direction = greedy_best_first_search(snake[0], food4, obstacle_positions)
-    elif eaten_food_count == 2:
-        if search_algorithm == "A*":
-            direction = a_star_search(snake[0], food, obstacle_positions)
-        elif search_algorithm == "DFS":
-            direction = dfs_search(snake[0], food2, obstacle_positions)
-        elif search_algorithm == "BFS":
-            direction = bfs_search(snake[0], food3, obstacle_positions)
+# Main game loop
+running = True
+while running and not env.done:  # Run the game until the snake eats food four times
+    running = renderer.poll()
+
+    food, food2, food3, food4 = env.foods
+
+    # Each algorithm chases its own food; the A* modes (heap, bucket queue, JPS, bidirectional, wavefront, D* Lite,
+    # Hamiltonian) chase the first one
+    if search_algorithm == "Hamiltonian":
+        next_step = cycle.next_step(snake, food)
+        direction = [next_step] if next_step is not None else None
+    elif search_algorithm == "D* Lite":
+        # Keep the planner while the food stays put; only the head and tail changes get repaired
+        if planner is None or planner.goal != food:
+            planner = DStarLite(grid, snake[0], food, snake[1:])
+        planner.follow_snake(snake)
+        if search_recorder is not None:
+            search_recorder.run_planner(search_algorithm, planner.replan, planner.path)
         else:
-            direction = greedy_best_first_search(snake[0], food4, obstacle_positions)
-    elif eaten_food_count == 3:
-        if search_algorithm == "A*":
-            direction = a_star_search(snake[0], food, obstacle_positions)
-        elif search_algorithm == "DFS":
-            direction = dfs_search(snake[0], food2, obstacle_positions)
-        elif search_algorithm == "BFS":
-            direction = bfs_search(snake[0], food3, obstacle_positions)
+            planner.replan()
+        next_step = planner.next_step()
+        direction = [next_step] if next_step is not None else None
+    elif search_algorithm == "Wavefront":
+        if search_recorder is not None:
+            # Recorded only on the ticks that recompute the field
+            next_step = search_recorder.run_planner(search_algorithm, distance_field.next_step,
+                                                    lambda: distance_field.path(snake[0]), snake[0], food)
         else:
-            direction = greedy_best_first_search(snake[0], food4, obstacle_positions)
-    
+            next_step = distance_field.next_step(snake[0], food)
+        direction = [next_step] if next_step is not None else None
+    elif search_algorithm == "A*":
+        direction = plan_route(a_star_search, food, heuristic=landmarks)
+    elif search_algorithm == "A* Bucket":
+        direction = plan_route(a_star_bucket_search, food)
+    elif search_algorithm == "DFS":
+        direction = plan_route(dfs_search, food2)
+    elif search_algorithm == "BFS":
+        direction = plan_route(bfs_search, food3)
+    elif search_algorithm == "GBFS":
+        direction = plan_route(greedy_best_first_search, food4, heading=snake_heading(snake), heuristic=landmarks)
+    else:
+        # The other grid_engine searches, by their SEARCH_ALGORITHMS name, chase the first food like A*
+        direction = plan_route(SEARCH_ALGORITHMS[search_algorithm], food)
+
     # Check if direction is not None
     if direction is not None:
-        # if direction:  # Check if direction is not empty
         next_position = direction[0]
-            
-        dx, dy = next_position[0] - snake[0][0], next_position[1] - snake[0][1]  # Calculate the direction
-
-        # Add the new head position to the path list
-        path.append((snake[0][0] + dx, snake[0][1] + dy))
-
-        # Calculate the length of the path list as the snake moves
-        total_path_length = len(path)
-        
-        # Calculate the Manhattan distance between the snake's head and the food
-        manhattan_distance = abs(snake[0][0] - food[0]) + abs(snake[0][1] - food[1])
-
-        # Move snake
-        new_head = (snake[0][0] + dx, snake[0][1] + dy)
-        # new_head = (snake[0][0] + direction[0], snake[0][1] + direction[1])
-
-        if new_head == food:
-            if not eaten_food_count:
-                eaten_food_count += 1
-                food = generate_random_food(obstacle_positions)  # Generate a new food position
-            else:
-                # Update the direction to move towards the second food
-                direction = a_star_search(snake[0], food, obstacle_positions)
-                # Optionally, you can also check if there's no possible path to the second food and handle that case.
-        else:
-            # If food is not eaten, continue moving the snake
-            snake.pop()
-
-        # Check for collision with obstacles
-        if new_head in obstacle_positions:
-            running = False
-
-        if check_collision(new_head):
-            running = False
-
-        snake.insert(0, new_head)
-
-    # Check if the snake's head has reached the first food
-    if snake[0] == food:
-        food = generate_random_food(obstacle_positions)  # Generate the next food position
-        eaten_food_count += 1  # Increase the count of eaten food
-
-        if eaten_food_count == 1:
-            search_algorithm = "A*"  # Display A* algorithm info for the first food
-
-    # Check if the snake's head has reached the second food
-    if snake[0] == food2:
-        food2 = generate_random_food(obstacle_positions)  # Generate the next food position
-        eaten_food_count += 1  # Increase the count of eaten food
-
-        if eaten_food_count == 2:
-            search_algorithm = "DFS"  # Display DFS algorithm info for the second food
-
-    # Check if the snake's head has reached the third food
-    if snake[0] == food3:
-        food3 = generate_random_food(obstacle_positions)  # Generate the next food position
-        eaten_food_count += 1  # Increase the count of eaten food
+        if AVOID_DEAD_POCKETS and search_algorithm != "Hamiltonian":
+            next_position = avoid_dead_pockets(next_position)
 
-        if eaten_food_count == 3:
-            search_algorithm = "BFS"  # Display DFS algorithm info for the third food
-
-    # Check if the snake's head has reached the fourth food
-    if snake[0] == food4:
-        food4 = None  # Remove the fourth food
-        eaten_food_count += 1  # Increase the count of eaten food    
-
-    # Draw everything
-    screen.fill(BLACK)
-
-    # Draw obstacles
-    for obs in obstacle_positions:
-        pygame.draw.rect(screen, GREEN, (obs[0] * GRID_SIZE, obs[1] * GRID_SIZE, GRID_SIZE, GRID_SIZE))
-
-    # Draw the snake
-    for segment in snake:
-        pygame.draw.rect(screen, GREEN, (segment[0] * GRID_SIZE, segment[1] * GRID_SIZE, GRID_SIZE, GRID_SIZE))
-    
-    # Draw the head
-    pygame.draw.rect(screen, RED, (snake[0][0] * GRID_SIZE, snake[0][1] * GRID_SIZE, GRID_SIZE, GRID_SIZE))
-
-    # Draw the food image
-    screen.blit(food_image, (food[0] * GRID_SIZE, food[1] * GRID_SIZE))
-
-    # Draw the boundary
-    for point in boundary:
-        pygame.draw.rect(screen, GREEN, (point[0] * GRID_SIZE, point[1] * GRID_SIZE, GRID_SIZE, GRID_SIZE))
-
-    # Display the information when approaching the first food
-    if eaten_food_count == 0:
-        # Calculate the Manhattan distance
-        manhattan_distance = abs(snake[0][0] - food[0]) + abs(snake[0][1] - food[1])
-
-        # Display A* algorithm info
-        font = pygame.font.Font(None, 24)
-        algorithm_info = font.render(f'   A* Algorithm', True, WHITE)
-        screen.blit(algorithm_info, (10, 20))
-
-        # Display Manhattan distance
-        distance_text = font.render(f'   Manhattan Distance: {manhattan_distance}', True, WHITE)
-        screen.blit(distance_text, (10, 40))
-
-        # Display Total Path Length
-        path_length_text = font.render(f'   Total Path Length: {total_path_length}', True, WHITE)
-        screen.blit(path_length_text, (10, 60))
-  
-    # Display the information when approaching the second food
-    if eaten_food_count == 1:
-        # Calculate the Manhattan distance
-        manhattan_distance = abs(snake[0][0] - food[0]) + abs(snake[0][1] - food[1])
-
-        # Display DFS algorithm info
-        font = pygame.font.Font(None, 24)
-        algorithm_info = font.render(f'   DFS Algorithm', True, WHITE)
-        screen.blit(algorithm_info, (10, 20))
-
-        # Display Manhattan distance
-        distance_text = font.render(f'   Manhattan Distance: {manhattan_distance}', True, WHITE)
-        screen.blit(distance_text, (10, 40))
-
-        # Display Total Path Length
-        path_length_text = font.render(f'   Total Path Length: {total_path_length}', True, WHITE)
-        screen.blit(path_length_text, (10, 60))
-    
-    # Display the information when approaching the third food
-    if eaten_food_count == 2:
-        # Calculate the Manhattan distance
-        manhattan_distance = abs(snake[0][0] - food[0]) + abs(snake[0][1] - food[1])
-
-        # Display BFS algorithm info
-        font = pygame.font.Font(None, 24)
-        algorithm_info = font.render(f'   BFS Algorithm', True, WHITE)
-        screen.blit(algorithm_info, (10, 20))
-
-        # Display Manhattan distance
-        distance_text = font.render(f'   Manhattan Distance: {manhattan_distance}', True, WHITE)
-        screen.blit(distance_text, (10, 40))
+        dx, dy = next_position[0] - snake[0][0], next_position[1] - snake[0][1]  # Calculate the direction
 
-        # Display Total Path Length
-        path_length_text = font.render(f'   Total Path Length: {total_path_length}', True, WHITE)
-        screen.blit(path_length_text, (10, 60))
-    
-    # Display the information when approaching the fourth food
-    if eaten_food_count == 3:
+        # Move snake; keep the free-space tracker in step with the head and tail
+        tail, length = snake[-1], len(snake)
+        env.step((dx, dy))
+        if env.outcome != "dead":
+            if len(snake) == length:
+                free_space.release(tail)
+            free_space.claim(snake[0])
+
+        # The length of the path the snake has moved along
+        total_path_length = env.steps
+
+        # Check which food the snake's head has reached; the unstaged modes keep their planner
+        if A_STAR_ALGORITHM not in UNSTAGED_MODES:
+            if env.last_eaten == 1 and env.eaten == 2:
+                search_algorithm = "DFS"  # Display DFS algorithm info for the second food
+            elif env.last_eaten == 2 and env.eaten == 3:
+                search_algorithm = "BFS"  # Display BFS algorithm info for the third food
+
+    # Draw everything, with the information for the food being approached
+    lines = ()
+    if env.eaten < len(STAGE_NAMES) and env.foods[0] is not None:
         # Calculate the Manhattan distance
-        manhattan_distance = abs(snake[0][0] - food[0]) + abs(snake[0][1] - food[1])
-
-        # Display GBFS algorithm info
-        font = pygame.font.Font(None, 24)
-        algorithm_info = font.render(f'   GBFS Algorithm', True, WHITE)
-        screen.blit(algorithm_info, (10, 20))
-
-        # Display Manhattan distance
-        distance_text = font.render(f'   Manhattan Distance: {manhattan_distance}', True, WHITE)
-        screen.blit(distance_text, (10, 40))
-
-        # Display Total Path Length
-        path_length_text = font.render(f'   Total Path Length: {total_path_length}', True, WHITE)
-        screen.blit(path_length_text, (10, 60))
-
-    
-    
-    pygame.display.flip()
-    clock.tick(SNAKE_SPEED)
+        manhattan_distance = abs(snake[0][0] - env.foods[0][0]) + abs(snake[0][1] - env.foods[0][1])
+        stage_name = STAGE_NAMES[env.eaten] if A_STAR_ALGORITHM not in UNSTAGED_MODES else f"{A_STAR_ALGORITHM} Mode"
+        lines = (stage_name, f'Manhattan Distance: {manhattan_distance}', f'Total Path Length: {total_path_length}')
+    renderer.draw(lines)
+    renderer.tick(SNAKE_SPEED)
 
 # "Game Over" message
-font = pygame.font.Font(None, 36)
-if eaten_food_count:
-    game_over_text = font.render("      Game Over", True, RED)
-else:
-    game_over_text = font.render("      Game Over", True, RED)
-screen.blit(game_over_text, (WIDTH // 2 - 120, HEIGHT // 2 - 20))
-pygame.display.flip()
+renderer.game_over()
+
+if FOLLOW_PATHS:
+    print(f"Searches run: {path_follower.searches_run}, searches avoided: {path_follower.searches_avoided}")
+if search_recorder is not None:
+    search_recorder.print_summary()
 
 # Keep the game running even after game over
-while True:
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT: 
-            pygame.quit()
-            sys.exit()
\ No newline at end of file
+renderer.wait_for_quit()
@@ -0,0 +1,215 @@
+import numpy as np
+
+from snake_env import ACTIONS, DEATH_REWARD, FOOD_SLOTS, FOOD_TARGET, OBSTACLES, START, boundary_cells
+
+# Batched SnakeEnv: n games with the snake_env.py rules, stepped together.
+#
+# All state lives in NumPy arrays, so one step() is a fixed number of array
+# operations however many games there are. Cells are flat indices
+# y * width + x.
+#   occupancy  (n, height, width) uint8: FREE, FOOD, BODY or WALL per cell
+#   body       (n, ring) ring buffers of body cells, ring being the first
+#              power of two >= width * height so slots wrap with a mask;
+#              the head is at body[i, head[i]], the tail length[i] - 1
+#              slots behind. int16 where the board allows, to keep the
+#              buffers in cache.
+#   foods      (n, FOOD_SLOTS) food cells, NO_FOOD for an empty slot
+# The food, collision and boundary checks for a move are then one gather
+# from occupancy at the new head cells, one per game.
+
+# Occupancy values; anything from BODY up blocks the snake
+FREE = 0
+FOOD = 1
+BODY = 2
+WALL = 3
+
+# Outcome codes; OUTCOMES maps them to the SnakeEnv.outcome strings
+RUNNING, DEAD, WON, STUCK, TIMEOUT = range(5)
+OUTCOMES = (None, "dead", "won", "stuck", "timeout")
+
+NO_FOOD = -1
+FOOD_TRIES = 16  # Rounds of random food draws before listing the free cells of the games still left
+
+
+class BatchSnakeEnv:
+    def __init__(self, n, width=20, height=20, obstacles=OBSTACLES, food_blocked=(),
+                 food_target=FOOD_TARGET, max_steps=None, start=START):
+        self.n = n
+        self.width = width
+        self.height = height
+        self.area = width * height
+        self.food_target = food_target
+        self.max_steps = max_steps
+        self.start = start[1] * width + start[0]
+
+        # Board every game starts from; obstacles and boundary never change
+        self.walls = np.zeros(self.area, dtype=np.uint8)
+        for x, y in list(obstacles) + boundary_cells(width, height):
+            self.walls[y * width + x] = WALL
+        self.food_blocked = self.walls != FREE
+        for x, y in food_blocked:
+            self.food_blocked[y * width + x] = True
+
+        # Cells food may be drawn from: everything inside the boundary
+        self.interior = np.array([y * width + x for y in range(1, height - 1) for x in range(1, width - 1)],
+                                 dtype=np.int64)
+
+        # Column and row of every cell, for agents that need coordinates
+        self.xs, self.ys = np.divmod(np.arange(self.area), width)[::-1]
+
+        # Head move for each action index, as a flat cell offset and as (dx, dy)
+        self.moves = np.array([dy * width + dx for dx, dy in ACTIONS], dtype=np.int64)
+        self.move_x = np.array([dx for dx, _ in ACTIONS], dtype=np.int64)
+        self.move_y = np.array([dy for _, dy in ACTIONS], dtype=np.int64)
+
+        self.occupancy = np.empty((n, height, width), dtype=np.uint8)
+        self.cells = self.occupancy.reshape(n, self.area)  # Views of occupancy, per game and all in one row
+        self.flat_cells = self.occupancy.reshape(-1)
+        self.ring = 1 << (self.area - 1).bit_length()
+        self.body = np.zeros((n, self.ring), dtype=np.int16 if self.area <= np.iinfo(np.int16).max else np.int32)
+        self.flat_body = self.body.reshape(-1)
+        self.row_offsets = np.arange(n, dtype=np.int64) * self.area  # Start of each game in flat_cells
+        self.ring_offsets = np.arange(n, dtype=np.int64) * self.ring  # and in flat_body
+        self.head = np.zeros(n, dtype=np.int64)
+        self.heads = np.zeros(n, dtype=np.int64)  # Head cell of every game
+        self.length = np.zeros(n, dtype=np.int64)
+        self.foods = np.full((n, FOOD_SLOTS), NO_FOOD, dtype=np.int64)
+        self.eaten = np.zeros(n, dtype=np.int64)
+        self.steps = np.zeros(n, dtype=np.int64)
+        self.outcome = np.zeros(n, dtype=np.int8)
+        self.rng = np.random.default_rng()
+        self.reset()
+
+    # Start new games in rows (all of them by default). A seed restarts
+    # the batch's random generator, so the same seed replays the same foods.
+    def reset(self, seed=None, rows=None):
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
+        rows = np.arange(self.n) if rows is None else np.asarray(rows, dtype=np.int64)
+        self.cells[rows] = self.walls
+        self.cells[rows, self.start] = BODY
+        self.body[rows, 0] = self.start
+        self.head[rows] = 0
+        self.heads[rows] = self.start
+        self.length[rows] = 1
+        self.foods[rows] = NO_FOOD
+        self.eaten[rows] = 0
+        self.steps[rows] = 0
+        self.outcome[rows] = RUNNING
+        self._place_food(rows, np.zeros(len(rows), dtype=np.int64))
+        self.outcome[rows[self.foods[rows, 0] == NO_FOOD]] = STUCK
+
+    @property
+    def done(self):
+        return self.outcome != RUNNING
+
+    # Move every running game's head by its action, an index into ACTIONS,
+    # or -1 for no move, which ends that game. Finished games ignore their
+    # action. Returns (rewards, done) arrays with SnakeEnv.step's values.
+    def step(self, actions):
+        actions = np.asarray(actions)
+        rewards = np.zeros(self.n, dtype=np.int64)
+        cells = self.flat_cells
+        body = self.flat_body
+
+        running = self.outcome == RUNNING
+        rows = np.flatnonzero(running)
+        action = actions[rows]
+        no_move = action < 0
+        if no_move.any():
+            self.outcome[rows[no_move]] = STUCK
+            running[rows[no_move]] = False
+            rows, action = rows[~no_move], action[~no_move]
+        self.steps += running
+
+        # Everything below indexes the flat views at row * area + cell and
+        # row * ring + slot
+        base = rows * self.area
+        ring_base = rows * self.ring
+        mask = self.ring - 1
+        head = self.head[rows]
+        length = self.length[rows]
+        new_head = self.heads[rows] + self.moves[action]
+        new_cell = base + new_head
+        target = cells[new_cell]
+
+        # Which food, if any, the new head lands on. A FOOD cell holds
+        # exactly one of the game's foods, so the matching slot is the
+        # only True in its row. A head on food cannot die, so the fed
+        # games are kept by row and need no filtering below.
+        fed = np.flatnonzero(target == FOOD)
+        fed_rows = rows[fed]
+        slot = (self.foods[fed_rows] == new_head[fed, None]).argmax(1)
+
+        # Only the first food grows the snake; every other move frees the
+        # tail first, so the head may follow it into its cell
+        moving = np.ones(len(rows), dtype=bool)
+        moving[fed[slot == 0]] = False
+        tail = body[ring_base + ((head - length + 1) & mask)]
+        cells[(base + tail)[moving]] = FREE
+        length -= moving
+        dead = (target == WALL) | ((target == BODY) & ~(moving & (tail == new_head)))
+
+        if dead.any():
+            self.outcome[rows[dead]] = DEAD
+            rewards[rows[dead]] = DEATH_REWARD
+            alive = ~dead
+            rows, ring_base, head, length, new_head, new_cell = rows[alive], ring_base[alive], head[alive], \
+                length[alive], new_head[alive], new_cell[alive]
+        head = (head + 1) & mask
+        self.head[rows] = head
+        self.heads[rows] = new_head
+        self.length[rows] = length + 1
+        body[ring_base + head] = new_head
+        cells[new_cell] = BODY
+
+        if len(fed_rows):
+            rows = fed_rows
+            rewards[rows] = 1
+            eaten = self.eaten[rows] + 1
+            self.eaten[rows] = eaten
+
+            # Eaten foods come back, except the last slot's
+            last = slot == FOOD_SLOTS - 1
+            self.foods[rows[last], FOOD_SLOTS - 1] = NO_FOOD
+            self._place_food(rows[~last], slot[~last])
+
+            # The i-th food eaten brings out food slot i
+            new_slot = np.minimum(eaten, FOOD_SLOTS - 1)
+            opens = (eaten < FOOD_SLOTS) & (self.foods[rows, new_slot] == NO_FOOD)
+            self._place_food(rows[opens], new_slot[opens])
+
+            self.outcome[rows[eaten >= self.food_target]] = WON
+            full = (self.outcome[rows] == RUNNING) & (self.foods[rows, 0] == NO_FOOD)
+            self.outcome[rows[full]] = STUCK
+
+        if self.max_steps is not None:
+            self.outcome[(self.outcome == RUNNING) & (self.steps >= self.max_steps)] = TIMEOUT
+        return rewards, self.outcome != RUNNING
+
+    # Put a food in each game in rows, in the matching entry of slots, on a
+    # random free cell inside the boundary, off the body and the other
+    # foods, or NO_FOOD if the board has no such cell
+    def _place_food(self, rows, slots):
+        rng = self.rng
+        for _ in range(FOOD_TRIES):
+            if not len(rows):
+                return
+            food = self.interior[rng.integers(len(self.interior), size=len(rows))]
+            ok = (self.flat_cells[rows * self.area + food] == FREE) & ~self.food_blocked[food]
+            self._put_food(rows[ok], slots[ok], food[ok])
+            rows, slots = rows[~ok], slots[~ok]
+
+        if not len(rows):
+            return
+        # The games left take their free cell with the highest random
+        # priority, which is a uniform pick among the free cells
+        free = (self.cells[rows] == FREE) & ~self.food_blocked
+        food = np.where(free, rng.random(free.shape), -1.0).argmax(1)
+        ok = free[np.arange(len(rows)), food]
+        self._put_food(rows[ok], slots[ok], food[ok])
+        self.foods[rows[~ok], slots[~ok]] = NO_FOOD
+
+    def _put_food(self, rows, slots, food):
+        self.foods[rows, slots] = food
+        self.flat_cells[rows * self.area + food] = FOOD
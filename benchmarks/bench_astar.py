@@ -0,0 +1,41 @@
+import sys
+
+from bench_utils import random_grid, timed
+from grid_engine import a_star_bucket_search, a_star_indexed_search, a_star_search
+
+# Expansions per second for A* with the lazy-deletion heapq open list
+# (a_star_search), the IndexedHeap decrease-key open list
+# (a_star_indexed_search) and the bucket queue (a_star_bucket_search).
+#
+# Usage: python benchmarks/bench_astar.py [size ...] [--density D]
+
+DEFAULT_SIZES = [20, 200, 2000]
+DEFAULT_DENSITY = 0.2
+
+
+def main(argv):
+    density = DEFAULT_DENSITY
+    if "--density" in argv:
+        i = argv.index("--density")
+        density = float(argv[i + 1])
+        del argv[i:i + 2]
+    sizes = [int(arg) for arg in argv] or DEFAULT_SIZES
+
+    print(f"{'size':>6} {'search':<22} {'path':>6} {'expanded':>10} {'seconds':>9} {'exp/s':>10}")
+    for size in sizes:
+        grid = random_grid(size, size, density)
+        goal = (size - 1, size - 1)
+        # Small maps finish too fast to time once, so repeat them
+        repeats = max(1, 40000 // (size * size))
+        for search in (a_star_search, a_star_indexed_search, a_star_bucket_search):
+            stats = {}
+            path, elapsed = timed(lambda: [search(grid, (0, 0), goal, stats) for _ in range(repeats)][-1])
+            elapsed /= repeats
+            path_length = len(path) if path is not None else "-"
+            rate = stats["expanded"] / elapsed if elapsed else 0
+            print(f"{size:>6} {search.__name__:<22} {path_length:>6} {stats['expanded']:>10} "
+                  f"{elapsed:>9.4f} {rate:>10.0f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
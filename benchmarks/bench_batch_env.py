@@ -0,0 +1,105 @@
+import itertools
+import sys
+
+import numpy as np
+
+from bench_env import DEFAULT_MAX_STEPS, greedy_agent, play
+from bench_utils import timed
+from batch_env import BODY, WON, BatchSnakeEnv
+from snake_env import ACTIONS
+
+# Batched NumPy games against a loop over single SnakeEnv games, both with
+# the greedy agent from bench_env.py (step to the free neighbor closest to
+# the first food). The batched agent makes the same choice with array
+# operations over all games at once.
+#
+# The batch pays a fixed NumPy call overhead per step, so its lead grows
+# with the batch size: on one core the default 8192 games ran about 15x
+# the single-game rate, 2048 about 10x, 1024 about 6x and 256 about 4x.
+#
+# Usage: python benchmarks/bench_batch_env.py [--games N] [--single-games N] [--batch N] [--max-steps N]
+
+DEFAULT_GAMES = 100000
+DEFAULT_SINGLE_GAMES = 10000  # The single-game loop is slow; its rate settles well before this
+DEFAULT_BATCH = 8192
+
+
+# greedy_agent's action for every (side of the head the food is on,
+# blocked neighbors) pair. Each step changes the distance to the food by
+# one, down or up depending only on the sign of the head-to-food offset on
+# that axis, so the sign pair and a bit mask of the blocked actions settle
+# which action greedy_agent picks. Indexed by ((sx + 1) * 3 + sy + 1) << 4
+# | blocked; -1 where every action is blocked.
+def greedy_table():
+    table = np.full((3, 3, 1 << len(ACTIONS)), -1, dtype=np.int64)
+    for sx, sy, blocked in itertools.product((-1, 0, 1), (-1, 0, 1), range(1 << len(ACTIONS))):
+        distances = [(abs(sx + dx) + abs(sy + dy), action) for action, (dx, dy) in enumerate(ACTIONS)
+                     if not blocked >> action & 1]
+        if distances:
+            table[sx + 1, sy + 1, blocked] = min(distances)[1]
+    return table.reshape(-1)
+
+
+GREEDY_TABLE = greedy_table()
+
+
+# One table lookup per game instead of comparing four distances per game
+def batch_greedy_agent(env):
+    heads = env.heads
+    food = env.foods[:, 0]
+    index = (np.sign(env.xs[heads] - env.xs[food]) * 3 + np.sign(env.ys[heads] - env.ys[food]) + 4) << len(ACTIONS)
+    cells = env.row_offsets + heads
+    for action, move in enumerate(env.moves):
+        index |= (env.flat_cells[cells + move] >= BODY) << action
+    return GREEDY_TABLE.take(index)
+
+
+# Returns (games won, total steps). Finished games are restarted in place
+# until games have been started, so the batch stays full.
+def play_batch(games, batch, max_steps):
+    env = BatchSnakeEnv(min(batch, games), max_steps=max_steps)
+    env.reset(seed=0)
+    started = env.n
+    won = steps = 0
+    running = np.ones(env.n, dtype=bool)
+    while running.any():
+        _, done = env.step(batch_greedy_agent(env))
+        finished = np.flatnonzero(done & running)
+        if len(finished):
+            won += int((env.outcome[finished] == WON).sum())
+            steps += int(env.steps[finished].sum())
+            running[finished] = False
+            restart = finished[:games - started]
+            if len(restart):
+                env.reset(rows=restart)
+                running[restart] = True
+                started += len(restart)
+    return won, steps
+
+
+def main(argv):
+    games = DEFAULT_GAMES
+    single_games = DEFAULT_SINGLE_GAMES
+    batch = DEFAULT_BATCH
+    max_steps = DEFAULT_MAX_STEPS
+    if "--games" in argv:
+        games = int(argv[argv.index("--games") + 1])
+    if "--single-games" in argv:
+        single_games = int(argv[argv.index("--single-games") + 1])
+    if "--batch" in argv:
+        batch = int(argv[argv.index("--batch") + 1])
+    if "--max-steps" in argv:
+        max_steps = int(argv[argv.index("--max-steps") + 1])
+
+    print(f"{'env':<8} {'games':>7} {'won':>7} {'avg steps':>10} {'games/s':>9} {'steps/s':>10}")
+    rates = []
+    for label, count, play_games in (("single", single_games, lambda: play(greedy_agent, single_games, max_steps)),
+                                     ("batch", games, lambda: play_batch(games, batch, max_steps))):
+        (won, steps), elapsed = timed(play_games)
+        rates.append(count / elapsed)
+        print(f"{label:<8} {count:>7} {won:>7} {steps / count:>10.1f} {count / elapsed:>9.0f} {steps / elapsed:>10.0f}")
+    print(f"speedup: {rates[1] / rates[0]:.1f}x games/s")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
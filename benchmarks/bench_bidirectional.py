@@ -0,0 +1,40 @@
+import sys
+
+from bench_utils import random_grid, timed
+from grid_engine import a_star_search, bfs_search, bidirectional_a_star_search, bidirectional_bfs_search
+
+# Unidirectional against bidirectional BFS and A* with the food in the far
+# corner of the map.
+#
+# Usage: python benchmarks/bench_bidirectional.py [size ...] [--density D]
+
+DEFAULT_SIZES = [50, 200, 1000]
+DEFAULT_DENSITY = 0.2
+PAIRS = [
+    (bfs_search, bidirectional_bfs_search),
+    (a_star_search, bidirectional_a_star_search),
+]
+
+
+def main(argv):
+    density = DEFAULT_DENSITY
+    if "--density" in argv:
+        i = argv.index("--density")
+        density = float(argv[i + 1])
+        del argv[i:i + 2]
+    sizes = [int(arg) for arg in argv] or DEFAULT_SIZES
+
+    print(f"{'size':>6} {'search':<30} {'path':>6} {'expanded':>10} {'seconds':>9}")
+    for size in sizes:
+        grid = random_grid(size, size, density)
+        goal = (size - 1, size - 1)
+        for pair in PAIRS:
+            for search in pair:
+                stats = {}
+                path, elapsed = timed(search, grid, (0, 0), goal, stats)
+                path_length = len(path) if path is not None else "-"
+                print(f"{size:>6} {search.__name__:<30} {path_length:>6} {stats['expanded']:>10} {elapsed:>9.4f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
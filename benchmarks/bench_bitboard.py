@@ -0,0 +1,42 @@
+import random
+import sys
+
+from bench_utils import SNAKE_TILE, timed
+from bitboard import evaluate_states
+from snake_env import OBSTACLES
+
+# Board states per second scored by bitboard.evaluate_states on the
+# Snakefinal.py arena: distance from head to food plus reachable area.
+#
+# Usage: python benchmarks/bench_bitboard.py [states]
+
+DEFAULT_STATES = 20000
+SNAKE_LENGTH = 8
+
+
+def random_state(rng, blocked):
+    # A straight snake lying left of a random head, plus a random food
+    while True:
+        x, y = rng.randint(SNAKE_LENGTH, SNAKE_TILE - 2), rng.randint(1, SNAKE_TILE - 2)
+        snake = [(x - i, y) for i in range(SNAKE_LENGTH)]
+        food = (rng.randint(1, SNAKE_TILE - 2), rng.randint(1, SNAKE_TILE - 2))
+        if not blocked.intersection(snake) and food not in blocked and food not in snake:
+            return snake, food
+
+
+def main(argv):
+    count = int(argv[0]) if argv else DEFAULT_STATES
+    size = SNAKE_TILE
+    boundary = [(x, 0) for x in range(size)] + [(x, size - 1) for x in range(size)] + \
+               [(0, y) for y in range(1, size - 1)] + [(size - 1, y) for y in range(1, size - 1)]
+    rng = random.Random(0)
+    blocked = set(OBSTACLES) | set(boundary)
+    states = [random_state(rng, blocked) for _ in range(count)]
+
+    results, elapsed = timed(evaluate_states, size, size, OBSTACLES, boundary, states)
+    reachable = sum(1 for distance, _ in results if distance >= 0)
+    print(f"{count} states in {elapsed:.3f}s: {count / elapsed:.0f} states/s, food reachable in {reachable}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,60 @@
+import sys
+import time
+
+from bench_utils import tiled_snake_grid
+from dstar_lite import DStarLite
+from grid_engine import a_star_search
+
+# Per-tick planning cost of D* Lite repairs against A* from scratch while a
+# snake of fixed length walks to a far food on the tiled Snakefinal.py map.
+#
+# Usage: python benchmarks/bench_dstar.py [tiles ...]
+
+DEFAULT_TILES = [1, 5, 20]
+SNAKE_LENGTH = 10
+
+
+def main(argv):
+    tile_counts = [int(arg) for arg in argv] or DEFAULT_TILES
+
+    print(f"{'map':>10} {'ticks':>6} {'A* ms/tick':>11} {'D* Lite ms/tick':>16} {'D* first plan ms':>17}")
+    for tiles in tile_counts:
+        grid = tiled_snake_grid(tiles)
+        start, food = (1, 1), (grid.width - 2, grid.height - 2)
+        snake = [start]
+
+        started = time.perf_counter()
+        planner = DStarLite(grid, start, food)
+        planner.replan()
+        first_plan = time.perf_counter() - started
+
+        a_star_time = d_star_time = 0.0
+        ticks = 0
+        while snake[0] != food:
+            # The body blocks A* too, through the shared grid
+            for pos in snake[1:]:
+                grid.set_blocked(pos, True)
+            started = time.perf_counter()
+            path = a_star_search(grid, snake[0], food)
+            a_star_time += time.perf_counter() - started
+            for pos in snake[1:]:
+                grid.set_blocked(pos, False)
+
+            started = time.perf_counter()
+            planner.follow_snake(snake)
+            planner.replan()
+            step = planner.next_step()
+            d_star_time += time.perf_counter() - started
+
+            if step is None or path is None or len(path) != len(planner.path()):
+                print("plans disagree", tiles, ticks)
+                return
+            snake = [step] + snake[:SNAKE_LENGTH - 1]
+            ticks += 1
+
+        print(f"{grid.width:>4}x{grid.height:<5} {ticks:>6} {a_star_time / ticks * 1000:>11.3f} "
+              f"{d_star_time / ticks * 1000:>16.3f} {first_plan * 1000:>17.2f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
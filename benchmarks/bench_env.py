@@ -0,0 +1,66 @@
+import random
+import sys
+
+from bench_utils import timed
+from snake_env import ACTIONS, SnakeEnv
+
+# Headless games per second on the Snakefinal.py arena, no pygame and no
+# frame limit. The random agent picks any action; the greedy agent steps
+# to the free neighbor closest to the first food.
+#
+# Usage: python benchmarks/bench_env.py [--games N] [--max-steps N]
+
+DEFAULT_GAMES = 20000
+DEFAULT_MAX_STEPS = 500
+
+
+def random_agent(env, rng):
+    return rng.randrange(4)
+
+
+def greedy_agent(env, rng):
+    head = env.snake[0]
+    food = env.foods[0]
+    best = None
+    best_distance = None
+    for action, (dx, dy) in enumerate(ACTIONS):
+        step = (head[0] + dx, head[1] + dy)
+        if step in env.body or step in env.walls:
+            continue
+        distance = abs(step[0] - food[0]) + abs(step[1] - food[1])
+        if best is None or distance < best_distance:
+            best, best_distance = action, distance
+    return best
+
+
+# Returns (games won, total steps)
+def play(agent, games, max_steps):
+    env = SnakeEnv(max_steps=max_steps)
+    rng = random.Random(0)
+    won = steps = 0
+    for seed in range(games):
+        env.reset(seed)
+        done = env.done
+        while not done:
+            _, done = env.step(agent(env, rng))
+        won += env.outcome == "won"
+        steps += env.steps
+    return won, steps
+
+
+def main(argv):
+    games = DEFAULT_GAMES
+    max_steps = DEFAULT_MAX_STEPS
+    if "--games" in argv:
+        games = int(argv[argv.index("--games") + 1])
+    if "--max-steps" in argv:
+        max_steps = int(argv[argv.index("--max-steps") + 1])
+
+    print(f"{'agent':<8} {'games':>7} {'won':>7} {'avg steps':>10} {'games/s':>9} {'steps/s':>10}")
+    for label, agent in (("random", random_agent), ("greedy", greedy_agent)):
+        (won, steps), elapsed = timed(play, agent, games, max_steps)
+        print(f"{label:<8} {games:>7} {won:>7} {steps / games:>10.1f} {games / elapsed:>9.0f} {steps / elapsed:>10.0f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
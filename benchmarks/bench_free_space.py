@@ -0,0 +1,89 @@
+import random
+import sys
+import time
+from collections import deque
+
+from bench_utils import random_grid, tiled_snake_grid
+from free_space import FreeSpaceTracker
+
+# Per-tick cost of the survivability check: the incremental union-find
+# tracker against a flood fill from every candidate move. The snake wanders
+# at random, growing every few ticks, and both checks score the same moves.
+#
+# Usage: python benchmarks/bench_free_space.py [--ticks N]
+
+DEFAULT_TICKS = 2000
+GROW_EVERY = 4
+
+MOVES = ((0, 1), (0, -1), (1, 0), (-1, 0))
+
+
+# Free cells reachable from start, by BFS over the tracker's occupancy
+def flood_fill(cells, offsets, start):
+    if cells[start]:
+        return 0
+    seen = {start}
+    queue = deque([start])
+    while queue:
+        current = queue.popleft()
+        for offset in offsets:
+            neighbor = current + offset
+            if not cells[neighbor] and neighbor not in seen:
+                seen.add(neighbor)
+                queue.append(neighbor)
+    return len(seen)
+
+
+def maps():
+    yield "snake 20x20", tiled_snake_grid(1)
+    yield "snake 100x100", tiled_snake_grid(5)
+    yield "maze 300x300 10%", random_grid(300, 300, 0.1)
+
+
+def main(argv):
+    ticks = DEFAULT_TICKS
+    if "--ticks" in argv:
+        ticks = int(argv[argv.index("--ticks") + 1])
+
+    print(f"{'map':<18} {'ticks':>6} {'tracker us':>11} {'flood us':>10} {'rebuilds':>9} {'mismatches':>11}")
+    for name, grid in maps():
+        rng = random.Random(0)
+        snake = [(1, 1)]
+        tracker = FreeSpaceTracker(grid, snake)
+        tracker_time = flood_time = 0.0
+        mismatches = 0
+        played = 0
+
+        for tick in range(ticks):
+            head = snake[0]
+            candidates = [(head[0] + dx, head[1] + dy) for dx, dy in MOVES]
+            candidates = [step for step in candidates if not grid.is_blocked(step) and step not in snake[:-1]]
+            if not candidates:
+                break
+
+            start = time.perf_counter()
+            sizes = [tracker.component_size(step) for step in candidates]
+            tracker_time += time.perf_counter() - start
+
+            start = time.perf_counter()
+            flooded = [flood_fill(tracker.cells, grid.offsets, grid.index(step)) for step in candidates]
+            flood_time += time.perf_counter() - start
+
+            mismatches += sum(1 for size, exact in zip(sizes, flooded) if exact and size != exact)
+
+            # Roomiest move, ties broken at random, so the walk lasts
+            step = max(zip(sizes, [rng.random() for _ in candidates], candidates))[2]
+            start = time.perf_counter()
+            if tick % GROW_EVERY:
+                tracker.release(snake.pop())
+            tracker.claim(step)
+            tracker_time += time.perf_counter() - start
+            snake.insert(0, step)
+            played += 1
+
+        print(f"{name:<18} {played:>6} {tracker_time / played * 1e6:>11.1f} {flood_time / played * 1e6:>10.1f} "
+              f"{tracker.rebuilds:>9} {mismatches:>11}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
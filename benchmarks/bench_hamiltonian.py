@@ -0,0 +1,99 @@
+import random
+import sys
+import time
+
+from bench_utils import SNAKE_TILE
+from grid_engine import Grid, a_star_search
+from hamiltonian import HamiltonianCycle
+from snake_env import OBSTACLES
+
+# Full headless games on the Snakefinal.py arena: the Hamiltonian cycle
+# agent against A* replanned every tick with the body as walls. Food only
+# appears on cycle cells so both agents chase the same targets.
+#
+# Usage: python benchmarks/bench_hamiltonian.py [--games N] [--max-ticks N]
+
+DEFAULT_GAMES = 5
+DEFAULT_MAX_TICKS = 50000
+
+BOUNDARY = [(x, 0) for x in range(SNAKE_TILE)] + [(x, SNAKE_TILE - 1) for x in range(SNAKE_TILE)] + \
+           [(0, y) for y in range(1, SNAKE_TILE - 1)] + [(SNAKE_TILE - 1, y) for y in range(1, SNAKE_TILE - 1)]
+
+
+def cycle_agent(grid, cycle):
+    return lambda snake, food: cycle.next_step(snake, food)
+
+
+def a_star_agent(grid, cycle):
+    def step(snake, food):
+        for pos in snake[1:]:
+            grid.set_blocked(pos, True)
+        path = a_star_search(grid, snake[0], food)
+        for pos in snake[1:]:
+            grid.set_blocked(pos, False)
+        return path[0] if path else None
+    return step
+
+
+# Returns (foods eaten, ticks, seconds spent choosing moves)
+def play(agent, cycle, seed, max_ticks):
+    rng = random.Random(seed)
+    cells = [cycle.grid.position(cell) for cell in cycle.order]
+    snake = [(5, 5)]
+    eaten = ticks = 0
+    thinking = 0.0
+
+    def new_food():
+        body = set(snake)
+        free = [pos for pos in cells if pos not in body]
+        return rng.choice(free) if free else None
+
+    food = new_food()
+    while food is not None and ticks < max_ticks:
+        start = time.perf_counter()
+        step = agent(snake, food)
+        thinking += time.perf_counter() - start
+        ticks += 1
+        if step is None or cycle.grid.is_blocked(step):
+            break
+        if step == food:
+            eaten += 1
+            snake.insert(0, step)
+            food = new_food()
+            continue
+        snake.pop()
+        if step in snake:
+            break
+        snake.insert(0, step)
+    return eaten, ticks, thinking
+
+
+def main(argv):
+    games = DEFAULT_GAMES
+    max_ticks = DEFAULT_MAX_TICKS
+    if "--games" in argv:
+        games = int(argv[argv.index("--games") + 1])
+    if "--max-ticks" in argv:
+        max_ticks = int(argv[argv.index("--max-ticks") + 1])
+
+    grid = Grid(SNAKE_TILE, SNAKE_TILE, OBSTACLES + BOUNDARY)
+    cycle = HamiltonianCycle(grid)
+    print(f"cycle covers {cycle.length} cells, {len(cycle.uncovered)} free cells left out")
+
+    print(f"{'agent':<12} {'avg eaten':>10} {'full boards':>12} {'avg ticks':>10} {'us/tick':>8}")
+    for label, make_agent in (("Hamiltonian", cycle_agent), ("A*", a_star_agent)):
+        agent = make_agent(grid, cycle)
+        eaten_total = ticks_total = full = 0
+        thinking_total = 0.0
+        for seed in range(games):
+            eaten, ticks, thinking = play(agent, cycle, seed, max_ticks)
+            eaten_total += eaten
+            ticks_total += ticks
+            thinking_total += thinking
+            full += eaten == cycle.length - 1
+        print(f"{label:<12} {eaten_total / games:>10.1f} {full:>12} {ticks_total / games:>10.0f} "
+              f"{thinking_total / ticks_total * 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
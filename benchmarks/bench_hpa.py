@@ -0,0 +1,65 @@
+import random
+import sys
+
+from bench_utils import random_grid, tiled_snake_grid, timed
+from grid_engine import a_star_search
+from hpa_star import HierarchicalMap
+
+# HPA* queries against flat A* on large maps, plus the cost of the one-off
+# abstraction build and of an incremental rebuild after a wall changes.
+#
+# Usage: python benchmarks/bench_hpa.py [--sector N] [--queries N]
+
+DEFAULT_SECTOR = 16
+DEFAULT_QUERIES = 20
+
+
+def maps():
+    yield "snake 400x400", tiled_snake_grid(20)
+    yield "maze 300x300 20%", random_grid(300, 300, 0.2)
+    yield "maze 600x600 20%", random_grid(600, 600, 0.2)
+    yield "maze 600x600 30%", random_grid(600, 600, 0.3)
+
+
+def main(argv):
+    sector = DEFAULT_SECTOR
+    queries = DEFAULT_QUERIES
+    if "--sector" in argv:
+        sector = int(argv[argv.index("--sector") + 1])
+    if "--queries" in argv:
+        queries = int(argv[argv.index("--queries") + 1])
+
+    print(f"{'map':<18} {'build ms':>9} {'A* ms':>8} {'HPA* ms':>8} {'length':>7} {'rebuild ms':>11}")
+    for name, grid in maps():
+        hierarchy, build = timed(HierarchicalMap, grid, sector)
+        rng = random.Random(0)
+        free = [(x, y) for y in range(grid.height) for x in range(grid.width) if not grid.is_blocked((x, y))]
+
+        flat_time = hpa_time = 0
+        flat_length = hpa_length = 0
+        done = 0
+        while done < queries:
+            start, goal = rng.choice(free), rng.choice(free)
+            flat, seconds = timed(a_star_search, grid, start, goal)
+            if not flat:
+                continue
+            path, hpa_seconds = timed(hierarchy.find_path, start, goal)
+            flat_time += seconds
+            hpa_time += hpa_seconds
+            flat_length += len(flat)
+            hpa_length += len(path)
+            done += 1
+
+        # Toggle one cell and time the rebuild of the sectors around it
+        cell = rng.choice(free)
+        hierarchy.set_blocked(cell, True)
+        _, rebuild = timed(hierarchy.update)
+        hierarchy.set_blocked(cell, False)
+        hierarchy.update()
+
+        print(f"{name:<18} {build * 1000:>9.1f} {flat_time / queries * 1000:>8.2f} "
+              f"{hpa_time / queries * 1000:>8.2f} {hpa_length / flat_length:>7.3f} {rebuild * 1000:>11.2f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,44 @@
+import random
+import sys
+
+from bench_utils import tiled_snake_grid, timed
+from grid_engine import a_star_search, jump_point_search
+
+# Nodes expanded and wall time for Jump Point Search against plain A* on
+# maps built by tiling the Snakefinal.py obstacle pattern.
+#
+# Usage: python benchmarks/bench_jps.py [tiles ...] [--queries N]
+
+DEFAULT_TILES = [1, 5, 25, 50]
+DEFAULT_QUERIES = 20
+
+
+def main(argv):
+    queries = DEFAULT_QUERIES
+    if "--queries" in argv:
+        i = argv.index("--queries")
+        queries = int(argv[i + 1])
+        del argv[i:i + 2]
+    tile_counts = [int(arg) for arg in argv] or DEFAULT_TILES
+
+    print(f"{'map':>10} {'search':<18} {'avg path':>9} {'avg expanded':>13} {'avg ms':>9}")
+    for tiles in tile_counts:
+        grid = tiled_snake_grid(tiles)
+        rng = random.Random(tiles)
+        free = [(x, y) for y in range(grid.height) for x in range(grid.width) if not grid.is_blocked((x, y))]
+        pairs = [(rng.choice(free), rng.choice(free)) for _ in range(queries)]
+
+        for search in (a_star_search, jump_point_search):
+            total_path = total_expanded = total_time = 0
+            for start, goal in pairs:
+                stats = {}
+                path, elapsed = timed(search, grid, start, goal, stats)
+                total_path += len(path)
+                total_expanded += stats["expanded"]
+                total_time += elapsed
+            print(f"{grid.width:>4}x{grid.height:<5} {search.__name__:<18} {total_path / queries:>9.1f} "
+                  f"{total_expanded / queries:>13.1f} {total_time / queries * 1000:>9.2f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,64 @@
+import random
+import sys
+
+from bench_utils import random_grid, tiled_snake_grid, timed
+from grid_engine import a_star_search, greedy_best_first_search
+from landmarks import LandmarkHeuristic
+
+# Cells expanded by A* and GBFS with the Manhattan heuristic against the ALT
+# landmark heuristic, on the tiled Snakefinal.py map and on random mazes.
+#
+# Usage: python benchmarks/bench_landmarks.py [--landmarks K] [--queries N]
+
+DEFAULT_LANDMARKS = 4
+DEFAULT_QUERIES = 50
+
+
+# Start and goal on opposite sides of the L-shaped wall at x=5 / y=14
+WALL_QUERIES = [((8, 16), (8, 11)), ((7, 12), (7, 16)), ((3, 10), (8, 11)), ((9, 15), (9, 13))]
+
+
+# (name, grid, fixed queries or None for random ones)
+def maps():
+    yield "snake 20x20", tiled_snake_grid(1), None
+    yield "snake across wall", tiled_snake_grid(1), WALL_QUERIES
+    yield "snake 200x200", tiled_snake_grid(10), None
+    yield "maze 100x100 30%", random_grid(100, 100, 0.3), None
+    yield "maze 300x300 30%", random_grid(300, 300, 0.3), None
+
+
+def main(argv):
+    landmark_count = DEFAULT_LANDMARKS
+    queries = DEFAULT_QUERIES
+    if "--landmarks" in argv:
+        landmark_count = int(argv[argv.index("--landmarks") + 1])
+    if "--queries" in argv:
+        queries = int(argv[argv.index("--queries") + 1])
+
+    print(f"{'map':<18} {'search':<26} {'avg expanded':>13} {'avg ms':>8} {'setup ms':>9}")
+    for name, grid, pairs in maps():
+        landmarks, setup = timed(LandmarkHeuristic, grid, landmark_count)
+        if pairs is None:
+            rng = random.Random(0)
+            free = [(x, y) for y in range(grid.height) for x in range(grid.width) if not grid.is_blocked((x, y))]
+            pairs = [(rng.choice(free), rng.choice(free)) for _ in range(queries)]
+
+        runs = [
+            ("A* manhattan", a_star_search, {}),
+            ("A* landmarks", a_star_search, {"heuristic": landmarks}),
+            ("GBFS manhattan", greedy_best_first_search, {}),
+            ("GBFS landmarks", greedy_best_first_search, {"heuristic": landmarks}),
+        ]
+        for label, search, options in runs:
+            expanded = elapsed = 0
+            for start, goal in pairs:
+                stats = {}
+                _, seconds = timed(search, grid, start, goal, stats=stats, **options)
+                expanded += stats["expanded"]
+                elapsed += seconds
+            setup_ms = f"{setup * 1000:.1f}" if "heuristic" in options else ""
+            print(f"{name:<18} {label:<26} {expanded / len(pairs):>13.1f} {elapsed / len(pairs) * 1000:>8.2f} {setup_ms:>9}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
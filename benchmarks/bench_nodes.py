@@ -0,0 +1,142 @@
+import sys
+import tracemalloc
+from collections import deque
+
+from bench_utils import timed
+from maze_grid import MazeGrid
+
+# Memory per expanded cell for a BFS over an open grid: the old Node class
+# (a __dict__ per object, a fresh object from every get_neighbors call,
+# tuple keys because the objects cannot be compared) against the slotted,
+# pooled Node from maze_grid.py, checking walls on every call or reading
+# the grid's neighbor table.
+#
+# The neighbor table is built as the first search asks for it, so it pays
+# off from the second search over the same grid on; the second table times
+# a search over a grid that has already been searched once.
+#
+# Usage: python benchmarks/bench_nodes.py [--sizes 50,200,500]
+
+DEFAULT_SIZES = (50, 200, 500)
+
+
+# Node as maze_world.py, trial.py and maze_solving.py defined it before
+class LegacyNode:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        self.parent = None
+        self.g = 0
+        self.h = 0
+
+    def __lt__(self, other):
+        return (self.g + self.h) < (other.g + other.h)
+
+
+def legacy_neighbors(grid, node, width, height):
+    neighbors = []
+    if node.x > 0 and not grid[node.x - 1][node.y]:
+        neighbors.append(LegacyNode(node.x - 1, node.y))
+    if node.x < width - 1 and not grid[node.x + 1][node.y]:
+        neighbors.append(LegacyNode(node.x + 1, node.y))
+    if node.y > 0 and not grid[node.x][node.y - 1]:
+        neighbors.append(LegacyNode(node.x, node.y - 1))
+    if node.y < height - 1 and not grid[node.x][node.y + 1]:
+        neighbors.append(LegacyNode(node.x, node.y + 1))
+    return neighbors
+
+
+# get_neighbors as it was before MazeGrid kept a neighbor table
+def pooled_neighbors(grid, node):
+    neighbors = []
+    if node.x > 0 and not grid[node.x - 1][node.y]:
+        neighbors.append(grid.node(node.x - 1, node.y))
+    if node.x < grid.width - 1 and not grid[node.x + 1][node.y]:
+        neighbors.append(grid.node(node.x + 1, node.y))
+    if node.y > 0 and not grid[node.x][node.y - 1]:
+        neighbors.append(grid.node(node.x, node.y - 1))
+    if node.y < grid.height - 1 and not grid[node.x][node.y + 1]:
+        neighbors.append(grid.node(node.x, node.y + 1))
+    return neighbors
+
+
+def bfs_legacy(size):
+    grid = [[0] * size for _ in range(size)]
+    start = LegacyNode(0, 0)
+    came_from = {(0, 0): None}
+    queue = deque([start])
+    while queue:
+        current = queue.popleft()
+        for neighbor in legacy_neighbors(grid, current, size, size):
+            key = (neighbor.x, neighbor.y)
+            if key not in came_from:
+                came_from[key] = current
+                queue.append(neighbor)
+    return len(came_from)
+
+
+def bfs_pooled(size):
+    grid = MazeGrid(size, size)
+    start = grid.node(0, 0)
+    came_from = {start: None}
+    queue = deque([start])
+    while queue:
+        current = queue.popleft()
+        for neighbor in pooled_neighbors(grid, current):
+            if neighbor not in came_from:
+                came_from[neighbor] = current
+                queue.append(neighbor)
+    return len(came_from)
+
+
+def bfs_table(size):
+    return bfs_grid(MazeGrid(size, size), None)
+
+
+# BFS over an existing MazeGrid, with pooled_neighbors or, if neighbors is
+# None, the grid's neighbor table
+def bfs_grid(grid, neighbors):
+    start = grid.node(0, 0)
+    came_from = {start: None}
+    queue = deque([start])
+    while queue:
+        current = queue.popleft()
+        for neighbor in grid.neighbors(current) if neighbors is None else neighbors(grid, current):
+            if neighbor not in came_from:
+                came_from[neighbor] = current
+                queue.append(neighbor)
+    return len(came_from)
+
+
+# Returns (cells expanded, peak bytes traced, seconds)
+def measure(search, size):
+    tracemalloc.start()
+    expanded, elapsed = timed(search, size)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return expanded, peak, elapsed
+
+
+def main(argv):
+    sizes = DEFAULT_SIZES
+    if "--sizes" in argv:
+        sizes = [int(size) for size in argv[argv.index("--sizes") + 1].split(",")]
+
+    print(f"{'grid':<10} {'node':<8} {'expanded':>9} {'bytes/cell':>11} {'traced ms':>10}")
+    for size in sizes:
+        for label, search in (("legacy", bfs_legacy), ("pooled", bfs_pooled), ("table", bfs_table)):
+            expanded, peak, elapsed = measure(search, size)
+            print(f"{f'{size}x{size}':<10} {label:<8} {expanded:>9} {peak / expanded:>11.1f} {elapsed * 1000:>10.1f}")
+
+    print()
+    print(f"{'grid':<10} {'repeat search':<14} {'ms':>9}")
+    for size in sizes:
+        grid = MazeGrid(size, size)
+        bfs_grid(grid, None)
+        for label, neighbors in (("pooled", pooled_neighbors), ("table", None)):
+            _, elapsed = timed(bfs_grid, grid, neighbors)
+            print(f"{f'{size}x{size}':<10} {label:<14} {elapsed * 1000:>9.1f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,335 @@
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+
+from bench_utils import timed
+from grid_engine import WALL, Grid, a_star_search, bfs_search, dfs_search, greedy_best_first_search
+from maze_grid import MazeGrid
+import maze_world
+import trial
+
+# Benchmark suite for the search functions the game and the demos use: the
+# engine searches Snakefinal.py runs (grid_engine.py) and the Node-based
+# ones in maze_world.py and trial.py, swept over grid size, wall density
+# and start-goal distance.
+#
+# Walls come from generate_maze in maze_world.py with a fixed seed, so
+# every run searches the same maps. The start is a free cell on the
+# diagonal in a large open region; each distance is a fraction of the
+# farthest cell reachable from it, and the goal is the reachable cell
+# whose Manhattan distance is closest to that.
+#
+# Every case gets --warmup untimed calls (these also build MazeGrid's
+# neighbor table), then --repeats timed samples. Small cases are repeated
+# within a sample until it takes SAMPLE_SECONDS, and the per-call time
+# goes into the results, with every search's stats counts
+# (search_stats.COUNTS). The Node-based searches scan their open list on
+# every push, so they only run up to --node-max-size.
+#
+# Results go to --out as JSON and are compared against a baseline results
+# file, the committed benchmarks/search_baseline.json unless --baseline
+# names another or --no-baseline skips the check. Only the cases the
+# baseline also has are compared. A case fails if its path length or
+# expanded count changed, and the exit code is 1 if any case failed, so a
+# run can gate a change. Times depend on the machine and its load, so
+# they only warn: a case is reported as slower when its fastest sample
+# went past the baseline's by more than --tolerance plus the baseline's
+# own standard deviation. Refresh the baseline with
+# --out benchmarks/search_baseline.json --no-baseline.
+#
+# Usage: python benchmarks/bench_search.py [--sizes 20,200,2000]
+#        [--densities 0,0.1,0.2,0.3,0.4] [--distances 0.1,0.5,1]
+#        [--warmup N] [--repeats N] [--node-max-size N] [--seed N]
+#        [--out bench_search.json] [--baseline FILE | --no-baseline] [--tolerance F]
+
+DEFAULT_SIZES = (20, 200, 2000)
+DEFAULT_DENSITIES = (0.0, 0.1, 0.2, 0.3, 0.4)
+DEFAULT_DISTANCES = (0.1, 0.5, 1.0)
+DEFAULT_WARMUP = 1
+DEFAULT_REPEATS = 5
+DEFAULT_NODE_MAX_SIZE = 100
+DEFAULT_TOLERANCE = 0.25  # Growth of a case's fastest sample over the baseline's before it is reported
+DEFAULT_OUT = "bench_search.json"
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "search_baseline.json")
+SAMPLE_SECONDS = 0.2  # Shortest timed sample; faster calls are repeated within one
+
+ENGINE_SEARCHES = (
+    ("A*", a_star_search),
+    ("BFS", bfs_search),
+    ("DFS", dfs_search),
+    ("GBFS", greedy_best_first_search),
+)
+
+NODE_SEARCHES = {
+    "maze_world": (
+        ("A*", maze_world.astar_search),
+        ("BFS", maze_world.breadth_first_search),
+        ("DFS", maze_world.depth_first_search),
+        ("GBFS", maze_world.greedy_best_first_search),
+    ),
+    "trial": (
+        ("A*", trial.astar_search),
+        ("BFS", trial.breadth_first_search),
+        ("DFS", trial.depth_first_search),
+        ("GBFS", trial.greedy_best_first_search),
+    ),
+}
+
+
+# Columns of walls (0 or 1) with the width and height generate_maze reads
+class Walls(list):
+    def __init__(self, size):
+        super().__init__([0] * size for _ in range(size))
+        self.width = size
+        self.height = size
+
+
+def engine_grid(walls):
+    return Grid(walls.width, walls.height,
+                [(x, y) for x, column in enumerate(walls) for y, wall in enumerate(column) if wall])
+
+
+def maze_grid(walls):
+    grid = MazeGrid(walls.width, walls.height)
+    for x, column in enumerate(walls):
+        for y, wall in enumerate(column):
+            if wall:
+                grid[x][y] = 1
+    return grid
+
+
+# Cell indices reachable from index start, start first
+def reachable(grid, start, seen):
+    cells = grid.cells
+    offsets = grid.offsets
+    seen[start] = 1
+    region = [start]
+    for index in region:
+        for offset in offsets:
+            neighbor = index + offset
+            if cells[neighbor] != WALL and not seen[neighbor]:
+                seen[neighbor] = 1
+                region.append(neighbor)
+    return region
+
+
+# Start cell and the cells reachable from it: the free diagonal cell
+# nearest (0, 0) whose region holds a quarter of the free cells, or the
+# largest region seen on the diagonal if none does
+def open_region(grid):
+    free = grid.width * grid.height - grid.cells.count(WALL) + 2 * (grid.stride + grid.height)
+    seen = bytearray(grid.size)
+    best = []
+    for i in range(min(grid.width, grid.height)):
+        index = grid.index((i, i))
+        if grid.cells[index] == WALL or seen[index]:
+            continue
+        region = reachable(grid, index, seen)
+        if len(region) > len(best):
+            best = region
+        if 4 * len(best) >= free:
+            break
+    return best
+
+
+# Goal for each distance fraction: the reachable cell whose Manhattan
+# distance from the start is closest to that fraction of the farthest one
+def pick_goals(grid, region, fractions):
+    start_y, start_x = divmod(region[0], grid.stride)
+    distances = [abs(x - start_x) + abs(y - start_y) for y, x in (divmod(index, grid.stride) for index in region)]
+    farthest = max(distances)
+    goals = []
+    for fraction in fractions:
+        target = fraction * farthest
+        best = min(range(len(region)), key=lambda i: abs(distances[i] - target))
+        goals.append(grid.position(region[best]))
+    return goals
+
+
+# Time call(): warmup untimed calls, then repeats samples of calls each.
+# Returns (last result, calls per sample, per-call ns of each sample).
+def measure(call, warmup, repeats):
+    result = None
+    elapsed = 0
+    for _ in range(warmup):
+        result, elapsed = timed(call)
+    calls = max(1, int(SAMPLE_SECONDS / elapsed)) if elapsed else 1
+    samples = []
+    for _ in range(repeats):
+        begin = time.perf_counter_ns()
+        for _ in range(calls):
+            result = call()
+        samples.append((time.perf_counter_ns() - begin) / calls)
+    return result, calls, samples
+
+
+def summary(samples):
+    return {
+        "min_ns": min(samples),
+        "median_ns": statistics.median(samples),
+        "mean_ns": statistics.fmean(samples),
+        "stdev_ns": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    }
+
+
+# Yields one result per (map, goal, search)
+def run_cases(sizes, densities, fractions, warmup, repeats, node_max_size, seed):
+    for size in sizes:
+        for density in densities:
+            walls = Walls(size)
+            maze_world.generate_maze(walls, random.Random(seed), density)
+            grid = engine_grid(walls)
+            region = open_region(grid)
+            start = grid.position(region[0])
+            goals = pick_goals(grid, region, fractions)
+            nodes = maze_grid(walls) if size <= node_max_size else None
+
+            for fraction, goal in zip(fractions, goals):
+                case = {"size": size, "density": density, "distance_fraction": fraction,
+                        "start": list(start), "goal": list(goal),
+                        "distance": abs(goal[0] - start[0]) + abs(goal[1] - start[1])}
+
+                for algorithm, search in ENGINE_SEARCHES:
+                    stats = {}
+                    path, calls, samples = measure(lambda: search(grid, start, goal, stats=stats), warmup, repeats)
+                    yield dict(case, implementation="engine", algorithm=algorithm,
+                               path_length=len(path) if path is not None else None, **stats,
+                               calls=calls, samples_ns=samples, **summary(samples))
+
+                if nodes is None:
+                    continue
+                start_node = nodes.node(*start)
+                goal_node = nodes.node(*goal)
+                for implementation, searches in NODE_SEARCHES.items():
+                    for algorithm, search in searches:
+                        stats = {}
+                        path, calls, samples = measure(lambda: search(nodes, start_node, goal_node, stats=stats),
+                                                       warmup, repeats)
+                        # Some of these paths include the start, some do not; count moves
+                        path_length = len(path) - (bool(path) and path[0] is start_node) if path is not None else None
+                        yield dict(case, implementation=implementation, algorithm=algorithm, path_length=path_length,
+                                   **stats, calls=calls, samples_ns=samples, **summary(samples))
+
+
+def case_key(result):
+    return (result["implementation"], result["algorithm"], result["size"], result["density"],
+            result["distance_fraction"])
+
+
+# Compare results against the baseline file; returns (failed, slower) as
+# lists of (result, reason) pairs. failed holds the changed path lengths
+# and expanded counts, slower the cases whose fastest sample grew past
+# tolerance plus the baseline's spread.
+def compare(results, baseline_path, tolerance):
+    with open(baseline_path) as baseline_file:
+        baseline = json.load(baseline_file)
+    if baseline["meta"]["seed"] != results["meta"]["seed"]:
+        print(f"baseline was run with seed {baseline['meta']['seed']}; path and expanded checks are skipped")
+    if baseline["meta"]["python"] != results["meta"]["python"] or baseline["meta"]["machine"] != results["meta"]["machine"]:
+        print(f"baseline is from {baseline['meta']['python']} on {baseline['meta']['machine']}; times may not compare")
+    same_maps = baseline["meta"]["seed"] == results["meta"]["seed"]
+
+    base = {case_key(result): result for result in baseline["results"]}
+    failed = []
+    slower = []
+    ratios = []
+    for result in results["results"]:
+        old = base.get(case_key(result))
+        if old is None:
+            continue
+        ratio = result["min_ns"] / old["min_ns"] if old["min_ns"] else 1.0
+        ratios.append(ratio)
+        if result["min_ns"] > old["min_ns"] * (1 + tolerance) + old["stdev_ns"]:
+            slower.append((result, f"fastest sample {ratio:.2f}x baseline"))
+        if same_maps and (result["path_length"], result["expanded"]) != (old["path_length"], old["expanded"]):
+            failed.append((result, f"path/expanded {old['path_length']}/{old['expanded']} -> "
+                                   f"{result['path_length']}/{result['expanded']}"))
+    print(f"compared {len(ratios)} of {len(results['results'])} cases with {baseline_path}, "
+          f"{len(failed)} failed, {len(slower)} slower")
+    # Every case moving together points at the machine rather than the code
+    if ratios:
+        print(f"fastest sample vs baseline: geometric mean {statistics.geometric_mean(ratios):.2f}x, "
+              f"range {min(ratios):.2f}x-{max(ratios):.2f}x")
+    return failed, slower
+
+
+def main(argv):
+    sizes = DEFAULT_SIZES
+    densities = DEFAULT_DENSITIES
+    fractions = DEFAULT_DISTANCES
+    warmup = DEFAULT_WARMUP
+    repeats = DEFAULT_REPEATS
+    node_max_size = DEFAULT_NODE_MAX_SIZE
+    seed = 0
+    out = DEFAULT_OUT
+    baseline = DEFAULT_BASELINE
+    tolerance = DEFAULT_TOLERANCE
+    if "--sizes" in argv:
+        sizes = [int(size) for size in argv[argv.index("--sizes") + 1].split(",")]
+    if "--densities" in argv:
+        densities = [float(density) for density in argv[argv.index("--densities") + 1].split(",")]
+    if "--distances" in argv:
+        fractions = [float(fraction) for fraction in argv[argv.index("--distances") + 1].split(",")]
+    if "--warmup" in argv:
+        warmup = int(argv[argv.index("--warmup") + 1])
+    if "--repeats" in argv:
+        repeats = int(argv[argv.index("--repeats") + 1])
+    if "--node-max-size" in argv:
+        node_max_size = int(argv[argv.index("--node-max-size") + 1])
+    if "--seed" in argv:
+        seed = int(argv[argv.index("--seed") + 1])
+    if "--out" in argv:
+        out = argv[argv.index("--out") + 1]
+    if "--baseline" in argv:
+        baseline = argv[argv.index("--baseline") + 1]
+    if "--no-baseline" in argv:
+        baseline = None
+    if "--tolerance" in argv:
+        tolerance = float(argv[argv.index("--tolerance") + 1])
+    # The warmup call also sizes the samples
+    warmup = max(1, warmup)
+    repeats = max(1, repeats)
+
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": f"{platform.system()} {platform.machine()} {platform.processor()}".strip(),
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "seed": seed,
+            "warmup": warmup,
+            "repeats": repeats,
+            "sample_seconds": SAMPLE_SECONDS,
+        },
+        "results": [],
+    }
+
+    print(f"{'size':>5} {'walls':>6} {'dist':>5} {'search':<16} {'path':>7} {'expanded':>9} "
+          f"{'median us':>11} {'min us':>10} {'stdev %':>8}")
+    for result in run_cases(sizes, densities, fractions, warmup, repeats, node_max_size, seed):
+        results["results"].append(result)
+        label = f"{result['implementation']} {result['algorithm']}"
+        path_length = result["path_length"] if result["path_length"] is not None else "-"
+        spread = result["stdev_ns"] / result["mean_ns"] * 100 if result["mean_ns"] else 0
+        print(f"{result['size']:>5} {result['density']:>6.0%} {result['distance']:>5} {label:<16} {path_length:>7} "
+              f"{result['expanded']:>9} {result['median_ns'] / 1000:>11.1f} {result['min_ns'] / 1000:>10.1f} {spread:>8.1f}")
+
+    with open(out, "w") as out_file:
+        json.dump(results, out_file, indent=1)
+    print(f"{len(results['results'])} cases written to {out}")
+
+    if baseline is None:
+        return 0
+    failed, slower = compare(results, baseline, tolerance)
+    for label, cases in (("warning", slower), ("failed", failed)):
+        for result, reason in cases:
+            print(f"  {label}: {result['size']:>5} {result['density']:>6.0%} {result['distance']:>5} "
+                  f"{result['implementation']} {result['algorithm']}: {reason}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,41 @@
+import os
+import random
+import sys
+import time
+
+# Shared helpers for the benchmark scripts in this directory
+
+# Make the game modules in the repository root importable
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grid_engine import Grid
+from snake_env import OBSTACLES
+
+
+# Same approach as generate_maze in maze_world.py, but seeded and with the
+# start and goal corners always left open
+def random_grid(width, height, density, seed=0):
+    rng = random.Random(seed)
+    obstacles = [(x, y) for y in range(height) for x in range(width) if rng.random() < density]
+    grid = Grid(width, height, obstacles)
+    grid.set_blocked((0, 0), False)
+    grid.set_blocked((width - 1, height - 1), False)
+    return grid
+
+
+SNAKE_TILE = 20  # Side of the Snakefinal.py arena, whose obstacle pattern is snake_env.OBSTACLES
+
+
+# The Snakefinal.py obstacle pattern repeated tiles x tiles times
+def tiled_snake_grid(tiles):
+    size = SNAKE_TILE * tiles
+    obstacles = [(tx * SNAKE_TILE + x, ty * SNAKE_TILE + y)
+                 for ty in range(tiles) for tx in range(tiles) for x, y in OBSTACLES]
+    return Grid(size, size, obstacles)
+
+
+# Run fn(*args) and return (result, elapsed seconds)
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
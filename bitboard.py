@@ -0,0 +1,129 @@
+from grid_engine import _record
+
+# Bitboard backend for headless board analysis.
+#
+# Obstacles, boundary and snake body are each one Python int with bit
+# y * stride + x set for every occupied cell. Each row gets one spare guard
+# bit (stride = width + 1) that is never free, so shifting by 1 cannot wrap
+# a cell into the next row. A BFS level is then four shifts, an OR and an
+# AND over the whole board, however large the frontier is.
+
+
+class BitBoard:
+    def __init__(self, width, height, obstacles=(), boundary=(), snake=()):
+        self.width = width
+        self.height = height
+        self.stride = width + 1
+
+        row = (1 << width) - 1
+        self.playable = 0
+        for y in range(height):
+            self.playable |= row << (y * self.stride)
+
+        self.obstacles = self.pack(obstacles)
+        self.boundary = self.pack(boundary)
+        self.body = self.pack(snake)
+        self.snake = list(snake)
+
+    def bit(self, pos):
+        return 1 << (pos[1] * self.stride + pos[0])
+
+    def pack(self, positions):
+        bits = 0
+        for pos in positions:
+            bits |= self.bit(pos)
+        return bits
+
+    def unpack(self, bits):
+        positions = []
+        while bits:
+            low = bits & -bits
+            y, x = divmod(low.bit_length() - 1, self.stride)
+            positions.append((x, y))
+            bits ^= low
+        return positions
+
+    def free(self):
+        return self.playable & ~(self.obstacles | self.boundary | self.body)
+
+    def is_collision(self, pos):
+        if not (0 <= pos[0] < self.width and 0 <= pos[1] < self.height):
+            return True
+        return bool(self.bit(pos) & (self.obstacles | self.boundary | self.body))
+
+    # Same rules as the game loop: the head moves into new_head and the tail
+    # is released unless the snake grows
+    def move(self, new_head, grow=False):
+        if not grow:
+            tail = self.snake.pop()
+            self.body &= ~self.bit(tail)
+        self.snake.insert(0, new_head)
+        self.body |= self.bit(new_head)
+
+    def expand(self, frontier, free):
+        stride = self.stride
+        return ((frontier << 1) | (frontier >> 1) | (frontier << stride) | (frontier >> stride)) & free
+
+    # Number of moves from start to goal through free cells, or -1
+    def distance(self, start, goal):
+        free = self.free() | self.bit(goal)
+        target = self.bit(goal)
+        frontier = visited = self.bit(start)
+        distance = 0
+        while frontier:
+            if frontier & target:
+                return distance
+            frontier = self.expand(frontier, free) & ~visited
+            visited |= frontier
+            distance += 1
+        return -1
+
+    # Bitboard of every free cell reachable from start
+    def reachable(self, start):
+        free = self.free()
+        frontier = visited = self.bit(start)
+        while frontier:
+            frontier = self.expand(frontier, free) & ~visited
+            visited |= frontier
+        return visited & ~self.bit(start)
+
+    # First move of a shortest route from head to goal, or None. The BFS
+    # grows from the goal and stops at the first frontier that touches a
+    # neighbor of head; every cell in that frontier is one move closer to
+    # the goal than head, so the move is any neighbor of head inside it.
+    # stats, given, gets the grid_engine counts (see _record there), with a
+    # whole BFS level as the open list.
+    def next_step(self, head, goal, stats=None):
+        free = self.free()
+        head_bit = self.bit(head)
+        frontier = visited = self.bit(goal)
+        track = stats is not None
+        peak_open = 1
+        while frontier and not (frontier & self.expand(head_bit, ~0)):
+            frontier = self.expand(frontier, free) & ~visited
+            visited |= frontier
+            if track and frontier.bit_count() > peak_open:
+                peak_open = frontier.bit_count()
+        if track:
+            # Every level but the last one reached was expanded
+            _record(stats, (visited & ~frontier).bit_count(), visited.bit_count(), 0, peak_open)
+        if not frontier:
+            return None
+
+        for dx, dy in ((0, 1), (0, -1), (1, 0), (-1, 0)):
+            step = (head[0] + dx, head[1] + dy)
+            if 0 <= step[0] < self.width and 0 <= step[1] < self.height and self.bit(step) & frontier:
+                return step
+        return None
+
+
+# Score many (snake, food) states on one static layout. Returns a list of
+# (distance from head to food, number of free cells reachable from head).
+def evaluate_states(width, height, obstacles, boundary, states):
+    board = BitBoard(width, height, obstacles, boundary)
+    results = []
+    for snake, food in states:
+        board.body = board.pack(snake)
+        head = snake[0]
+        results.append((board.distance(head, food), board.reachable(head).bit_count()))
+    return results
@@ -0,0 +1,111 @@
+import numpy as np
+
+from grid_engine import _record
+
+# Distance-to-food field for the snake game.
+#
+# One vectorised BFS wavefront over the occupancy grid gives the distance
+# from the food to every cell. After that the snake only has to step to the
+# neighbor with the smallest distance, which is O(1) per tick. The field is
+# recomputed when the food moves or when the cell the snake is about to
+# enter has become blocked.
+
+UNREACHABLE = -1
+
+
+# Distance from goal to every free cell, or UNREACHABLE. free is a 2-D bool
+# array indexed [row, column] and goal is a (row, column) pair. stats, given,
+# gets the grid_engine counts: every reached cell joins one frontier and is
+# grown once, and the open list is the frontier.
+def wavefront_distances(free, goal, stats=None):
+    distances = np.full(free.shape, UNREACHABLE, dtype=np.int32)
+    frontier = np.zeros(free.shape, dtype=bool)
+    frontier[goal] = free[goal]
+    visited = frontier.copy()
+    grown = np.empty_like(frontier)
+    distance = 0
+    track = stats is not None
+    peak_open = 0
+
+    while frontier.any():
+        if track:
+            peak_open = max(peak_open, int(frontier.sum()))
+        distances[frontier] = distance
+
+        # Shift the whole frontier one cell in each direction at once
+        grown[:] = False
+        grown[1:, :] |= frontier[:-1, :]
+        grown[:-1, :] |= frontier[1:, :]
+        grown[:, 1:] |= frontier[:, :-1]
+        grown[:, :-1] |= frontier[:, 1:]
+
+        frontier = grown & free & ~visited
+        visited |= frontier
+        distance += 1
+
+    if track:
+        reached = int(visited.sum())
+        _record(stats, reached, reached, 0, peak_open)
+    return distances
+
+
+class DistanceField:
+    def __init__(self, grid):
+        self.grid = grid
+        # Zero-copy view of the bordered engine grid, so later set_blocked
+        # calls are visible here without rebuilding anything
+        self.cells = np.frombuffer(grid.cells, dtype=np.uint8).reshape(grid.height + 2, grid.stride)
+        self.distances = None
+        self.food = None
+        self.recomputes = 0
+
+    def recompute(self, food, stats=None):
+        self.food = food
+        self.distances = wavefront_distances(self.cells == 0, (food[1] + 1, food[0] + 1), stats)
+        self.recomputes += 1
+
+    def distance(self, pos):
+        if self.distances is None or not self.grid.in_bounds(pos):
+            return UNREACHABLE
+        return int(self.distances[pos[1] + 1, pos[0] + 1])
+
+    # Next cell on a shortest route from head to food, or None if the food
+    # cannot be reached. stats, given, gets the counts of the recompute the
+    # call ran, and stays empty when the field was still good. A fresh
+    # field never descends into a blocked cell, so there is at most one.
+    def next_step(self, head, food, stats=None):
+        if food != self.food:
+            self.recompute(food, stats)
+
+        step = self._descend(head)
+        if step is not None and self.grid.is_blocked(step):
+            # The occupancy changed along the route since the last recompute
+            self.recompute(food, stats)
+            step = self._descend(head)
+        return step
+
+    # Full route from head to the food, next cell first
+    def path(self, head):
+        if self.distance(head) == UNREACHABLE:
+            return None
+        path = []
+        step = self._descend(head)
+        while step is not None:
+            path.append(step)
+            step = self._descend(step)
+        return path
+
+    def _descend(self, head):
+        distances = self.distances
+        row, column = head[1] + 1, head[0] + 1
+        best = distances[row, column]
+        if best <= 0:
+            return None
+
+        step = None
+        for dx, dy in ((0, 1), (0, -1), (1, 0), (-1, 0)):
+            distance = distances[row + dy, column + dx]
+            if 0 <= distance < best:
+                best = distance
+                step = (head[0] + dx, head[1] + dy)
+        return step
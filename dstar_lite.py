@@ -0,0 +1,177 @@
+from grid_engine import WALL, FREE, IndexedHeap, _record, manhattan
+
+# Incremental replanning with D* Lite (Koenig and Likhachev).
+#
+# The search runs backwards from the goal, so g and rhs values stay valid
+# when the start (the snake's head) moves. Between ticks only the cells that
+# changed are repaired: the old head becomes body, the tail frees a cell.
+# A new food means a new goal, which needs a fresh planner.
+
+INF = 1 << 40
+
+
+class DStarLite:
+    def __init__(self, grid, start, goal, blocked=()):
+        self.grid = grid
+        self.stride = grid.stride
+        self.size = grid.size
+        self.offsets = grid.offsets
+        self.goal = goal
+
+        # Private copy of the occupancy: the engine grid only knows the
+        # static obstacles, the planner also tracks the snake's body
+        self.cells = bytearray(grid.cells)
+        self.g = [INF] * self.size
+        self.rhs = [INF] * self.size
+        self.open_list = IndexedHeap(self.size)
+        self.km = 0
+        self.changed = []
+        # Open list pushes and decrease-keys since the last replan, for its stats
+        self.pushes = 0
+        self.updates = 0
+
+        self.start_index = grid.index(start)
+        self.last_start_index = self.start_index
+        self.goal_index = grid.index(goal)
+        for pos in blocked:
+            if pos != start and pos != goal and grid.in_bounds(pos):
+                self.cells[grid.index(pos)] = WALL
+        self.body = set(blocked)
+
+        self.rhs[self.goal_index] = 0
+        self._update_vertex(self.goal_index)
+
+    def _key(self, cell):
+        m = min(self.g[cell], self.rhs[cell])
+        return (m + manhattan(self.stride, self.start_index, cell) + self.km) * self.size + m
+
+    def _update_vertex(self, cell):
+        if self.g[cell] != self.rhs[cell]:
+            if cell in self.open_list:
+                self.updates += 1
+            self.pushes += 1
+            self.open_list.push(cell, self._key(cell))
+        else:
+            self.open_list.remove(cell)
+
+    # One-step lookahead: 1 + g of the best free neighbor
+    def _best_rhs(self, cell):
+        if self.cells[cell]:
+            return INF
+        cells, g = self.cells, self.g
+        best = INF
+        for offset in self.offsets:
+            neighbor = cell + offset
+            if not cells[neighbor] and g[neighbor] + 1 < best:
+                best = g[neighbor] + 1
+        return best
+
+    # Returns (expanded, peak_open); the peak is only tracked when asked for
+    def _compute_shortest_path(self, track):
+        open_list, g, rhs, cells = self.open_list, self.g, self.rhs, self.cells
+        start = self.start_index
+        expanded = 0
+        peak_open = len(open_list)
+
+        while open_list and (open_list.peek_key() < self._key(start) or rhs[start] > g[start]):
+            if track and len(open_list) > peak_open:
+                peak_open = len(open_list)
+            old_key = open_list.peek_key()
+            current = open_list.pop()
+            new_key = self._key(current)
+            expanded += 1
+
+            if old_key < new_key:
+                # Key went stale after km grew; requeue with the fresh one
+                self.pushes += 1
+                open_list.push(current, new_key)
+            elif g[current] > rhs[current]:
+                g[current] = rhs[current]
+                for offset in self.offsets:
+                    neighbor = current + offset
+                    if not cells[neighbor] and neighbor != self.goal_index and g[current] + 1 < rhs[neighbor]:
+                        rhs[neighbor] = g[current] + 1
+                        self._update_vertex(neighbor)
+            else:
+                old_g = g[current]
+                g[current] = INF
+                for neighbor in [current + offset for offset in self.offsets]:
+                    if neighbor != self.goal_index and rhs[neighbor] == old_g + 1:
+                        rhs[neighbor] = self._best_rhs(neighbor)
+                    self._update_vertex(neighbor)
+                self._update_vertex(current)
+
+        return expanded, peak_open
+
+    # Change one cell's occupancy; repaired on the next replan()
+    def set_blocked(self, pos, blocked=True):
+        cell = self.grid.index(pos)
+        value = WALL if blocked else FREE
+        # Static walls from the engine grid never open up
+        if self.grid.cells[cell] or self.cells[cell] == value:
+            return
+        self.cells[cell] = value
+        self.changed.append(cell)
+
+    def move_start(self, pos):
+        self.start_index = self.grid.index(pos)
+
+    # Sync with the game: the head is the start, the rest of the body blocks
+    def follow_snake(self, snake):
+        body = set(snake[1:])
+        for pos in body - self.body:
+            self.set_blocked(pos, True)
+        for pos in self.body - body:
+            self.set_blocked(pos, False)
+        self.body = body
+        self.move_start(snake[0])
+
+    # Repair the plan after moves and occupancy changes. Returns the number
+    # of queue pops the repair took. stats, given, gets the grid_engine
+    # counts for the repair; the first replan's include the goal's push.
+    def replan(self, stats=None):
+        if self.start_index != self.last_start_index:
+            self.km += manhattan(self.stride, self.last_start_index, self.start_index)
+            self.last_start_index = self.start_index
+
+        for cell in self.changed:
+            for neighbor in [cell + offset for offset in self.offsets] + [cell]:
+                if neighbor != self.goal_index:
+                    self.rhs[neighbor] = self._best_rhs(neighbor)
+                    self._update_vertex(neighbor)
+        self.changed = []
+
+        expanded, peak_open = self._compute_shortest_path(stats is not None)
+        if stats is not None:
+            _record(stats, expanded, self.pushes, self.updates, peak_open)
+        self.pushes = self.updates = 0
+        return expanded
+
+    # First move of the current plan, or None if the goal is unreachable
+    def next_step(self):
+        start = self.start_index
+        if start == self.goal_index or self.rhs[start] >= INF:
+            return None
+        return self.grid.position(self._best_neighbor(start))
+
+    # Full route from the start to the goal, next cell first
+    def path(self):
+        if self.rhs[self.start_index] >= INF:
+            return None
+        path = []
+        current = self.start_index
+        while current != self.goal_index:
+            current = self._best_neighbor(current)
+            if current is None or len(path) >= self.size:
+                return None
+            path.append(self.grid.position(current))
+        return path
+
+    def _best_neighbor(self, cell):
+        cells, g = self.cells, self.g
+        best, step = INF, None
+        for offset in self.offsets:
+            neighbor = cell + offset
+            if not cells[neighbor] and g[neighbor] < best:
+                best, step = g[neighbor], neighbor
+        return step
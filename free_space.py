@@ -0,0 +1,219 @@
+from array import array
+from collections import deque
+
+from grid_engine import FREE, WALL
+
+# Connectivity of the free cells around the snake, kept up to date as it
+# moves instead of flood filling every tick.
+#
+# Free cells live in a union-find forest. A cell released by the tail is a
+# new node joined to its free neighbors, which union-find handles directly.
+# A cell claimed by the head cannot be taken out of the forest, so its
+# component just loses one from its count. That stays exact unless the
+# claim cuts the component in two; a look at the 8 cells around the claimed
+# one rules that out in almost every tick. When it cannot, short BFS runs
+# from each side, in turn, either meet (nothing was cut) or one of them runs
+# dry, and the cells it saw become a component of their own. If the runs
+# hit search_limit first, the cut is left for a full rebuild, done once
+# rebuild_every such claims have piled up. Until then the two halves of a
+# cut component still look connected.
+
+# Cells the side-by-side BFS may visit before a cut is left for a rebuild
+SEARCH_LIMIT = 1024
+
+
+class FreeSpaceTracker:
+    def __init__(self, grid, snake=(), rebuild_every=1, search_limit=SEARCH_LIMIT):
+        self.grid = grid
+        self.rebuild_every = rebuild_every
+        self.search_limit = search_limit
+        self.rebuilds = 0
+
+        # Private copy of the occupancy, like DStarLite: static walls from
+        # the engine grid plus the snake's body
+        self.cells = bytearray(grid.cells)
+        for pos in snake:
+            self.cells[grid.index(pos)] = WALL
+
+        # The 8 cells around a cell in circular order, starting above it;
+        # each one is a 4-neighbor of the next
+        stride = grid.stride
+        self.ring = (-stride, -stride + 1, 1, stride + 1, stride, stride - 1, -1, -stride - 1)
+        self.rebuild()
+
+    # Recompute the forest from scratch with one node per free cell
+    def rebuild(self):
+        cells = self.cells
+        size = self.grid.size
+        stride = self.grid.stride
+        self.node = array("i", [-1]) * size  # Cell index -> node, -1 when occupied
+        self.parent = array("i", range(size))
+        self.count = array("i", [1]) * size  # Free cells under each root
+        for cell in range(size):
+            if not cells[cell]:
+                self.node[cell] = cell
+        for cell in range(size):
+            if not cells[cell]:
+                if not cells[cell + 1]:
+                    self._union(cell, cell + 1)
+                if not cells[cell + stride]:
+                    self._union(cell, cell + stride)
+        self.pending_splits = 0
+        self.rebuilds += 1
+
+    def _find(self, node):
+        parent = self.parent
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    def _union(self, a, b):
+        a, b = self._find(a), self._find(b)
+        if a == b:
+            return
+        if self.count[a] < self.count[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.count[a] += self.count[b]
+
+    # The head moved onto pos
+    def claim(self, pos):
+        cell = self.grid.index(pos)
+        if self.cells[cell]:
+            return
+        self.cells[cell] = WALL
+        self.count[self._find(self.node[cell])] -= 1
+        self.node[cell] = -1
+        sides = self._sides(cell)
+        if len(sides) > 1 and not self._separate(sides):
+            self.pending_splits += 1
+            if self.pending_splits >= self.rebuild_every:
+                self.rebuild()
+
+    # The tail left pos
+    def release(self, pos):
+        cell = self.grid.index(pos)
+        if not self.cells[cell] or self.grid.cells[cell]:
+            return
+        self.cells[cell] = FREE
+        node = len(self.parent)
+        self.parent.append(node)
+        self.count.append(1)
+        self.node[cell] = node
+        for offset in self.grid.offsets:
+            neighbor = self.node[cell + offset]
+            if neighbor >= 0:
+                self._union(node, neighbor)
+
+        # Released cells add nodes; compact once the forest doubles
+        if len(self.parent) > 2 * self.grid.size:
+            self.rebuild()
+
+    # One free 4-neighbor of cell per unbroken run of free ring cells. Cells
+    # in the same run stay connected around cell, so blocking it can only
+    # cut the component if this returns more than one.
+    def _sides(self, cell):
+        cells = self.cells
+        free = [not cells[cell + offset] for offset in self.ring]
+        labels = [0] * 8
+        run = 0
+        for i in range(8):
+            if free[i]:
+                if i == 0 or not free[i - 1]:
+                    run += 1
+                labels[i] = run
+        if free[0] and free[7]:
+            labels = [1 if label == run else label for label in labels]
+        sides = {}
+        for i in (0, 2, 4, 6):
+            if free[i]:
+                sides.setdefault(labels[i], cell + self.ring[i])
+        return list(sides.values())
+
+    # BFS from every side, one cell each in turn. Searches that meet join
+    # one group; a group whose searches all run dry is cut off and gets a
+    # root of its own. Returns False if search_limit ran out first.
+    def _separate(self, sides):
+        cells = self.cells
+        offsets = self.grid.offsets
+        group = list(range(len(sides)))
+        owner = {side: i for i, side in enumerate(sides)}
+        queues = [deque([side]) for side in sides]
+        seen = [[side] for side in sides]
+        alive = list(range(len(sides)))
+        budget = self.search_limit
+
+        while len({group[i] for i in alive}) > 1:
+            sealed = None
+            for label in {group[i] for i in alive}:
+                if not any(queues[i] for i in alive if group[i] == label):
+                    sealed = label
+                    break
+            if sealed is not None:
+                self._detach([cell for i in alive if group[i] == sealed for cell in seen[i]])
+                alive = [i for i in alive if group[i] != sealed]
+                continue
+
+            if budget <= 0:
+                return False
+            for i in alive:
+                if not queues[i]:
+                    continue
+                current = queues[i].popleft()
+                budget -= 1
+                for offset in offsets:
+                    neighbor = current + offset
+                    if cells[neighbor]:
+                        continue
+                    other = owner.get(neighbor)
+                    if other is None:
+                        owner[neighbor] = i
+                        seen[i].append(neighbor)
+                        queues[i].append(neighbor)
+                    elif group[other] != group[i]:
+                        old = group[other]
+                        group = [group[i] if label == old else label for label in group]
+        return True
+
+    # Give cells, a whole component cut off from the rest, a fresh root
+    def _detach(self, cells):
+        root = len(self.parent)
+        self.parent.append(root)
+        self.count.append(len(cells))
+        self.count[self._find(self.node[cells[0]])] -= len(cells)
+        for cell in cells:
+            self.node[cell] = root
+
+    # Roots of the components pos touches: its own if pos is free, its free
+    # neighbors' if pos is part of the snake
+    def _roots(self, cell):
+        node = self.node
+        if node[cell] >= 0:
+            return {self._find(node[cell])}
+        return {self._find(node[cell + offset]) for offset in self.grid.offsets if node[cell + offset] >= 0}
+
+    # Number of free cells reachable from pos
+    def component_size(self, pos):
+        return sum(self.count[root] for root in self._roots(self.grid.index(pos)))
+
+    def reachable(self, a, b):
+        return bool(self._roots(self.grid.index(a)) & self._roots(self.grid.index(b)))
+
+    # Is the tail still reachable from the head after moving to step? The
+    # move is assumed not to eat, so the old tail cell is released.
+    def tail_reachable(self, step, snake):
+        if len(snake) < 3 or step == snake[-1]:
+            return True
+        grid = self.grid
+        if self.cells[grid.index(step)]:
+            return False
+        head = self._roots(grid.index(step))
+        return bool(head & (self._roots(grid.index(snake[-2])) | self._roots(grid.index(snake[-1]))))
+
+    # Safety check for PathFollower and the game loop: keep the tail in
+    # reach, or at least move into a region big enough for the body
+    def is_safe(self, step, snake):
+        if self.tail_reachable(step, snake):
+            return True
+        return not self.cells[self.grid.index(step)] and self.component_size(step) >= len(snake)
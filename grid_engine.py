@@ -0,0 +1,858 @@
+from collections import deque
+import heapq
+
+# Shared grid pathfinding engine for the snake game scripts.
+#
+# The grid is a flat bytearray with a one-cell wall border around the
+# playable area, so "cell index + neighbor offset" never needs a bounds
+# check. Positions go in and come out as (x, y) tuples; the searches
+# themselves only touch integer cell indices.
+
+# Cell values
+FREE = 0
+WALL = 1
+
+
+class Grid:
+    def __init__(self, width, height, obstacles=()):
+        self.width = width
+        self.height = height
+        self.stride = width + 2
+        self.size = self.stride * (height + 2)
+        self.cells = bytearray(self.size)
+
+        # Same neighbor order as the original searches: (0, 1), (0, -1), (1, 0), (-1, 0)
+        self.offsets = (self.stride, -self.stride, 1, -1)
+
+        # Wall off the border so the searches can skip bounds checks
+        last_row = self.size - self.stride
+        for i in range(self.stride):
+            self.cells[i] = WALL
+            self.cells[last_row + i] = WALL
+        for i in range(self.stride, last_row, self.stride):
+            self.cells[i] = WALL
+            self.cells[i + self.stride - 1] = WALL
+
+        for pos in obstacles:
+            self.set_blocked(pos)
+
+    def index(self, pos):
+        return (pos[1] + 1) * self.stride + pos[0] + 1
+
+    def position(self, index):
+        y, x = divmod(index, self.stride)
+        return (x - 1, y - 1)
+
+    def in_bounds(self, pos):
+        return 0 <= pos[0] < self.width and 0 <= pos[1] < self.height
+
+    def is_blocked(self, pos):
+        if not self.in_bounds(pos):
+            return True
+        return self.cells[self.index(pos)] != FREE
+
+    def set_blocked(self, pos, blocked=True):
+        if self.in_bounds(pos):
+            self.cells[self.index(pos)] = WALL if blocked else FREE
+
+
+def manhattan(stride, index1, index2):
+    y1, x1 = divmod(index1, stride)
+    y2, x2 = divmod(index2, stride)
+    return abs(x1 - x2) + abs(y1 - y2)
+
+
+# Walk the parent array back from the goal. The path excludes the start and
+# includes the goal, so path[0] is always the next cell to move into.
+def build_path(grid, parent, start, goal):
+    path = []
+    current = goal
+    while current != start:
+        path.append(grid.position(current))
+        current = parent[current]
+    path.reverse()
+    return path
+
+
+def _endpoints(grid, start, goal):
+    if goal is None or not grid.in_bounds(start) or not grid.in_bounds(goal):
+        return None
+    return grid.index(start), grid.index(goal)
+
+
+# Fill a search's stats dict. The counts come from the search's own arrays
+# once it is done, plus a duplicate counter on the rare re-push branch and a
+# peak check guarded by the stats flag, so a search called without stats
+# pays one flag test per pop and nothing else.
+#   expanded    cells (states for JPS) taken off the open list and expanded
+#   generated   entries put on the open list, start included
+#   duplicates  entries pushed for a cell already queued, after a cheaper
+#               path to it turned up (decrease-keys for the indexed heap)
+#   peak_open   most entries on the open list at once, stale ones included
+def _record(stats, expanded, generated, duplicates, peak_open):
+    stats["expanded"] = expanded
+    stats["generated"] = generated
+    stats["duplicates"] = duplicates
+    stats["peak_open"] = peak_open
+
+
+# Open list with a position index, so a queued cell can have its key lowered
+# in place (decrease-key) instead of being pushed a second time.
+class IndexedHeap:
+    def __init__(self, capacity):
+        self.heap = []
+        self.keys = [0] * capacity
+        self.slots = [-1] * capacity  # Heap position of each cell, -1 when not queued
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, item):
+        return self.slots[item] >= 0
+
+    def push(self, item, key):
+        slot = self.slots[item]
+        if slot >= 0:
+            old_key = self.keys[item]
+            self.keys[item] = key
+            if key < old_key:
+                self._sift_up(slot)
+            elif key > old_key:
+                self._sift_down(slot)
+            return
+
+        self.keys[item] = key
+        self.heap.append(item)
+        self._sift_up(len(self.heap) - 1)
+
+    def pop(self):
+        heap = self.heap
+        top = heap[0]
+        last = heap.pop()
+        self.slots[top] = -1
+        if heap:
+            heap[0] = last
+            self._sift_down(0)
+        return top
+
+    def remove(self, item):
+        slot = self.slots[item]
+        if slot < 0:
+            return
+        heap = self.heap
+        last = heap.pop()
+        self.slots[item] = -1
+        if slot < len(heap):
+            heap[slot] = last
+            self._sift_up(slot)
+            self._sift_down(self.slots[last])
+
+    def peek_key(self):
+        return self.keys[self.heap[0]]
+
+    def _sift_up(self, pos):
+        heap, keys, slots = self.heap, self.keys, self.slots
+        item = heap[pos]
+        key = keys[item]
+        while pos > 0:
+            parent_pos = (pos - 1) >> 1
+            parent = heap[parent_pos]
+            if key >= keys[parent]:
+                break
+            heap[pos] = parent
+            slots[parent] = pos
+            pos = parent_pos
+        heap[pos] = item
+        slots[item] = pos
+
+    def _sift_down(self, pos):
+        heap, keys, slots = self.heap, self.keys, self.slots
+        count = len(heap)
+        item = heap[pos]
+        key = keys[item]
+        while True:
+            child = 2 * pos + 1
+            if child >= count:
+                break
+            right = child + 1
+            if right < count and keys[heap[right]] < keys[heap[child]]:
+                child = right
+            child_item = heap[child]
+            if keys[child_item] >= key:
+                break
+            heap[pos] = child_item
+            slots[child_item] = pos
+            pos = child
+        heap[pos] = item
+        slots[item] = pos
+
+
+# Define a function for A* search
+#
+# The open list is heapq with lazy deletion: a cheaper path pushes a second
+# entry and the stale one is skipped when popped. Keys are f * size - g, so
+# ties on f go to the deeper cell and open maps expand little more than the
+# path itself.
+def a_star_search(grid, start, goal, stats=None, heuristic=None):
+    endpoints = _endpoints(grid, start, goal)
+    if endpoints is None:
+        return None
+    start_index, goal_index = endpoints
+
+    cells = grid.cells
+    offsets = grid.offsets
+    stride = grid.stride
+    size = grid.size
+    goal_y, goal_x = divmod(goal_index, stride)
+
+    g_score = [-1] * size
+    parent = [-1] * size
+    closed = bytearray(size)
+
+    # An optional heuristic (for example landmarks.LandmarkHeuristic) replaces Manhattan
+    estimate = heuristic.for_goal(goal_index) if heuristic is not None else None
+
+    g_score[start_index] = 0
+    first_h = estimate(start_index) if estimate else manhattan(stride, start_index, goal_index)
+    open_list = [(first_h * size, start_index)]
+    path = None
+    track = stats is not None
+    duplicates = peak_open = 0
+
+    while open_list:
+        if track and len(open_list) > peak_open:
+            peak_open = len(open_list)
+        _, current = heapq.heappop(open_list)
+
+        # Skip entries that were superseded by a cheaper push
+        if closed[current]:
+            continue
+
+        if current == goal_index:
+            path = build_path(grid, parent, start_index, goal_index)
+            break
+
+        closed[current] = 1
+        tentative_g_score = g_score[current] + 1
+
+        for offset in offsets:
+            neighbor = current + offset
+            if cells[neighbor] or closed[neighbor]:
+                continue
+
+            old_g_score = g_score[neighbor]
+            if old_g_score != -1:
+                if tentative_g_score >= old_g_score:
+                    continue
+                duplicates += 1
+            parent[neighbor] = current
+            g_score[neighbor] = tentative_g_score
+            if estimate is None:
+                y, x = divmod(neighbor, stride)
+                f_score = tentative_g_score + abs(x - goal_x) + abs(y - goal_y)
+            else:
+                f_score = tentative_g_score + estimate(neighbor)
+            heapq.heappush(open_list, (f_score * size - tentative_g_score, neighbor))
+
+    if track:
+        _record(stats, closed.count(1), size - g_score.count(-1) + duplicates, duplicates, peak_open)
+    return path
+
+
+# A* over an IndexedHeap with real decrease-key: every cell is queued at most
+# once. Keys are a_star_search's f * size - g with the cell index appended
+# (key * size + cell), the same tie-break heapq gets from comparing the
+# (key, cell) tuples, so it expands the same cells in the same order and
+# returns the same paths as a_star_search. It trades the duplicate
+# entries for pure-Python sift calls, which heapq does in C, so it is slower
+# on our maps and kept for comparison (benchmarks/bench_astar.py).
+def a_star_indexed_search(grid, start, goal, stats=None):
+    endpoints = _endpoints(grid, start, goal)
+    if endpoints is None:
+        return None
+    start_index, goal_index = endpoints
+
+    cells = grid.cells
+    offsets = grid.offsets
+    stride = grid.stride
+    size = grid.size
+    goal_y, goal_x = divmod(goal_index, stride)
+
+    g_score = [-1] * size
+    parent = [-1] * size
+    closed = bytearray(size)
+
+    g_score[start_index] = 0
+    open_list = IndexedHeap(size)
+    open_list.push(start_index, manhattan(stride, start_index, goal_index) * size * size + start_index)
+    path = None
+    track = stats is not None
+    duplicates = peak_open = 0
+
+    while open_list:
+        if track and len(open_list.heap) > peak_open:
+            peak_open = len(open_list.heap)
+        current = open_list.pop()
+
+        if current == goal_index:
+            path = build_path(grid, parent, start_index, goal_index)
+            break
+
+        closed[current] = 1
+        tentative_g_score = g_score[current] + 1
+
+        for offset in offsets:
+            neighbor = current + offset
+            if cells[neighbor] or closed[neighbor]:
+                continue
+
+            old_g_score = g_score[neighbor]
+            if old_g_score != -1:
+                if tentative_g_score >= old_g_score:
+                    continue
+                duplicates += 1  # A decrease-key on a queued cell
+            parent[neighbor] = current
+            g_score[neighbor] = tentative_g_score
+            y, x = divmod(neighbor, stride)
+            f_score = tentative_g_score + abs(x - goal_x) + abs(y - goal_y)
+            open_list.push(neighbor, (f_score * size - tentative_g_score) * size + neighbor)
+
+    if track:
+        _record(stats, closed.count(1), size - g_score.count(-1) + duplicates, duplicates, peak_open)
+    return path
+
+
+# Define a function for DFS search
+#
+# BFS and DFS keep only cell indices on the frontier plus one parent array,
+# and mark a cell visited when it is pushed, so no cell is queued twice. The
+# path is built once, when the goal is first discovered.
+def dfs_search(grid, start, goal, stats=None):
+    return _uninformed_search(grid, start, goal, stats, depth_first=True)
+
+
+# Define a function for BFS search
+def bfs_search(grid, start, goal, stats=None):
+    return _uninformed_search(grid, start, goal, stats, depth_first=False)
+
+
+def _uninformed_search(grid, start, goal, stats, depth_first):
+    endpoints = _endpoints(grid, start, goal)
+    if endpoints is None:
+        return None
+    start_index, goal_index = endpoints
+
+    cells = grid.cells
+    offsets = grid.offsets
+    parent = [-1] * grid.size
+    visited = bytearray(grid.size)
+    visited[start_index] = 1
+
+    frontier = deque([start_index])
+    take = frontier.pop if depth_first else frontier.popleft
+    path = [] if start_index == goal_index else None
+    track = stats is not None
+    peak_open = 0
+
+    while frontier and path is None:
+        if track and len(frontier) > peak_open:
+            peak_open = len(frontier)
+        current = take()
+
+        for offset in offsets:
+            neighbor = current + offset
+            if visited[neighbor] or cells[neighbor]:
+                continue
+
+            visited[neighbor] = 1
+            parent[neighbor] = current
+            if neighbor == goal_index:
+                path = build_path(grid, parent, start_index, goal_index)
+                break
+            frontier.append(neighbor)
+
+    if track:
+        # Every visited cell was pushed once, except a discovered goal; the
+        # ones still queued were never expanded
+        generated = visited.count(1)
+        expanded = generated - len(frontier)
+        if path:
+            expanded -= 1
+        _record(stats, expanded, generated, 0, peak_open)
+    return path
+
+
+# A* with a bucket queue (Dial's algorithm). Every step costs 1 and the
+# Manhattan heuristic is an integer, so f only takes a few small integer
+# values and buckets[f] replaces the heap: push and pop are O(1) list
+# operations. Each bucket is popped LIFO, which gives a similar deeper-first
+# bias to the keys in a_star_search.
+def a_star_bucket_search(grid, start, goal, stats=None):
+    endpoints = _endpoints(grid, start, goal)
+    if endpoints is None:
+        return None
+    start_index, goal_index = endpoints
+
+    cells = grid.cells
+    offsets = grid.offsets
+    stride = grid.stride
+    size = grid.size
+    goal_y, goal_x = divmod(goal_index, stride)
+
+    g_score = [-1] * size
+    parent = [-1] * size
+    closed = bytearray(size)
+
+    # f never drops below the start's f, so buckets are indexed from there
+    f_min = manhattan(stride, start_index, goal_index)
+    g_score[start_index] = 0
+    buckets = [[start_index]]
+    f = 0  # Index of the lowest bucket that may still hold entries
+    queued = 1
+    path = None
+    track = stats is not None
+    duplicates = peak_open = 0
+
+    while queued:
+        if track and queued > peak_open:
+            peak_open = queued
+        bucket = buckets[f]
+        if not bucket:
+            f += 1
+            continue
+        current = bucket.pop()
+        queued -= 1
+
+        # Skip entries that were superseded by a cheaper push
+        if closed[current]:
+            continue
+
+        if current == goal_index:
+            path = build_path(grid, parent, start_index, goal_index)
+            break
+
+        closed[current] = 1
+        tentative_g_score = g_score[current] + 1
+
+        for offset in offsets:
+            neighbor = current + offset
+            if cells[neighbor] or closed[neighbor]:
+                continue
+
+            old_g_score = g_score[neighbor]
+            if old_g_score != -1:
+                if tentative_g_score >= old_g_score:
+                    continue
+                duplicates += 1
+            parent[neighbor] = current
+            g_score[neighbor] = tentative_g_score
+            y, x = divmod(neighbor, stride)
+            slot = tentative_g_score + abs(x - goal_x) + abs(y - goal_y) - f_min
+            while slot >= len(buckets):
+                buckets.append([])
+            buckets[slot].append(neighbor)
+            queued += 1
+
+    if track:
+        _record(stats, closed.count(1), size - g_score.count(-1) + duplicates, duplicates, peak_open)
+    return path
+
+
+# Jump Point Search for 4-connected grids.
+#
+# Among equal-length paths only "vertical first" ones are searched: a path
+# may turn from vertical to horizontal anywhere, but from horizontal to
+# vertical only at a forced neighbor, where the cell diagonally behind the
+# turn is blocked. Any other horizontal-then-vertical pair can be swapped
+# for vertical-then-horizontal at the same length, so the pruning keeps an
+# optimal path. Straight runs collapse into single jumps, and the search
+# state is (cell, direction of arrival), since that decides which turns are
+# allowed next.
+
+# Horizontal run from cell: stops at the goal or at a cell with a forced
+# vertical neighbor, returns -1 on hitting a wall. Every cell passed on the
+# way shares the same answer, so it is stored in memo and each row segment
+# is scanned at most once per direction and query.
+def _jump_horizontal(cells, cell, step, stride, goal, memo):
+    known = memo.get(cell)
+    if known is not None:
+        return known
+    passed = [cell]
+    while True:
+        cell += step
+        if cells[cell]:
+            jump = -1
+            break
+        if cell == goal:
+            jump = cell
+            break
+        behind = cell - step
+        if (not cells[cell + stride] and cells[behind + stride]) or \
+                (not cells[cell - stride] and cells[behind - stride]):
+            jump = cell
+            break
+        known = memo.get(cell)
+        if known is not None:
+            jump = known
+            break
+        passed.append(cell)
+    for cell in passed:
+        memo[cell] = jump
+    return jump
+
+
+# Vertical run from cell: stops at the goal or at any cell whose horizontal
+# runs lead somewhere, returns -1 on hitting a wall
+def _jump_vertical(cells, cell, step, stride, goal, memo_right, memo_left):
+    while True:
+        cell += step
+        if cells[cell]:
+            return -1
+        if cell == goal:
+            return cell
+        if _jump_horizontal(cells, cell, 1, stride, goal, memo_right) != -1 or \
+                _jump_horizontal(cells, cell, -1, stride, goal, memo_left) != -1:
+            return cell
+
+
+def jump_point_search(grid, start, goal, stats=None):
+    endpoints = _endpoints(grid, start, goal)
+    if endpoints is None:
+        return None
+    start_index, goal_index = endpoints
+
+    cells = grid.cells
+    stride = grid.stride
+    size = grid.size
+    goal_y, goal_x = divmod(goal_index, stride)
+
+    # Direction ids 0-1 are vertical, 2-3 horizontal; 4 marks the start
+    steps = (stride, -stride, 1, -1)
+    start_state = start_index * 5 + 4
+    memo_right = {}
+    memo_left = {}
+
+    g_score = {start_state: 0}
+    parent = {}
+    closed = set()
+    open_list = [(manhattan(stride, start_index, goal_index) * size, start_state)]
+    path = None
+    track = stats is not None
+    duplicates = peak_open = 0
+
+    while open_list:
+        if track and len(open_list) > peak_open:
+            peak_open = len(open_list)
+        _, state = heapq.heappop(open_list)
+        if state in closed:
+            continue
+
+        current, arrived = divmod(state, 5)
+        if current == goal_index:
+            path = _jump_path(grid, parent, state, start_state)
+            break
+
+        closed.add(state)
+        g = g_score[state]
+
+        if arrived == 4:
+            directions = (0, 1, 2, 3)
+        elif arrived < 2:
+            directions = (arrived, 2, 3)
+        else:
+            step = steps[arrived]
+            directions = [arrived]
+            if not cells[current + stride] and cells[current - step + stride]:
+                directions.append(0)
+            if not cells[current - stride] and cells[current - step - stride]:
+                directions.append(1)
+
+        for direction in directions:
+            if direction < 2:
+                jump = _jump_vertical(cells, current, steps[direction], stride, goal_index,
+                                      memo_right, memo_left)
+                cost = abs(jump - current) // stride
+            else:
+                memo = memo_right if direction == 2 else memo_left
+                jump = _jump_horizontal(cells, current, steps[direction], stride, goal_index, memo)
+                cost = abs(jump - current)
+            if jump == -1:
+                continue
+
+            successor = jump * 5 + direction
+            if successor in closed:
+                continue
+            tentative_g_score = g + cost
+            old_g_score = g_score.get(successor)
+            if old_g_score is not None:
+                if tentative_g_score >= old_g_score:
+                    continue
+                duplicates += 1
+            g_score[successor] = tentative_g_score
+            parent[successor] = state
+            y, x = divmod(jump, stride)
+            f_score = tentative_g_score + abs(x - goal_x) + abs(y - goal_y)
+            heapq.heappush(open_list, (f_score * size - tentative_g_score, successor))
+
+    if track:
+        _record(stats, len(closed), len(g_score) + duplicates, duplicates, peak_open)
+    return path
+
+
+# Expand the chain of jump points back into single-cell steps
+def _jump_path(grid, parent, state, start_state):
+    stride = grid.stride
+    path = []
+    while state != start_state:
+        previous = parent[state]
+        cell = state // 5
+        previous_cell = previous // 5
+        step = stride if abs(cell - previous_cell) >= stride else 1
+        if cell < previous_cell:
+            step = -step
+        while cell != previous_cell:
+            path.append(grid.position(cell))
+            cell -= step
+        state = previous
+    path.reverse()
+    return path
+
+
+# Join a forward parent chain ending in meet_forward with a backward chain
+# starting at meet_backward, where the two cells are neighbors
+def _join_paths(grid, parent_forward, parent_backward, start, goal, meet_forward, meet_backward):
+    path = build_path(grid, parent_forward, start, meet_forward) if meet_forward != start else []
+    current = meet_backward
+    while current != -1:
+        path.append(grid.position(current))
+        current = parent_backward[current] if current != goal else -1
+    return path
+
+
+# Bidirectional BFS: frontiers grow level by level from the start and from
+# the goal, always expanding the smaller one. Once a level produces a
+# meeting, the rest of that level is finished and the shortest join wins.
+def bidirectional_bfs_search(grid, start, goal, stats=None):
+    endpoints = _endpoints(grid, start, goal)
+    if endpoints is None:
+        return None
+    start_index, goal_index = endpoints
+    if start_index == goal_index:
+        return []
+
+    cells = grid.cells
+    offsets = grid.offsets
+    size = grid.size
+
+    distance = ([-1] * size, [-1] * size)  # Forward, backward
+    parent = ([-1] * size, [-1] * size)
+    distance[0][start_index] = 0
+    distance[1][goal_index] = 0
+    frontiers = [[start_index], [goal_index]]
+    expanded = peak_open = 0
+    best = None  # (length, forward cell, backward cell)
+
+    while frontiers[0] and frontiers[1] and best is None:
+        peak_open = max(peak_open, len(frontiers[0]) + len(frontiers[1]))
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        own_distance, other_distance = distance[side], distance[1 - side]
+        own_parent = parent[side]
+        next_frontier = []
+
+        for current in frontiers[side]:
+            expanded += 1
+            depth = own_distance[current] + 1
+            for offset in offsets:
+                neighbor = current + offset
+                if cells[neighbor]:
+                    continue
+                if other_distance[neighbor] != -1:
+                    length = depth + other_distance[neighbor]
+                    if best is None or length < best[0]:
+                        best = (length, current, neighbor) if side == 0 else (length, neighbor, current)
+                if own_distance[neighbor] == -1:
+                    own_distance[neighbor] = depth
+                    own_parent[neighbor] = current
+                    next_frontier.append(neighbor)
+
+        frontiers[side] = next_frontier
+
+    if stats is not None:
+        generated = 2 * size - distance[0].count(-1) - distance[1].count(-1)
+        _record(stats, expanded, generated, 0, peak_open)
+    if best is None:
+        return None
+    return _join_paths(grid, parent[0], parent[1], start_index, goal_index, best[1], best[2])
+
+
+# Bidirectional A*: a forward search toward the goal and a backward search
+# toward the start, each with its own Manhattan heuristic, expanding the side
+# with the smaller open list. Every edge that touches a cell the other side
+# has reached gives a candidate path (mu); once either side's smallest f is
+# at least mu, no shorter path can exist.
+def bidirectional_a_star_search(grid, start, goal, stats=None):
+    endpoints = _endpoints(grid, start, goal)
+    if endpoints is None:
+        return None
+    start_index, goal_index = endpoints
+    if start_index == goal_index:
+        return []
+
+    cells = grid.cells
+    offsets = grid.offsets
+    stride = grid.stride
+    size = grid.size
+
+    g_score = ([-1] * size, [-1] * size)  # Forward, backward
+    parent = ([-1] * size, [-1] * size)
+    closed = (bytearray(size), bytearray(size))
+    targets = (divmod(goal_index, stride), divmod(start_index, stride))
+    first_f = manhattan(stride, start_index, goal_index)
+    open_lists = ([(first_f * size, start_index)], [(first_f * size, goal_index)])
+    g_score[0][start_index] = 0
+    g_score[1][goal_index] = 0
+    best = None  # (length, forward cell, backward cell)
+    track = stats is not None
+    duplicates = peak_open = 0
+
+    while open_lists[0] and open_lists[1]:
+        if track and len(open_lists[0]) + len(open_lists[1]) > peak_open:
+            peak_open = len(open_lists[0]) + len(open_lists[1])
+
+        # Drop stale tops so both sides report their real smallest f
+        for side in (0, 1):
+            open_list = open_lists[side]
+            while open_list and closed[side][open_list[0][1]]:
+                heapq.heappop(open_list)
+        if not open_lists[0] or not open_lists[1]:
+            break
+        if best is not None and (-(-open_lists[0][0][0] // size) >= best[0] or
+                                 -(-open_lists[1][0][0] // size) >= best[0]):
+            break
+
+        side = 0 if len(open_lists[0]) <= len(open_lists[1]) else 1
+        open_list = open_lists[side]
+        own_g, other_g = g_score[side], g_score[1 - side]
+        own_parent, own_closed = parent[side], closed[side]
+        target_y, target_x = targets[side]
+
+        _, current = heapq.heappop(open_list)
+        own_closed[current] = 1
+        tentative_g_score = own_g[current] + 1
+
+        for offset in offsets:
+            neighbor = current + offset
+            if cells[neighbor] or own_closed[neighbor]:
+                continue
+
+            if other_g[neighbor] != -1:
+                length = tentative_g_score + other_g[neighbor]
+                if best is None or length < best[0]:
+                    best = (length, current, neighbor) if side == 0 else (length, neighbor, current)
+
+            old_g_score = own_g[neighbor]
+            if old_g_score != -1:
+                if tentative_g_score >= old_g_score:
+                    continue
+                duplicates += 1
+            own_parent[neighbor] = current
+            own_g[neighbor] = tentative_g_score
+            y, x = divmod(neighbor, stride)
+            f_score = tentative_g_score + abs(x - target_x) + abs(y - target_y)
+            heapq.heappush(open_list, (f_score * size - tentative_g_score, neighbor))
+
+    if track:
+        generated = 2 * size - g_score[0].count(-1) - g_score[1].count(-1) + duplicates
+        _record(stats, closed[0].count(1) + closed[1].count(1), generated, duplicates, peak_open)
+    if best is None:
+        return None
+    return _join_paths(grid, parent[0], parent[1], start_index, goal_index, best[1], best[2])
+
+
+# Direction of the snake's last move as (dx, dy), or None for a lone head
+def snake_heading(snake):
+    if len(snake) < 2:
+        return None
+    return (snake[0][0] - snake[1][0], snake[0][1] - snake[1][1])
+
+
+# Define a function for Greedy Best First Search
+#
+# The open list is a heap keyed on h * 2 + turn, where turn is 0 when the
+# step keeps the direction we arrived from (the snake's heading at the start
+# cell) and 1 otherwise, so equal-h cells prefer going straight. The in_open
+# flag array replaces the open-list membership scan; ties beyond the key fall
+# back to the cell index, so the expansion order is fully deterministic.
+# heading and heuristic are keyword-only, so a fourth positional argument is
+# stats, as for every other search in SEARCH_ALGORITHMS.
+def greedy_best_first_search(grid, start, goal, stats=None, *, heading=None, heuristic=None):
+    endpoints = _endpoints(grid, start, goal)
+    if endpoints is None:
+        return None
+    start_index, goal_index = endpoints
+
+    cells = grid.cells
+    offsets = grid.offsets
+    stride = grid.stride
+    goal_y, goal_x = divmod(goal_index, stride)
+
+    parent = [-1] * grid.size
+    closed = bytearray(grid.size)
+    in_open = bytearray(grid.size)
+    start_heading = heading[0] + heading[1] * stride if heading else 0
+
+    estimate = heuristic.for_goal(goal_index) if heuristic is not None else None
+
+    first_h = estimate(start_index) if estimate else manhattan(stride, start_index, goal_index)
+    open_list = [(first_h * 2, start_index)]
+    in_open[start_index] = 1
+    path = None
+    track = stats is not None
+    peak_open = 0
+
+    while open_list:
+        if track and len(open_list) > peak_open:
+            peak_open = len(open_list)
+        _, current = heapq.heappop(open_list)
+
+        if current == goal_index:
+            path = build_path(grid, parent, start_index, goal_index)
+            break
+
+        in_open[current] = 0
+        closed[current] = 1
+        straight = current - parent[current] if current != start_index else start_heading
+
+        for offset in offsets:
+            neighbor = current + offset
+            if cells[neighbor] or closed[neighbor] or in_open[neighbor]:
+                continue
+
+            parent[neighbor] = current
+            in_open[neighbor] = 1
+            if estimate is None:
+                y, x = divmod(neighbor, stride)
+                h = abs(x - goal_x) + abs(y - goal_y)
+            else:
+                h = estimate(neighbor)
+            heapq.heappush(open_list, (h * 2 + (offset != straight), neighbor))
+
+    if track:
+        # in_open never lets a cell be queued twice; every queued cell is
+        # either closed or still flagged in_open
+        expanded = closed.count(1)
+        _record(stats, expanded, expanded + in_open.count(1), 0, peak_open)
+    return path
+
+
+# Names the game scripts use for search_algorithm
+SEARCH_ALGORITHMS = {
+    "A*": a_star_search,
+    "A* Bucket": a_star_bucket_search,
+    "JPS": jump_point_search,
+    "DFS": dfs_search,
+    "BFS": bfs_search,
+    "Bidirectional A*": bidirectional_a_star_search,
+    "Bidirectional BFS": bidirectional_bfs_search,
+    "GBFS": greedy_best_first_search,
+}
@@ -0,0 +1,151 @@
+from array import array
+
+# Hamiltonian-cycle agent with shortcuts.
+#
+# The cycle is built once with spanning-tree circumnavigation: the free area
+# is cut into 2x2 blocks, a spanning tree joins the blocks that have no wall
+# in them, and the loop around that tree visits every cell of those blocks
+# exactly once. Blocks holding an obstacle are left out, so a few free cells
+# next to obstacles are not on the cycle (see uncovered).
+#
+# While the body lies in cycle order from tail to head, every cell between
+# the head and the tail along the cycle is free. The agent may therefore
+# jump ahead to any neighbor that does not pass the tail (or the food), which
+# is one index comparison per neighbor instead of a search.
+
+# Shortcuts stop once the snake covers this share of the cycle; from then on
+# it only follows the cycle
+SHORTCUT_LIMIT = 0.5
+
+OFF_CYCLE = -1
+
+
+class HamiltonianCycle:
+    def __init__(self, grid):
+        self.grid = grid
+        self.order = []  # Cell indices in cycle order
+        self.index = array("i", [OFF_CYCLE]) * grid.size  # Cell index -> position on the cycle
+
+        # Try the four 2x2 alignments and keep the one that covers most cells
+        best = []
+        for offset_x in (0, 1):
+            for offset_y in (0, 1):
+                blocks = self._largest_component(offset_x, offset_y)
+                if len(blocks) > len(best):
+                    best, origin = blocks, (offset_x, offset_y)
+        if best:
+            self._build(best, origin)
+
+        for position, cell in enumerate(self.order):
+            self.index[cell] = position
+        self.length = len(self.order)
+        self.uncovered = [(x, y) for y in range(grid.height) for x in range(grid.width)
+                          if not grid.is_blocked((x, y)) and self.index[grid.index((x, y))] == OFF_CYCLE]
+
+    # Grid positions of the four cells of block (bx, by): TL, TR, BR, BL
+    def _corners(self, block, origin):
+        x = origin[0] + 2 * block[0]
+        y = origin[1] + 2 * block[1]
+        return [(x, y), (x + 1, y), (x + 1, y + 1), (x, y + 1)]
+
+    def _largest_component(self, offset_x, offset_y):
+        grid = self.grid
+        origin = (offset_x, offset_y)
+        free = set()
+        for by in range((grid.height - offset_y) // 2):
+            for bx in range((grid.width - offset_x) // 2):
+                if not any(grid.is_blocked(pos) for pos in self._corners((bx, by), origin)):
+                    free.add((bx, by))
+
+        best = []
+        seen = set()
+        for root in sorted(free):
+            if root in seen:
+                continue
+            seen.add(root)
+            component = [root]
+            for bx, by in component:
+                for neighbor in ((bx, by + 1), (bx, by - 1), (bx + 1, by), (bx - 1, by)):
+                    if neighbor in free and neighbor not in seen:
+                        seen.add(neighbor)
+                        component.append(neighbor)
+            if len(component) > len(best):
+                best = component
+        return best
+
+    def _build(self, blocks, origin):
+        grid = self.grid
+        successor = {}
+
+        # Every block starts as its own clockwise loop TL -> TR -> BR -> BL
+        for block in blocks:
+            corners = [grid.index(pos) for pos in self._corners(block, origin)]
+            for i in range(4):
+                successor[corners[i]] = corners[(i + 1) % 4]
+
+        # blocks is in BFS order, so every block after the first has a
+        # neighbor placed before it; linking to it gives a spanning tree.
+        # Each tree edge splices two loops into one across the shared side.
+        placed = {blocks[0]}
+        for block in blocks[1:]:
+            bx, by = block
+            for parent in ((bx - 1, by), (bx + 1, by), (bx, by - 1), (bx, by + 1)):
+                if parent in placed:
+                    break
+            placed.add(block)
+
+            first, second = sorted((parent, block))
+            tl_a, tr_a, br_a, bl_a = [grid.index(pos) for pos in self._corners(first, origin)]
+            tl_b, tr_b, br_b, bl_b = [grid.index(pos) for pos in self._corners(second, origin)]
+            if first[1] == second[1]:
+                # Side by side: TR_a -> BR_a and BL_b -> TL_b become cross links
+                successor[tr_a] = tl_b
+                successor[bl_b] = br_a
+            else:
+                # Stacked: BR_a -> BL_a and TL_b -> TR_b become cross links
+                successor[br_a] = tr_b
+                successor[tl_b] = bl_a
+
+        start = grid.index(self._corners(blocks[0], origin)[0])
+        cell = start
+        while True:
+            self.order.append(cell)
+            cell = successor[cell]
+            if cell == start:
+                break
+
+    def on_cycle(self, pos):
+        return self.grid.in_bounds(pos) and self.index[self.grid.index(pos)] != OFF_CYCLE
+
+    # Steps from a to b going forward along the cycle
+    def gap(self, a, b):
+        return (self.index[b] - self.index[a]) % self.length
+
+    # Next cell for the snake's head, or None if the head is off the cycle
+    def next_step(self, snake, food=None):
+        grid = self.grid
+        index = self.index
+        head = grid.index(snake[0])
+        if index[head] == OFF_CYCLE:
+            return None
+
+        step = self.order[(index[head] + 1) % self.length]
+        if len(snake) >= self.length * SHORTCUT_LIMIT:
+            return grid.position(step)
+
+        tail = grid.index(snake[-1])
+        limit = self.gap(head, tail) if index[tail] != OFF_CYCLE else 0
+        if not limit:
+            limit = self.length
+        if food is not None and self.on_cycle(food):
+            limit = min(limit, self.gap(head, grid.index(food)) + 1)
+
+        # Largest jump that stays short of the tail and does not pass the food
+        best = 1
+        for offset in grid.offsets:
+            neighbor = head + offset
+            if index[neighbor] != OFF_CYCLE:
+                jump = self.gap(head, neighbor)
+                if best < jump < limit:
+                    best, step = jump, neighbor
+        return grid.position(step)
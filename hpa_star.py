@@ -0,0 +1,277 @@
+from collections import deque
+import heapq
+
+from grid_engine import _record, manhattan
+
+# Hierarchical pathfinding (HPA*) for large maps.
+#
+# The grid is cut into square sectors. Wherever two neighboring sectors share
+# an open stretch of border, one or two entrances are placed on it, giving a
+# pair of abstract nodes (one cell on each side, joined by a step of cost 1).
+# Inside each sector the distances between its abstract nodes are cached.
+# A query links the start and goal into the abstract graph, runs A* over it
+# and then refines each abstract edge with a search that stays inside one
+# sector. Paths are near-optimal, not guaranteed optimal.
+#
+# When walls change, only the touched sector and its neighbors are rebuilt.
+
+# Open border runs at least this long get an entrance at each end
+LONG_ENTRANCE = 6
+
+
+class HierarchicalMap:
+    def __init__(self, grid, sector_size=16):
+        self.grid = grid
+        self.sector_size = sector_size
+        self.sectors_x = -(-grid.width // sector_size)
+        self.sectors_y = -(-grid.height // sector_size)
+
+        self.borders = {}  # (sector, neighbor sector) -> [(cell, cell on the other side)]
+        self.nodes = {}  # sector -> set of abstract node cells
+        self.intra = {}  # sector -> {node: {node: distance inside the sector}}
+        self.inter = {}  # node -> set of nodes one step away in the next sector
+        self.dirty = set()
+
+        for sector in range(self.sectors_x * self.sectors_y):
+            for neighbor in self._forward_neighbors(sector):
+                self._build_border(sector, neighbor)
+        for sector in range(self.sectors_x * self.sectors_y):
+            self._build_sector(sector)
+
+    def sector_of(self, cell):
+        y, x = divmod(cell, self.grid.stride)
+        return ((y - 1) // self.sector_size) * self.sectors_x + (x - 1) // self.sector_size
+
+    # Sector bounds as (x0, y0, x1, y1) in grid coordinates, upper bounds excluded
+    def bounds(self, sector):
+        sy, sx = divmod(sector, self.sectors_x)
+        size = self.sector_size
+        return (sx * size, sy * size,
+                min((sx + 1) * size, self.grid.width), min((sy + 1) * size, self.grid.height))
+
+    # Right and lower neighbor sectors, so every border is visited once
+    def _forward_neighbors(self, sector):
+        sy, sx = divmod(sector, self.sectors_x)
+        if sx + 1 < self.sectors_x:
+            yield sector + 1
+        if sy + 1 < self.sectors_y:
+            yield sector + self.sectors_x
+
+    def _all_neighbors(self, sector):
+        sy, sx = divmod(sector, self.sectors_x)
+        if sx > 0:
+            yield sector - 1
+        if sx + 1 < self.sectors_x:
+            yield sector + 1
+        if sy > 0:
+            yield sector - self.sectors_x
+        if sy + 1 < self.sectors_y:
+            yield sector + self.sectors_x
+
+    def _build_border(self, sector, neighbor):
+        grid = self.grid
+        cells = grid.cells
+        x0, y0, x1, y1 = self.bounds(sector)
+        if neighbor == sector + self.sectors_x:
+            # Horizontal border: last row of sector against the next row
+            pairs = [(grid.index((x, y1 - 1)), grid.index((x, y1))) for x in range(x0, x1)]
+        else:
+            # Vertical border: last column of sector against the next column
+            pairs = [(grid.index((x1 - 1, y)), grid.index((x1, y))) for y in range(y0, y1)]
+
+        transitions = []
+        run = []
+        for pair in pairs + [None]:
+            if pair is not None and not cells[pair[0]] and not cells[pair[1]]:
+                run.append(pair)
+                continue
+            if run:
+                if len(run) >= LONG_ENTRANCE:
+                    transitions += [run[0], run[-1]]
+                else:
+                    transitions.append(run[len(run) // 2])
+                run = []
+
+        for inside, outside in self.borders.get((sector, neighbor), ()):
+            self.inter[inside].discard(outside)
+            self.inter[outside].discard(inside)
+        for inside, outside in transitions:
+            self.inter.setdefault(inside, set()).add(outside)
+            self.inter.setdefault(outside, set()).add(inside)
+        self.borders[(sector, neighbor)] = transitions
+
+    def _build_sector(self, sector):
+        nodes = set()
+        for neighbor in self._all_neighbors(sector):
+            if neighbor > sector:
+                nodes.update(inside for inside, _ in self.borders[(sector, neighbor)])
+            else:
+                nodes.update(outside for _, outside in self.borders[(neighbor, sector)])
+        self.nodes[sector] = nodes
+
+        # Cache the distance between every pair of abstract nodes in the sector
+        table = {}
+        for node in nodes:
+            distances, _ = self._sector_bfs(node, sector)
+            table[node] = {other: distances[other] for other in nodes if other != node and other in distances}
+        self.intra[sector] = table
+
+    # BFS from cell that never leaves the sector; returns (distances, parents)
+    def _sector_bfs(self, cell, sector, target=None):
+        grid = self.grid
+        cells = grid.cells
+        offsets = grid.offsets
+        stride = grid.stride
+        x0, y0, x1, y1 = self.bounds(sector)
+        distances = {cell: 0}
+        parents = {cell: -1}
+        queue = deque([cell])
+        while queue:
+            current = queue.popleft()
+            if current == target:
+                break
+            for offset in offsets:
+                neighbor = current + offset
+                if cells[neighbor] or neighbor in distances:
+                    continue
+                y, x = divmod(neighbor, stride)
+                if x0 < x <= x1 and y0 < y <= y1:
+                    distances[neighbor] = distances[current] + 1
+                    parents[neighbor] = current
+                    queue.append(neighbor)
+        return distances, parents
+
+    # Change a wall and mark the sectors whose abstraction it touches
+    def set_blocked(self, pos, blocked=True):
+        self.grid.set_blocked(pos, blocked)
+        sector = self.sector_of(self.grid.index(pos))
+        self.dirty.add(sector)
+
+    # Rebuild the borders and distance caches around every dirty sector
+    def update(self):
+        if not self.dirty:
+            return
+        touched = set()
+        for sector in self.dirty:
+            touched.add(sector)
+            for neighbor in self._all_neighbors(sector):
+                touched.add(neighbor)
+                if neighbor > sector:
+                    self._build_border(sector, neighbor)
+                else:
+                    self._build_border(neighbor, sector)
+        for sector in touched:
+            self._build_sector(sector)
+        self.dirty = set()
+
+    def find_path(self, start, goal, stats=None):
+        grid = self.grid
+        if goal is None or not grid.in_bounds(start) or not grid.in_bounds(goal):
+            return None
+        self.update()
+
+        start_index, goal_index = grid.index(start), grid.index(goal)
+        if start_index == goal_index:
+            if stats is not None:
+                _record(stats, 0, 0, 0, 0)
+            return []
+        if grid.cells[goal_index]:
+            return None
+        start_sector = self.sector_of(start_index)
+        goal_sector = self.sector_of(goal_index)
+
+        # Same sector: a local search usually settles it without the graph,
+        # and the stats, which count abstract nodes, stay at zero
+        if start_sector == goal_sector:
+            local = self._refine(start_index, goal_index, start_sector)
+            if local is not None:
+                if stats is not None:
+                    _record(stats, 0, 0, 0, 0)
+                return self._positions(local)
+
+        # Link start and goal to the abstract nodes of their sectors
+        start_distances, _ = self._sector_bfs(start_index, start_sector)
+        start_edges = {node: start_distances[node] for node in self.nodes[start_sector] if node in start_distances}
+        goal_distances, _ = self._sector_bfs(goal_index, goal_sector)
+        goal_edges = {node: goal_distances[node] for node in self.nodes[goal_sector] if node in goal_distances}
+
+        abstract = self._abstract_search(start_index, goal_index, start_edges, goal_edges, stats)
+        if abstract is None:
+            return None
+
+        # Refine each abstract edge inside the sector that owns it
+        path = []
+        for a, b in zip(abstract, abstract[1:]):
+            if b in self.inter.get(a, ()) and self.sector_of(a) != self.sector_of(b):
+                path.append(b)
+                continue
+            segment = self._refine(a, b, self.sector_of(a))
+            if segment is None:
+                return None
+            path.extend(segment)
+        return self._positions(path)
+
+    # A* over the abstract nodes; fills stats as the grid_engine searches do
+    def _abstract_search(self, start, goal, start_edges, goal_edges, stats):
+        stride = self.grid.stride
+        g_score = {start: 0}
+        parent = {}
+        closed = set()
+        open_list = [(manhattan(stride, start, goal), start)]
+        abstract = None
+        track = stats is not None
+        duplicates = peak_open = 0
+
+        while open_list:
+            if track and len(open_list) > peak_open:
+                peak_open = len(open_list)
+            _, current = heapq.heappop(open_list)
+            if current in closed:
+                continue
+            if current == goal:
+                abstract = [current]
+                while current in parent:
+                    current = parent[current]
+                    abstract.append(current)
+                abstract.reverse()
+                break
+            closed.add(current)
+
+            if current == start:
+                edges = list(start_edges.items())
+            else:
+                edges = list(self.intra[self.sector_of(current)].get(current, {}).items())
+            edges += [(other, 1) for other in self.inter.get(current, ())]
+            if current in goal_edges:
+                edges.append((goal, goal_edges[current]))
+
+            for neighbor, cost in edges:
+                if neighbor in closed:
+                    continue
+                tentative_g_score = g_score[current] + cost
+                if tentative_g_score < g_score.get(neighbor, tentative_g_score + 1):
+                    if neighbor in g_score:
+                        duplicates += 1
+                    g_score[neighbor] = tentative_g_score
+                    parent[neighbor] = current
+                    heapq.heappush(open_list, (tentative_g_score + manhattan(stride, neighbor, goal), neighbor))
+
+        if track:
+            _record(stats, len(closed), len(g_score) + duplicates, duplicates, peak_open)
+        return abstract
+
+    # Cells from a (excluded) to b (included), staying inside sector
+    def _refine(self, a, b, sector):
+        _, parents = self._sector_bfs(a, sector, target=b)
+        if b not in parents:
+            return None
+        segment = []
+        current = b
+        while current != a:
+            segment.append(current)
+            current = parents[current]
+        segment.reverse()
+        return segment
+
+    def _positions(self, cells):
+        return [self.grid.position(cell) for cell in cells]
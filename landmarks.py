@@ -0,0 +1,86 @@
+from array import array
+from collections import deque
+
+# ALT (A*, Landmarks, Triangle inequality) heuristic for static layouts.
+#
+# A few landmark cells are picked far apart, and the exact BFS distance from
+# each of them to every cell is stored once. For any landmark L the triangle
+# inequality gives |d(L, goal) - d(L, cell)| <= d(cell, goal), so the largest
+# of those bounds (and Manhattan) is still admissible and consistent, but it
+# sees walls that Manhattan ignores. The tables assume the grid's walls do
+# not change; build a new LandmarkHeuristic if they do.
+
+UNREACHABLE = -1
+
+
+# Exact BFS distance from cell to every cell of the grid
+def distances_from(grid, cell):
+    cells = grid.cells
+    offsets = grid.offsets
+    distances = array("i", [UNREACHABLE]) * grid.size
+    distances[cell] = 0
+    queue = deque([cell])
+    while queue:
+        current = queue.popleft()
+        distance = distances[current] + 1
+        for offset in offsets:
+            neighbor = current + offset
+            if not cells[neighbor] and distances[neighbor] == UNREACHABLE:
+                distances[neighbor] = distance
+                queue.append(neighbor)
+    return distances
+
+
+class LandmarkHeuristic:
+    def __init__(self, grid, count=4):
+        self.grid = grid
+        self.landmarks = []
+        self.tables = []
+
+        free = [i for i in range(grid.size) if not grid.cells[i]]
+        if not free:
+            return
+
+        # Farthest-point selection: start from the cell farthest from an
+        # arbitrary free cell, then keep adding the cell farthest from every
+        # landmark picked so far
+        nearest = distances_from(grid, free[0])
+        for _ in range(count):
+            landmark = max(free, key=nearest.__getitem__)
+            if nearest[landmark] <= 0 and self.landmarks:
+                break
+            table = distances_from(grid, landmark)
+            self.landmarks.append(landmark)
+            self.tables.append(table)
+            if len(self.landmarks) == 1:
+                nearest = table
+            else:
+                nearest = array("i", map(_closer, nearest, table))
+
+    # Heuristic h(cell) toward one goal cell index, for a_star_search and
+    # greedy_best_first_search
+    def for_goal(self, goal):
+        stride = self.grid.stride
+        goal_y, goal_x = divmod(goal, stride)
+        pairs = [(table, table[goal]) for table in self.tables if table[goal] != UNREACHABLE]
+
+        def estimate(cell):
+            y, x = divmod(cell, stride)
+            best = abs(x - goal_x) + abs(y - goal_y)
+            for table, to_goal in pairs:
+                to_cell = table[cell]
+                if to_cell != UNREACHABLE:
+                    bound = to_goal - to_cell if to_goal > to_cell else to_cell - to_goal
+                    if bound > best:
+                        best = bound
+            return best
+
+        return estimate
+
+
+def _closer(a, b):
+    if a == UNREACHABLE:
+        return b
+    if b == UNREACHABLE:
+        return a
+    return a if a < b else b
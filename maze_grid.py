@@ -0,0 +1,105 @@
+# Shared grid and node types for maze_world.py, trial.py and maze_solving.py.
+#
+# The searches in those files compare and hash nodes (visited sets,
+# came_from dicts, closed lists). Node compares by position, and each grid
+# hands out one Node per cell, created the first time the cell is asked
+# for, so every search over that grid sees the same objects.
+#
+# The grid also keeps a table of each cell's free neighbors, so searches
+# iterate a ready-made row instead of re-checking bounds and walls. A row
+# is built the first time it is asked for; writing a wall drops the rows
+# of the four cells around it, and only those.
+
+
+class Node:
+    __slots__ = ("x", "y", "parent", "g", "h")
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        self.parent = None
+        self.g = 0
+        self.h = 0
+
+    def __lt__(self, other):
+        return (self.g + self.h) < (other.g + other.h)
+
+    def __eq__(self, other):
+        return isinstance(other, Node) and self.x == other.x and self.y == other.y
+
+    def __hash__(self):
+        return hash((self.x, self.y))
+
+    def __repr__(self):
+        return f"Node({self.x}, {self.y})"
+
+
+# One column of a MazeGrid; writes go through to the neighbor table
+class _Column(list):
+    def __init__(self, grid, x, cells):
+        super().__init__(cells)
+        self.grid = grid
+        self.x = x
+
+    def __setitem__(self, y, value):
+        if bool(value) != bool(self[y]):
+            self.grid._wall_changed(self.x, y)
+        super().__setitem__(y, value)
+
+
+# A list of columns, so grid[x][y] reads and writes walls as before, that
+# also owns the node pool and neighbor table for its cells
+class MazeGrid(list):
+    def __init__(self, width, height):
+        super().__init__(_Column(self, x, [0] * height) for x in range(width))
+        self.width = width
+        self.height = height
+        self.nodes = [[None] * height for _ in range(width)]
+        self.created = []
+        self.rows = [[None] * height for _ in range(width)]  # Free neighbors per cell, None until built
+
+    # The one Node for cell (x, y)
+    def node(self, x, y):
+        node = self.nodes[x][y]
+        if node is None:
+            node = self.nodes[x][y] = Node(x, y)
+            self.created.append(node)
+        return node
+
+    # Free neighbors of node, in the order x-1, x+1, y-1, y+1
+    def neighbors(self, node):
+        row = self.rows[node.x][node.y]
+        if row is None:
+            row = self._build_row(node.x, node.y)
+        return row
+
+    def _build_row(self, x, y):
+        row = []
+        if x > 0 and not self[x - 1][y]:
+            row.append(self.node(x - 1, y))
+        if x < self.width - 1 and not self[x + 1][y]:
+            row.append(self.node(x + 1, y))
+        if y > 0 and not self[x][y - 1]:
+            row.append(self.node(x, y - 1))
+        if y < self.height - 1 and not self[x][y + 1]:
+            row.append(self.node(x, y + 1))
+        row = self.rows[x][y] = tuple(row)
+        return row
+
+    # A cell turned into a wall or back: only the rows that list it change
+    def _wall_changed(self, x, y):
+        if x > 0:
+            self.rows[x - 1][y] = None
+        if x < self.width - 1:
+            self.rows[x + 1][y] = None
+        if y > 0:
+            self.rows[x][y - 1] = None
+        if y < self.height - 1:
+            self.rows[x][y + 1] = None
+
+    # Clear the search state (parent, g, h) left on the nodes by earlier searches
+    def reset_nodes(self):
+        for node in self.created:
+            node.parent = None
+            node.g = 0
+            node.h = 0
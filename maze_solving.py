@@ -1,6 +1,9 @@
-from collections import deque
+from array import array
+from collections import OrderedDict, deque
 import pygame
 import heapq
+from grid_engine import _record
+from maze_grid import MazeGrid
 
 # Initialize Pygame
 pygame.init()
@@ -15,29 +18,26 @@ RED = (255, 0, 0)
 GRID_SIZE = 40
 GRID_WIDTH = 15
 GRID_HEIGHT = 10
-
-# Define classes
-class Node:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.parent = None
-        self.g = 0
-        self.h = 0
-
-    def __lt__(self, other):
-        return (self.g + self.h) < (other.g + other.h)
+TRANSPOSITION_TABLE_SIZE = 1 << 16  # Cells IDA* remembers between re-visits; least recently used ones are evicted
 
 # Implement the A* search algorithm
-def astar_search(grid, start, goal):
+#
+# astar_search, bfs_search and greedy_best_first_search take an optional
+# stats dict and fill it with the grid_engine counts (see _record there)
+def astar_search(grid, start, goal, stats=None):
     open_list = []
     closed_list = set()
     heapq.heappush(open_list, (0, start))
     came_from = {}
-    g_score = {(node.x, node.y): float('inf') for row in grid for node in row}
+    g_score = {(x, y): float('inf') for x in range(grid.width) for y in range(grid.height)}
     g_score[(start.x, start.y)] = 0
+    path = None
+    track = stats is not None
+    expanded = pushes = duplicates = peak_open = 0
 
     while open_list:
+        if track and len(open_list) > peak_open:
+            peak_open = len(open_list)
         _, current = heapq.heappop(open_list)
 
         if (current.x, current.y) == (goal.x, goal.y):
@@ -45,29 +45,42 @@ def astar_search(grid, start, goal):
             while (current.x, current.y) in came_from:
                 path.append(current)
                 current = came_from[(current.x, current.y)]
-            return path
+            break
 
         closed_list.add((current.x, current.y))
+        expanded += 1  # Stale entries are expanded again, so closed_list undercounts
 
-        for neighbor in get_neighbors(grid, current):
+        for neighbor in grid.neighbors(current):
             neighbor_x, neighbor_y = neighbor.x, neighbor.y
             if (neighbor_x, neighbor_y) in closed_list:
                 continue
 
             tentative_g_score = g_score[(current.x, current.y)] + 1
             if tentative_g_score < g_score[(neighbor_x, neighbor_y)]:
+                # A finite g_score means the cell is already queued
+                if g_score[(neighbor_x, neighbor_y)] != float('inf'):
+                    duplicates += 1
                 came_from[(neighbor_x, neighbor_y)] = current
                 g_score[(neighbor_x, neighbor_y)] = tentative_g_score
                 f_score = tentative_g_score + heuristic(neighbor, goal)
                 heapq.heappush(open_list, (f_score, neighbor))
-
-    return None
-def bfs_search(grid, start, goal):
-    visited = set()
+                pushes += 1
+
+    if track:
+        _record(stats, expanded, 1 + pushes, duplicates, peak_open)
+    return path
+def bfs_search(grid, start, goal, stats=None):
+    grid.reset_nodes()
+    visited = {start}
     queue = deque()
     queue.append(start)
+    path = None
+    track = stats is not None
+    peak_open = 0
 
     while queue:
+        if track and len(queue) > peak_open:
+            peak_open = len(queue)
         current = queue.popleft()
 
         if current == goal:
@@ -76,38 +89,110 @@ def bfs_search(grid, start, goal):
                 path.append(current)
                 current = current.parent
             path.append(start)  # Add the start node
-            return path[::-1]
+            path = path[::-1]
+            break
 
-        for neighbor in get_neighbors(grid, current):
+        for neighbor in grid.neighbors(current):
             if neighbor not in visited:
+                visited.add(neighbor)
                 neighbor.parent = current
                 queue.append(neighbor)
 
-    return None
-
-
-def dfs_search(grid, current, goal, visited):
+    if track:
+        # Every visited cell was queued once; the ones still queued, and a
+        # goal that was found, were never expanded
+        _record(stats, len(visited) - len(queue) - (path is not None), len(visited), 0, peak_open)
+    return path
+
+
+# Depth-first search with an explicit stack, so large mazes cannot hit the
+# recursion limit. Cells are numbered x * height + y, like grid[x][y]. One
+# byte per cell records whether it was visited and how many of its
+# neighbors (x-1, x+1, y-1, y+1) were tried, and the stack is the path
+# itself, so memory stays at a few bytes per cell. visited, if given, marks
+# cells to treat as already seen. Returns the path from current to goal,
+# both included, or None. stats, given, gets the grid_engine counts (see
+# _record there), read off the tried bytes once the search is done.
+def dfs_search(grid, current, goal, visited=None, stats=None):
     if (current.x, current.y) == (goal.x, goal.y):
+        if stats is not None:
+            _record(stats, 0, 1, 0, 0)
         return [current]
 
-    visited[current.x][current.y] = True
-
-    for neighbor in get_neighbors(grid, current):
-        neighbor_x, neighbor_y = neighbor.x, neighbor.y
-        if not visited[neighbor_x][neighbor_y] and grid[neighbor_x][neighbor_y] == 0:
-            path = dfs_search(grid, neighbor, goal, visited)
-            if path:
-                return [current] + path
-
-    return None
-
-def greedy_best_first_search(grid, start, goal):
+    width, height = len(grid), len(grid[0])
+    tried = bytearray(width * height)  # 0: unvisited, else 1 + neighbors tried
+    if visited is not None:
+        for x in range(width):
+            for y in range(height):
+                if visited[x][y]:
+                    tried[x * height + y] = 1
+    goal_cell = goal.x * height + goal.y
+    start_cell = current.x * height + current.y
+    track = stats is not None
+    if track:
+        seen = tried.count(1) - tried[start_cell]
+    tried[start_cell] = 1
+    stack = array("i", [start_cell])
+    path = None
+    peak_open = 0
+
+    while stack:
+        if track and len(stack) > peak_open:
+            peak_open = len(stack)
+        cell = stack[-1]
+        direction = tried[cell] - 1
+        if direction == 4:
+            stack.pop()
+            continue
+        tried[cell] += 1
+
+        x, y = divmod(cell, height)
+        if direction == 0:
+            if x == 0:
+                continue
+            neighbor = cell - height
+        elif direction == 1:
+            if x == width - 1:
+                continue
+            neighbor = cell + height
+        elif direction == 2:
+            if y == 0:
+                continue
+            neighbor = cell - 1
+        else:
+            if y == height - 1:
+                continue
+            neighbor = cell + 1
+        if tried[neighbor] or grid[neighbor // height][neighbor % height]:
+            continue
+
+        if neighbor == goal_cell:
+            stack.append(neighbor)
+            path = [current] + [grid.node(*divmod(cell, height)) for cell in stack[1:]]
+            break
+        tried[neighbor] = 1
+        stack.append(neighbor)
+
+    if track:
+        # Every pushed cell was marked and then tried a neighbor on top of
+        # the stack, except the goal, which is pushed unmarked
+        expanded = len(tried) - tried.count(0) - tried.count(1)
+        generated = len(tried) - tried.count(0) - seen + (path is not None)
+        _record(stats, expanded, generated, 0, peak_open)
+    return path
+
+def greedy_best_first_search(grid, start, goal, stats=None):
     open_list = []
     closed_list = set()
     heapq.heappush(open_list, goal)  # Start with the goal as the initial node
     came_from = {}
+    path = None
+    track = stats is not None
+    expanded = pushes = duplicates = peak_open = 0
 
     while open_list:
+        if track and len(open_list) > peak_open:
+            peak_open = len(open_list)
         current = heapq.heappop(open_list)
 
         if (current.x, current.y) == (start.x, start.y):
@@ -115,69 +200,118 @@ def greedy_best_first_search(grid, start, goal):
             while (current.x, current.y) in came_from:
                 path.append(current)
                 current = came_from[(current.x, current.y)]
-            return path
+            break
 
         closed_list.add((current.x, current.y))
+        expanded += 1  # Cells queued twice are expanded twice
 
-        for neighbor in get_neighbors(grid, current):
+        for neighbor in grid.neighbors(current):
             neighbor_x, neighbor_y = neighbor.x, neighbor.y
             if (neighbor_x, neighbor_y) in closed_list:
                 continue
 
+            # An open cell with a came_from entry is already queued
+            if (neighbor_x, neighbor_y) in came_from:
+                duplicates += 1
             came_from[(neighbor_x, neighbor_y)] = current
             heapq.heappush(open_list, neighbor)
-
-    return None
-
-def iterative_deepening_search(grid, start, goal, max_depth):
-    for depth in range(max_depth):
-        result = depth_limited_search(grid, start, goal, depth)
-        if result is not None:
-            return result
-
-def depth_limited_search(grid, start, goal, depth):
-    if depth == 0:
-        if (start.x, start.y) == (goal.x, goal.y):
-            return [start]
-        else:
-            return None
-
-    if (start.x, start.y) == (goal.x, goal.y):
+            pushes += 1
+
+    if track:
+        _record(stats, expanded, 1 + pushes, duplicates, peak_open)
+    return path
+
+# IDA*: depth-first passes bounded by f = g + heuristic, each pass raising
+# the bound to the smallest f that went over it. Memory stays at the current
+# path plus a bounded transposition table of the lowest g each cell was
+# reached with, which stops the passes from re-expanding the same cell
+# through other paths. Returns the path from start to goal, both included.
+# stats, given, gets the grid_engine counts summed over every pass, with the
+# path as the open list; duplicates are cells pushed again after a pass or
+# a cheaper path had already stored them in the table.
+def ida_star_search(grid, start, goal, max_cost=None, table_size=TRANSPOSITION_TABLE_SIZE, stats=None):
+    if start == goal:
+        if stats is not None:
+            _record(stats, 0, 1, 0, 0)
         return [start]
 
-    for neighbor in get_neighbors(grid, start):
-        result = depth_limited_search(grid, neighbor, goal, depth - 1)
-        if result is not None:
-            return [start] + result
+    table = OrderedDict()  # node -> (lowest g, pass that stored it)
+    bound = heuristic(start, goal)
+    iteration = 0
+    found = None
+    track = stats is not None
+    expanded = duplicates = peak_open = 0
+    while found is None and (max_cost is None or bound <= max_cost):
+        iteration += 1
+        next_bound = None
+        path = [start]
+        on_path = {start}
+        stack = [iter(grid.neighbors(start))]
+        expanded += 1
+
+        while stack:
+            if track and len(path) > peak_open:
+                peak_open = len(path)
+            for node in stack[-1]:
+                if node in on_path:
+                    continue
+                g = len(path)
+
+                # Skip cells already reached as cheaply: in an earlier pass
+                # with a lower g, or in this pass with the same g. Checked
+                # before the bound so such cells never raise the next one,
+                # which lets a pass that finds nothing new end the search.
+                entry = table.get(node)
+                if entry is not None and (entry[0] < g or entry == (g, iteration)):
+                    continue
+                f = g + abs(node.x - goal.x) + abs(node.y - goal.y)
+                if f > bound:
+                    if next_bound is None or f < next_bound:
+                        next_bound = f
+                    continue
+                if entry is not None:
+                    duplicates += 1
+                table[node] = (g, iteration)
+                table.move_to_end(node)
+                if len(table) > table_size:
+                    table.popitem(last=False)
+
+                if node == goal:
+                    found = path + [goal]
+                    break
+                path.append(node)
+                on_path.add(node)
+                stack.append(iter(grid.neighbors(node)))
+                expanded += 1
+                break
+            else:
+                stack.pop()
+                on_path.discard(path.pop())
+            if found is not None:
+                break
+
+        if next_bound is None:
+            break
+        bound = next_bound
+
+    if track:
+        # Every cell pushed on the path is expanded; the goal is pushed only
+        _record(stats, expanded, expanded + (found is not None), duplicates, peak_open)
+    return found
 
 # Define heuristic function for A* search
 def heuristic(node, goal):
     return abs(node.x - goal.x) + abs(node.y - goal.y)
 
-# Implement get_neighbors function
-def get_neighbors(grid, node):
-    neighbors = []
-    # Define how neighbors are obtained based on game logic
-    # For example:
-    x, y = node.x, node.y
-    if x > 0 and not grid[x - 1][y]:
-        neighbors.append(Node(x - 1, y))
-    if x < GRID_WIDTH - 1 and not grid[x + 1][y]:
-        neighbors.append(Node(x + 1, y))
-    if y > 0 and not grid[x][y - 1]:
-        neighbors.append(Node(x, y - 1))
-    if y < GRID_HEIGHT - 1 and not grid[x][y + 1]:
-        neighbors.append(Node(x, y + 1))
-    return neighbors
 
 # Initialize the game window
 screen = pygame.display.set_mode((GRID_SIZE * GRID_WIDTH, GRID_SIZE * GRID_HEIGHT))
 pygame.display.set_caption("A* Search Maze Solver")
 
 # Create the grid with obstacles, start, and goal
-grid = [[0 for _ in range(GRID_HEIGHT)] for _ in range(GRID_WIDTH)]
-start = Node(1, 1)
-goal = Node(13, 8)
+grid = MazeGrid(GRID_WIDTH, GRID_HEIGHT)
+start = grid.node(1, 1)
+goal = grid.node(13, 8)
 
 # Place obstacles in the grid (customize this as needed)
 # For example, block a specific grid cell:
@@ -185,17 +319,15 @@ goal = Node(13, 8)
 
 # Find the path using A* search
 path = astar_search(grid, start, goal)
-visited = [[False for _ in range(GRID_HEIGHT)] for _ in range(GRID_WIDTH)]
 
 # Find the path using DFS
-path = dfs_search(grid, start, goal, visited)
+path = dfs_search(grid, start, goal)
 
 # Find the path using Greedy Best-First Search
 path = greedy_best_first_search(grid, start, goal)
 
-# Find the path using Iterative Deepening Search
-max_depth = max(GRID_WIDTH, GRID_HEIGHT)
-path = iterative_deepening_search(grid, start, goal, max_depth)
+# Find the path using IDA* (iterative deepening on the A* f-bound)
+path = ida_star_search(grid, start, goal)
 
 # Main game loop
 running = True
@@ -1,6 +1,7 @@
-import pygame
 import random
 import heapq
+from grid_engine import _record
+from maze_grid import MazeGrid
 
 # Define colors
 WHITE = (255, 255, 255)
@@ -12,44 +13,30 @@ RED = (255, 0, 0)
 GRID_SIZE = 30
 GRID_WIDTH = 20
 GRID_HEIGHT = 15
-
-# Define classes
-class Node:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.parent = None
-        self.g = 0
-        self.h = 0
-
-    def __lt__(self, other):
-        return (self.g + self.h) < (other.g + other.h)
+MAZE_SEED = None  # Seed for the maze walls; None draws a new one (printed at the start)
+MAZE_DENSITY = 0.3  # Share of cells generate_maze turns into walls
 
 def heuristic(node, goal):
     return abs(node.x - goal.x) + abs(node.y - goal.y)
 
-def get_neighbors(grid, node):
-    neighbors = []
-    if node.x > 0 and not grid[node.x - 1][node.y]:
-        neighbors.append(Node(node.x - 1, node.y))
-    if node.x < GRID_WIDTH - 1 and not grid[node.x + 1][node.y]:
-        neighbors.append(Node(node.x + 1, node.y))
-    if node.y > 0 and not grid[node.x][node.y - 1]:
-        neighbors.append(Node(node.x, node.y - 1))
-    if node.y < GRID_HEIGHT - 1 and not grid[node.x][node.y + 1]:
-        neighbors.append(Node(node.x, node.y + 1))
-    return neighbors
-
 
+# Each search takes an optional stats dict and fills it with the same counts
+# as the grid_engine searches (see _record there)
 
-def astar_search(grid, start, goal):
+def astar_search(grid, start, goal, stats=None):
+    grid.reset_nodes()
     open_list = []
-    closed_list = []
+    closed_list = set()
 
     heapq.heappush(open_list, (0, start))
     came_from = {}
+    path = None
+    track = stats is not None
+    expanded = duplicates = peak_open = 0
 
     while open_list:
+        if track and len(open_list) > peak_open:
+            peak_open = len(open_list)
         _, current = heapq.heappop(open_list)
 
         if current == goal:
@@ -59,32 +46,44 @@ def astar_search(grid, start, goal):
                 current = came_from[current]
             path.append(start)
             path.reverse()
-            return path
+            break
 
-        closed_list.append(current)
+        closed_list.add(current)
+        expanded += 1  # Stale entries are expanded again, so closed_list undercounts
 
-        for neighbor in get_neighbors(grid, current):
+        for neighbor in grid.neighbors(current):
             if neighbor in closed_list:
                 continue
             tentative_g = current.g + 1
 
-            if neighbor not in [n[1] for n in open_list] or tentative_g < neighbor.g:
+            queued = neighbor in [n[1] for n in open_list]
+            if not queued or tentative_g < neighbor.g:
+                if queued:
+                    duplicates += 1
                 neighbor.g = tentative_g
                 neighbor.h = heuristic(neighbor, goal)
                 came_from[neighbor] = current
                 heapq.heappush(open_list, (neighbor.g + neighbor.h, neighbor))
 
-    return None
+    if track:
+        # The start, the first push of every cell in came_from, and the re-pushes
+        _record(stats, expanded, 1 + len(came_from) + duplicates, duplicates, peak_open)
+    return path
 
 
 
 
-def breadth_first_search(grid, start, goal):
+def breadth_first_search(grid, start, goal, stats=None):
     # Implementation of BFS
     open_list = [start]
     came_from = {start: None}
+    path = None
+    track = stats is not None
+    peak_open = 0
 
     while open_list:
+        if track and len(open_list) > peak_open:
+            peak_open = len(open_list)
         current = open_list.pop(0)
 
         if current == goal:
@@ -93,24 +92,38 @@ def breadth_first_search(grid, start, goal):
                 path.append(current)
                 current = came_from[current]
             path.reverse()
-            return path
+            break
 
-        for neighbor in get_neighbors(grid, current):
+        for neighbor in grid.neighbors(current):
             if neighbor not in came_from:
                 came_from[neighbor] = current
                 open_list.append(neighbor)
 
-    return None
+    if track:
+        # Every cell in came_from was queued once; the ones still queued,
+        # and a goal that was found, were never expanded
+        expanded = len(came_from) - len(open_list) - (path is not None)
+        _record(stats, expanded, len(came_from), 0, peak_open)
+    return path
 
 
-def depth_first_search(grid, start, goal):
+def depth_first_search(grid, start, goal, stats=None):
     # Implementation of DFS
 
+    grid.reset_nodes()
     stack = [start]
     visited = set()
+    path = None
+    track = stats is not None
+    generated = 1
+    duplicates = peak_open = 0
 
     while stack:
+        if track and len(stack) > peak_open:
+            peak_open = len(stack)
         current = stack.pop()
+        if current in visited:
+            continue
         visited.add(current)
 
         if current == goal:
@@ -119,22 +132,36 @@ def depth_first_search(grid, start, goal):
                 path.append(current)
                 current = current.parent
             path.append(start)
-            return path[::-1]
+            path = path[::-1]
+            break
 
-        for neighbor in get_neighbors(grid, current):
+        for neighbor in grid.neighbors(current):
             if neighbor not in visited:
+                # A parent on an unvisited cell means it is already on the stack
+                if neighbor.parent is not None:
+                    duplicates += 1
                 neighbor.parent = current
                 stack.append(neighbor)
+                generated += 1
 
-def greedy_best_first_search(grid, start, goal):
+    if track:
+        _record(stats, len(visited) - (path is not None), generated, duplicates, peak_open)
+    return path
+
+def greedy_best_first_search(grid, start, goal, stats=None):
     # Implementation of Greedy Best First search
     # ...
     open_list = []
-    closed_list = []
+    closed_list = set()
     heapq.heappush(open_list, (heuristic(start, goal), start))
     came_from = {}
+    path = None
+    track = stats is not None
+    peak_open = 0
 
     while open_list:
+        if track and len(open_list) > peak_open:
+            peak_open = len(open_list)
         _, current = heapq.heappop(open_list)
 
         if current == goal:
@@ -142,11 +169,11 @@ def greedy_best_first_search(grid, start, goal):
             while current in came_from:
                 path.append(current)
                 current = came_from[current]
-            return path
+            break
 
-        closed_list.append(current)
+        closed_list.add(current)
 
-        for neighbor in get_neighbors(grid, current):
+        for neighbor in grid.neighbors(current):
             if neighbor in closed_list:
                 continue
 
@@ -154,58 +181,73 @@ def greedy_best_first_search(grid, start, goal):
                 heapq.heappush(open_list, (heuristic(neighbor, goal), neighbor))
                 came_from[neighbor] = current
 
-    return None
+    if track:
+        # Queued cells are never pushed again, so each came_from entry is one push
+        _record(stats, len(closed_list), 1 + len(came_from), 0, peak_open)
+    return path
 
 
-# Initialize the game
-pygame.init()
-screen = pygame.display.set_mode((GRID_SIZE * GRID_WIDTH, GRID_SIZE * GRID_HEIGHT))
-pygame.display.set_caption("Maze World with Search Algorithms")
+# Generate the maze from rng, a random.Random, so a seed rebuilds it: each
+# cell becomes a wall with probability density
+def generate_maze(grid, rng, density=MAZE_DENSITY):
+    for x in range(grid.width):
+        for y in range(grid.height):
+            if rng.random() < density:
+                grid[x][y] = 1
 
-grid = [[0 for _ in range(GRID_HEIGHT)] for _ in range(GRID_WIDTH)]
-start = Node(2, 2)
-goal = Node(17, 12)
 
-# Generate the maze
-def generate_maze(grid):
-    for x in range(GRID_WIDTH):
-        for y in range(GRID_HEIGHT):
-            if random.random() < 0.3:
-                grid[x][y] = 1
+# The demo: draw a random maze and the four paths through it
+def main():
+    import pygame
+
+    # Initialize the game
+    pygame.init()
+    screen = pygame.display.set_mode((GRID_SIZE * GRID_WIDTH, GRID_SIZE * GRID_HEIGHT))
+    pygame.display.set_caption("Maze World with Search Algorithms")
+
+    grid = MazeGrid(GRID_WIDTH, GRID_HEIGHT)
+    start = grid.node(2, 2)
+    goal = grid.node(17, 12)
+
+    maze_seed = MAZE_SEED if MAZE_SEED is not None else random.getrandbits(63)
+    print(f"Maze seed: {maze_seed}")
+    generate_maze(grid, random.Random(maze_seed))
+
+    # Find the path using search algorithms
+    path_astar = astar_search(grid, start, goal)
+    path_bfs = breadth_first_search(grid, start, goal)
+    path_dfs = depth_first_search(grid, start, goal)
+    path_greedy = greedy_best_first_search(grid, start, goal)
+
+    # ... (previous code)
+
+    # Main loop
+    running = True
+    while running:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+
+        screen.fill(WHITE)
+
+        # Draw the grid
+        for x in range(GRID_WIDTH):
+            for y in range(GRID_HEIGHT):
+                color = GREEN if grid[x][y] == 0 else BLACK
+                pygame.draw.rect(screen, color, (x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE, GRID_SIZE))
+
+        # Draw the path for each algorithm
+        for path in [path_astar, path_bfs, path_dfs, path_greedy]:
+            if path:
+                for node in path:
+                    x, y = node.x, node.y
+                    pygame.draw.rect(screen, RED, (x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE, GRID_SIZE))
+
+        pygame.display.flip()
+        pygame.time.delay(100)
+    # Properly quit pygame
+    pygame.quit()
+
 
-generate_maze(grid)
-
-# Find the path using search algorithms
-path_astar = astar_search(grid, start, goal)
-path_bfs = breadth_first_search(grid, start, goal)
-path_dfs = depth_first_search(grid, start, goal)
-path_greedy = greedy_best_first_search(grid, start, goal)
-
-# ... (previous code)
-
-# Main loop
-running = True
-while running:
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-
-    screen.fill(WHITE)
-
-    # Draw the grid
-    for x in range(GRID_WIDTH):
-        for y in range(GRID_HEIGHT):
-            color = GREEN if grid[x][y] == 0 else BLACK
-            pygame.draw.rect(screen, color, (x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE, GRID_SIZE))
-
-    # Draw the path for each algorithm
-    for path in [path_astar, path_bfs, path_dfs, path_greedy]:
-        if path:
-            for node in path:
-                x, y = node.x, node.y
-                pygame.draw.rect(screen, RED, (x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE, GRID_SIZE))
-
-    pygame.display.flip()
-    pygame.time.delay(100)
-# Properly quit pygame
-pygame.quit()
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# Path reuse for the game loop.
+#
+# Instead of running a full search every tick and keeping only direction[0],
+# the follower keeps the planned route and a cursor into it. It searches
+# again only when the route goes stale: the search or the food changed, the
+# head is not where the route expects it, the route ran out, or the next
+# step is blocked or fails the safety check.
+
+
+class PathFollower:
+    def __init__(self, grid, is_safe=None):
+        self.grid = grid
+        self.is_safe = is_safe  # Optional extra check: is_safe(step, snake) -> bool
+        self.search = None
+        self.goal = None
+        self.path = None
+        self.cursor = 0
+
+        # Counters for comparing against one search per tick
+        self.searches_run = 0
+        self.searches_avoided = 0
+
+    # Next cell for the snake's head, or None if the goal is unreachable
+    def next_step(self, search, snake, goal, *args, **kwargs):
+        if self._is_stale(search, snake, goal):
+            self.search = search
+            self.goal = goal
+            self.path = search(self.grid, snake[0], goal, *args, **kwargs)
+            self.cursor = 0
+            self.searches_run += 1
+        else:
+            self.searches_avoided += 1
+
+        if not self.path or self.cursor >= len(self.path):
+            return None
+        step = self.path[self.cursor]
+        self.cursor += 1
+        return step
+
+    def _is_stale(self, search, snake, goal):
+        if search is not self.search or goal != self.goal or not self.path:
+            return True
+        if self.cursor >= len(self.path):
+            return True
+
+        # The head must sit on the cell the previous step led to
+        expected = self.path[self.cursor - 1] if self.cursor else None
+        if expected is not None and snake[0] != expected:
+            return True
+
+        step = self.path[self.cursor]
+        if self.grid.is_blocked(step) or step in snake[1:]:
+            return True
+        if self.is_safe is not None and not self.is_safe(step, snake):
+            return True
+        return False
+
+    def reset(self):
+        self.search = None
+        self.path = None
+        self.cursor = 0
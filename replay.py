@@ -0,0 +1,96 @@
+import struct
+import sys
+import time
+
+from snake_env import NO_MOVE, SnakeEnv
+
+# Compact binary replays of SnakeEnv games.
+#
+# A game is fully determined by its seed, its map and the moves made, so
+# that is all a replay stores:
+#   header  magic, version, seed, board size, start cell, food target,
+#           max steps (0 for none), then the obstacle cells and the extra
+#           cells food may not spawn on, each as a count and (x, y) pairs
+#   moves   one byte per step, the ACTIONS index or NO_MOVE, to the end
+#           of the file
+# All integers are little-endian. Replaying steps a fresh env through the
+# moves with no rendering, so a slow or crashing game can be rerun exactly.
+#
+# Usage: python replay.py game.snkr
+
+MAGIC = b"SNKR"
+VERSION = 1
+HEADER = struct.Struct("<4sBQHHHHII")
+COUNT = struct.Struct("<I")
+CELL = struct.Struct("<HH")
+
+
+def _pack_cells(cells):
+    cells = sorted(cells)
+    return COUNT.pack(len(cells)) + b"".join(CELL.pack(x, y) for x, y in cells)
+
+
+def _unpack_cells(data, offset):
+    count, = COUNT.unpack_from(data, offset)
+    offset += COUNT.size
+    cells = [CELL.unpack_from(data, offset + i * CELL.size) for i in range(count)]
+    return cells, offset + count * CELL.size
+
+
+# Write env's current game (its seed, map and moves so far) to path
+def save_replay(path, env):
+    header = HEADER.pack(MAGIC, VERSION, env.seed, env.width, env.height, env.start[0], env.start[1],
+                         env.food_target, env.max_steps or 0)
+    food_blocked = env.food_blocked - set(env.obstacles)
+    with open(path, "wb") as replay_file:
+        replay_file.write(header + _pack_cells(env.obstacles) + _pack_cells(food_blocked) + env.moves)
+
+
+# Read a replay; returns (env, moves) with env reset to the game's start.
+# Returns None if path is not a replay this version can read.
+def load_replay(path):
+    with open(path, "rb") as replay_file:
+        data = replay_file.read()
+    if len(data) < HEADER.size:
+        return None
+    magic, version, seed, width, height, start_x, start_y, food_target, max_steps = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        return None
+    obstacles, offset = _unpack_cells(data, HEADER.size)
+    food_blocked, offset = _unpack_cells(data, offset)
+
+    env = SnakeEnv(width, height, obstacles, food_blocked, food_target, max_steps or None, (start_x, start_y))
+    env.reset(seed)
+    return env, data[offset:]
+
+
+# Replay the game in path headless; returns the env at its last move, or
+# None if path is not a replay
+def play_replay(path):
+    loaded = load_replay(path)
+    if loaded is None:
+        return None
+    env, moves = loaded
+    step = env.step
+    for move in moves:
+        step(None if move == NO_MOVE else move)
+    return env
+
+
+def main(argv):
+    if not argv:
+        print("Usage: python replay.py game.snkr")
+        return 1
+    begin = time.perf_counter()
+    env = play_replay(argv[0])
+    elapsed = time.perf_counter() - begin
+    if env is None:
+        print(f"{argv[0]} is not a snake replay")
+        return 1
+    print(f"seed {env.seed}, {env.width}x{env.height} board, {len(env.moves)} moves replayed in {elapsed * 1000:.1f} ms")
+    print(f"outcome: {env.outcome or 'running'}, foods eaten: {env.eaten}, length: {len(env.snake)}, head: {env.snake[0]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,113 @@
+import json
+import time
+
+# Per-search instrumentation for the game loop.
+#
+# Every grid_engine search takes an optional stats dict and, given one,
+# fills in expanded, generated, duplicates and peak_open (see _record in
+# grid_engine.py). Without it the searches skip that bookkeeping, so a game
+# that does not ask for numbers does not pay for them. The other planners
+# (DStarLite.replan, DistanceField, HierarchicalMap.find_path) and the
+# Node-based demo searches fill in the same counts.
+#
+# SearchRecorder wraps the searches the main loop calls, and run_planner
+# times the planners that keep their own state. Each call gets a
+# fresh stats dict plus its wall time in nanoseconds and its path length,
+# and the numbers are summed per algorithm over the game. save() writes the
+# per-algorithm summary and every single search as JSON, so the
+# search_algorithm stages can be compared on real runs and a slow tick can
+# be traced to the search behind it.
+
+COUNTS = ("expanded", "generated", "duplicates", "peak_open")
+
+
+class SearchRecorder:
+    def __init__(self, keep_searches=True):
+        self.keep_searches = keep_searches
+        self.totals = {}  # Algorithm name -> sums over its searches
+        self.searches = []  # One dict per search in call order, if keep_searches
+        self.wrappers = {}
+
+    # search, wrapped to record every call under name. The wrapper is built
+    # once per (name, search), so PathFollower, which compares searches by
+    # identity, still sees the same function every tick.
+    def wrap(self, name, search):
+        wrapper = self.wrappers.get((name, search))
+        if wrapper is None:
+            def wrapper(grid, start, goal, *args, **kwargs):
+                return self.run(name, search, grid, start, goal, *args, **kwargs)
+            self.wrappers[(name, search)] = wrapper
+        return wrapper
+
+    def run(self, name, search, grid, start, goal, *args, **kwargs):
+        stats = {}
+        begin = time.perf_counter_ns()
+        path = search(grid, start, goal, *args, stats=stats, **kwargs)
+        self.record(name, stats, path, time.perf_counter_ns() - begin)
+        return path
+
+    # run for planners that keep their own state, like D* Lite and the
+    # wavefront field: plan(*args, stats=...) is timed, and route() gives
+    # the path to record afterwards. A call that leaves stats empty ran no
+    # search and is not recorded. Returns what plan returned.
+    def run_planner(self, name, plan, route, *args):
+        stats = {}
+        begin = time.perf_counter_ns()
+        result = plan(*args, stats=stats)
+        elapsed_ns = time.perf_counter_ns() - begin
+        if stats:
+            self.record(name, stats, route(), elapsed_ns)
+        return result
+
+    # Add one search's stats dict, path and wall time to name's totals
+    def record(self, name, stats, path, elapsed_ns):
+        total = self.totals.get(name)
+        if total is None:
+            total = self.totals[name] = dict.fromkeys(
+                ("searches", "found", "path_length", "elapsed_ns", "max_elapsed_ns", "max_peak_open") + COUNTS, 0)
+        total["searches"] += 1
+        if path is not None:
+            total["found"] += 1
+            total["path_length"] += len(path)
+        total["elapsed_ns"] += elapsed_ns
+        total["max_elapsed_ns"] = max(total["max_elapsed_ns"], elapsed_ns)
+        for key in COUNTS:
+            total[key] += stats.get(key, 0)
+        total["max_peak_open"] = max(total["max_peak_open"], stats.get("peak_open", 0))
+        if self.keep_searches:
+            self.searches.append(dict(stats, algorithm=name, path_length=len(path) if path is not None else None,
+                                      elapsed_ns=elapsed_ns))
+
+    # Per-algorithm means (path length over the searches that found one),
+    # totals and worst cases
+    def summary(self):
+        summary = {}
+        for name, total in self.totals.items():
+            searches = total["searches"]
+            summary[name] = {
+                "searches": searches,
+                "found": total["found"],
+                "mean_path_length": total["path_length"] / total["found"] if total["found"] else None,
+                "total_elapsed_ns": total["elapsed_ns"],
+                "mean_elapsed_ns": total["elapsed_ns"] / searches,
+                "max_elapsed_ns": total["max_elapsed_ns"],
+                "max_peak_open": total["max_peak_open"],
+                **{f"mean_{key}": total[key] / searches for key in COUNTS},
+            }
+        return summary
+
+    def save(self, path):
+        with open(path, "w") as stats_file:
+            json.dump({"algorithms": self.summary(), "searches": self.searches}, stats_file, indent=1)
+
+    def print_summary(self):
+        if not self.totals:
+            print("No searches recorded")
+            return
+        print(f"{'algorithm':<10} {'searches':>9} {'found':>6} {'avg path':>9} {'avg expanded':>13} "
+              f"{'avg generated':>14} {'avg dups':>9} {'peak open':>10} {'avg us':>8} {'max us':>8}")
+        for name, row in self.summary().items():
+            mean_path = row["mean_path_length"] if row["mean_path_length"] is not None else 0
+            print(f"{name:<10} {row['searches']:>9} {row['found']:>6} {mean_path:>9.1f} {row['mean_expanded']:>13.1f} "
+                  f"{row['mean_generated']:>14.1f} {row['mean_duplicates']:>9.1f} {row['max_peak_open']:>10} "
+                  f"{row['mean_elapsed_ns'] / 1000:>8.1f} {row['max_elapsed_ns'] / 1000:>8.1f}")
@@ -0,0 +1,144 @@
+import random
+
+from grid_engine import Grid
+
+# Headless snake game: the arena, snake, foods and scoring rules of
+# Snakefinal.py with no pygame anywhere, so games can run as fast as the
+# agent can pick moves. Drawing lives in snake_renderer.py.
+#
+# Rules, as the game plays them: the snake starts as one cell at (5, 5)
+# with one food on the board. After the i-th food is eaten (i = 1..3) an
+# extra food appears in slot i, so up to four foods are out at once.
+# Eating the first food grows the snake; the extra foods only score. The
+# game ends when the head hits the boundary, an obstacle or the body, once
+# food_target foods are eaten, or after max_steps moves.
+#
+# All randomness comes from the env's own generator, seeded per game, and
+# every step is logged as one byte in moves, so seed + map + moves replay a
+# game exactly (see replay.py).
+
+# Actions, as (dx, dy) head moves: up, down, left, right
+ACTIONS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
+# Obstacle pattern of the 20x20 Snakefinal.py arena
+OBSTACLES = [
+    (9, 7), (10, 8), (11, 9), (12, 10), (13, 11),
+    (5, 8), (5, 9), (5, 10), (5, 11), (5, 12), (5, 13), (5, 14),
+    (6, 14), (7, 14), (8, 14), (9, 14), (10, 14), (11, 14), (12, 14),
+]
+START = (5, 5)
+FOOD_SLOTS = 4
+FOOD_TARGET = 4  # Snakefinal.py ends the game after four foods
+DEATH_REWARD = -1
+NO_MOVE = 255  # moves entry for a step(None)
+SEED_BITS = 63
+FOOD_TRIES = 64  # Random food draws before falling back to listing the free cells
+
+
+# Cells around the edge of a width x height board
+def boundary_cells(width, height):
+    return [(x, 0) for x in range(width)] + [(x, height - 1) for x in range(width)] + \
+           [(0, y) for y in range(1, height - 1)] + [(width - 1, y) for y in range(1, height - 1)]
+
+
+class SnakeEnv:
+    def __init__(self, width=20, height=20, obstacles=OBSTACLES, food_blocked=(),
+                 food_target=FOOD_TARGET, max_steps=None, start=START):
+        self.width = width
+        self.height = height
+        self.obstacles = list(obstacles)
+        self.boundary = boundary_cells(width, height)
+        self.grid = Grid(width, height, self.obstacles + self.boundary)  # Built once, never changes
+        self.walls = set(self.obstacles) | set(self.boundary)
+        self.food_blocked = set(self.obstacles) | set(food_blocked)  # Cells food never spawns on
+        self.food_target = food_target
+        self.max_steps = max_steps
+        self.start = start
+        self.rng = random.Random()
+        self.reset()
+
+    # Start a new game; the same seed replays the same foods. Without a
+    # seed one is drawn and kept in self.seed, so any game can be replayed.
+    def reset(self, seed=None):
+        if seed is None:
+            seed = random.getrandbits(SEED_BITS)
+        self.seed = seed
+        self.rng.seed(seed)
+        self.moves = bytearray()  # One ACTIONS index (or NO_MOVE) per step
+        self.snake = [self.start]
+        self.body = {self.start}
+        self.foods = [None] * FOOD_SLOTS
+        self.eaten = 0
+        self.steps = 0
+        self.last_eaten = None  # Food slot eaten by the last step, if any
+        self.outcome = None  # "dead", "won", "stuck" (no move or no room for food) or "timeout"
+        self.foods[0] = self._place_food()
+        if self.foods[0] is None:
+            self.outcome = "stuck"
+
+    @property
+    def done(self):
+        return self.outcome is not None
+
+    # Move the head by action, a (dx, dy) from ACTIONS or its index there.
+    # None means the agent has no move and ends the game. Returns
+    # (reward, done): 1 per food eaten, DEATH_REWARD on a collision.
+    def step(self, action):
+        if self.outcome is not None:
+            return 0, True
+        self.last_eaten = None
+        if action is None:
+            self.moves.append(NO_MOVE)
+            self.outcome = "stuck"
+            return 0, True
+        if action.__class__ is int:
+            self.moves.append(action)
+            action = ACTIONS[action]
+        else:
+            self.moves.append(ACTIONS.index((action[0], action[1])))
+
+        snake = self.snake
+        head = snake[0]
+        new_head = (head[0] + action[0], head[1] + action[1])
+        self.steps += 1
+
+        foods = self.foods
+        slot = foods.index(new_head) if new_head in foods else None
+        if slot != 0:
+            self.body.discard(snake.pop())  # Only the first food grows the snake
+        if new_head in self.body or new_head in self.walls:
+            self.outcome = "dead"
+            return DEATH_REWARD, True
+        snake.insert(0, new_head)
+        self.body.add(new_head)
+
+        reward = 0
+        if slot is not None:
+            reward = 1
+            self.eaten += 1
+            self.last_eaten = slot
+            foods[slot] = self._place_food() if slot < FOOD_SLOTS - 1 else None
+            if self.eaten < FOOD_SLOTS and foods[self.eaten] is None:
+                foods[self.eaten] = self._place_food()
+            if self.eaten >= self.food_target:
+                self.outcome = "won"
+            elif foods[0] is None:
+                self.outcome = "stuck"  # The board is full
+        if self.outcome is None and self.max_steps is not None and self.steps >= self.max_steps:
+            self.outcome = "timeout"
+        return reward, self.outcome is not None
+
+    # A random free cell inside the boundary, off the body and the other
+    # foods, or None if there is none
+    def _place_food(self):
+        rng = self.rng
+        taken = self.food_blocked
+        body = self.body
+        foods = self.foods
+        for _ in range(FOOD_TRIES):
+            food = (rng.randint(1, self.width - 2), rng.randint(1, self.height - 2))
+            if food not in taken and food not in body and food not in foods:
+                return food
+        free = [(x, y) for y in range(1, self.height - 1) for x in range(1, self.width - 1)
+                if (x, y) not in taken and (x, y) not in body and (x, y) not in foods]
+        return rng.choice(free) if free else None
@@ -0,0 +1,74 @@
+import sys
+
+import pygame
+
+# Optional pygame window for a SnakeEnv. The game itself never imports
+# this module, so headless runs do not need pygame or a display.
+
+# Colors
+WHITE = (255, 255, 255)
+GREEN = (0, 255, 0)
+RED = (255, 0, 0)
+BLACK = (0, 0, 0)
+
+
+class SnakeRenderer:
+    def __init__(self, env, cell_size=20, caption='Snake Game', food_image='food.png'):
+        self.env = env
+        self.cell_size = cell_size
+        pygame.init()
+        self.screen = pygame.display.set_mode((env.width * cell_size, env.height * cell_size))
+        pygame.display.set_caption(caption)
+        self.food_image = pygame.image.load(food_image)
+        self.font = pygame.font.Font(None, 24)
+        self.clock = pygame.time.Clock()
+
+    # Handle window events; False once the window was closed
+    def poll(self):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return False
+        return True
+
+    # Draw the board, then the info lines in the top left corner
+    def draw(self, lines=()):
+        env = self.env
+        screen = self.screen
+        screen.fill(BLACK)
+
+        for obs in env.obstacles:
+            self._cell(obs, GREEN)
+        for segment in env.snake:
+            self._cell(segment, GREEN)
+        self._cell(env.snake[0], RED)
+        for food in env.foods:
+            if food is not None:
+                screen.blit(self.food_image, (food[0] * self.cell_size, food[1] * self.cell_size))
+        for point in env.boundary:
+            self._cell(point, GREEN)
+
+        for i, line in enumerate(lines):
+            screen.blit(self.font.render(f'   {line}', True, WHITE), (10, 20 + 20 * i))
+        pygame.display.flip()
+
+    # Wait so the game runs at speed frames per second
+    def tick(self, speed):
+        self.clock.tick(speed)
+
+    def game_over(self):
+        font = pygame.font.Font(None, 36)
+        game_over_text = font.render("      Game Over", True, RED)
+        width, height = self.screen.get_size()
+        self.screen.blit(game_over_text, (width // 2 - 120, height // 2 - 20))
+        pygame.display.flip()
+
+    # Keep the window open until it is closed, then exit
+    def wait_for_quit(self):
+        while True:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    sys.exit()
+
+    def _cell(self, pos, color):
+        pygame.draw.rect(self.screen, color, (pos[0] * self.cell_size, pos[1] * self.cell_size, self.cell_size, self.cell_size))
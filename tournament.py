@@ -0,0 +1,251 @@
+import csv
+import os
+import random
+import sys
+import time
+import tracemalloc
+from multiprocessing import Pool
+
+from grid_engine import Grid, a_star_search, bfs_search, dfs_search, greedy_best_first_search
+from path_follower import PathFollower
+from replay import save_replay
+from snake_env import OBSTACLES, SnakeEnv
+
+# Tournament of the four search agents of trial.py and maze_world.py.
+#
+# Every (seed, map, algorithm) task runs in a worker process: one search
+# from the map's start to its goal, then a headless snake game on the same
+# map with the algorithm steering. Tasks are small and independent, so
+# they go to a process pool in chunks and the rows are written out as they
+# come back.
+#
+# Usage: python tournament.py [--seeds N] [--maps maze,obstacles,arena]
+#        [--algorithms A*,BFS,DFS,GBFS] [--workers N] [--chunksize N]
+#        [--max-steps N] [--out results.csv] [--parquet results.parquet]
+#        [--replays DIR]
+#
+# Maps are built with random.Random(seed) in the same draw order as
+# maze_world.py and trial.py, so MAZE_SEED / OBSTACLE_SEED = seed there
+# shows the same walls, except that the tournament drops any wall drawn
+# on the start or the goal cell, where those scripts keep it. --replays
+# saves every game as a replay.py file.
+
+ALGORITHMS = {
+    "A*": a_star_search,
+    "BFS": bfs_search,
+    "DFS": dfs_search,
+    "GBFS": greedy_best_first_search,
+}
+
+COLUMNS = ["seed", "map", "algorithm", "path_length", "expanded", "wall_ns", "peak_bytes",
+           "survival_steps", "foods_eaten", "outcome"]
+
+DEFAULT_SEEDS = 20
+DEFAULT_MAX_STEPS = 1000  # Cap on each survival game
+CHUNKS_PER_WORKER = 8  # Default chunksize splits the tasks into about this many chunks per worker
+PARQUET_BATCH = 1024  # Rows per Parquet row group
+
+
+# Maps, built from a seed: (width, height, obstacles, start, goal)
+
+# Random walls over 30% of the board, as generate_maze in maze_world.py
+def maze_map(rng):
+    obstacles = [(x, y) for x in range(20) for y in range(15) if rng.random() < 0.3]
+    return 20, 15, obstacles, (2, 2), (17, 12)
+
+
+# 50 random obstacle drops, as generate_obstacles in trial.py
+def obstacles_map(rng):
+    obstacles = {(rng.randint(0, 19), rng.randint(0, 14)) for _ in range(50)}
+    return 20, 15, sorted(obstacles), (2, 2), (17, 12)
+
+
+# The Snakefinal.py arena; the seed only moves the goal
+def arena_map(rng):
+    blocked = set(OBSTACLES)
+    goal = (15, 15)
+    while goal in blocked or goal == (5, 5):
+        goal = (rng.randint(1, 18), rng.randint(1, 18))
+    return 20, 20, OBSTACLES, (5, 5), goal
+
+
+MAPS = {
+    "maze": maze_map,
+    "obstacles": obstacles_map,
+    "arena": arena_map,
+}
+
+
+def build_map(name, seed):
+    width, height, obstacles, start, goal = MAPS[name](random.Random(seed))
+    obstacles = [pos for pos in obstacles if pos != start and pos != goal]
+    return width, height, obstacles, start, goal
+
+
+# Run one (seed, map, algorithm) task; returns a row for COLUMNS
+def run_task(task):
+    seed, map_name, algorithm, max_steps, replay_dir = task
+    search = ALGORITHMS[algorithm]
+    width, height, obstacles, start, goal = build_map(map_name, seed)
+    grid = Grid(width, height, obstacles)
+
+    stats = {}
+    begin = time.perf_counter_ns()
+    path = search(grid, start, goal, stats=stats)
+    wall_ns = time.perf_counter_ns() - begin
+
+    # Second run under tracemalloc, so tracing does not skew wall_ns
+    tracemalloc.start()
+    search(grid, start, goal)
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    env = play_game(search, width, height, obstacles, start, seed, max_steps)
+    if replay_dir is not None:
+        save_replay(os.path.join(replay_dir, f"{seed}_{map_name}_{algorithm.replace('*', 'star')}.snkr"), env)
+    return [seed, map_name, algorithm, len(path) if path is not None else None, stats.get("expanded"),
+            wall_ns, peak_bytes, env.steps, env.eaten, env.outcome]
+
+
+# A headless game on the map, chasing the first food. As in Snakefinal.py,
+# a PathFollower walks the planned route and only searches again when it
+# goes stale; searching every tick and keeping the first step left DFS
+# bouncing between two cells. The searches see the body as walls.
+def play_game(search, width, height, obstacles, start, seed, max_steps):
+    env = SnakeEnv(width, height, obstacles, food_target=width * height, max_steps=max_steps, start=start)
+    env.reset(seed)
+    grid = env.grid
+    follower = PathFollower(grid)
+
+    def search_around_body(grid, head, goal):
+        body = env.snake[1:]
+        for pos in body:
+            grid.set_blocked(pos, True)
+        path = search(grid, head, goal)
+        for pos in body:
+            grid.set_blocked(pos, False)
+        return path
+
+    while not env.done:
+        head = env.snake[0]
+        step = follower.next_step(search_around_body, env.snake, env.foods[0])
+        env.step((step[0] - head[0], step[1] - head[1]) if step is not None else None)
+    return env
+
+
+# Writes rows to CSV as they arrive, and to Parquet too if asked and
+# pyarrow is installed
+class ResultWriter:
+    def __init__(self, csv_path, parquet_path=None):
+        self.csv_file = open(csv_path, "w", newline="")
+        self.csv = csv.writer(self.csv_file)
+        self.csv.writerow(COLUMNS)
+        self.parquet = None
+        self.pending = []
+        if parquet_path is not None:
+            try:
+                import pyarrow
+                import pyarrow.parquet
+            except ImportError:
+                print("pyarrow is not installed; writing CSV only")
+                return
+            self.pyarrow = pyarrow
+            self.schema = pyarrow.schema([
+                ("seed", pyarrow.int64()), ("map", pyarrow.string()), ("algorithm", pyarrow.string()),
+                ("path_length", pyarrow.int64()), ("expanded", pyarrow.int64()), ("wall_ns", pyarrow.int64()),
+                ("peak_bytes", pyarrow.int64()), ("survival_steps", pyarrow.int64()),
+                ("foods_eaten", pyarrow.int64()), ("outcome", pyarrow.string()),
+            ])
+            self.parquet = pyarrow.parquet.ParquetWriter(parquet_path, self.schema)
+
+    def write(self, row):
+        self.csv.writerow(row)
+        if self.parquet is not None:
+            self.pending.append(row)
+            if len(self.pending) >= PARQUET_BATCH:
+                self._flush_parquet()
+
+    def close(self):
+        self.csv_file.close()
+        if self.parquet is not None:
+            self._flush_parquet()
+            self.parquet.close()
+
+    def _flush_parquet(self):
+        if self.pending:
+            columns = list(zip(*self.pending))
+            self.parquet.write_table(self.pyarrow.table(
+                {name: list(values) for name, values in zip(COLUMNS, columns)}, schema=self.schema))
+            self.pending = []
+
+
+def main(argv):
+    seeds = DEFAULT_SEEDS
+    maps = list(MAPS)
+    algorithms = list(ALGORITHMS)
+    workers = os.cpu_count() or 1
+    chunksize = None
+    max_steps = DEFAULT_MAX_STEPS
+    out = "tournament.csv"
+    parquet = None
+    replay_dir = None
+    if "--seeds" in argv:
+        seeds = int(argv[argv.index("--seeds") + 1])
+    if "--maps" in argv:
+        maps = argv[argv.index("--maps") + 1].split(",")
+    if "--algorithms" in argv:
+        algorithms = argv[argv.index("--algorithms") + 1].split(",")
+    if "--workers" in argv:
+        workers = int(argv[argv.index("--workers") + 1])
+    if "--chunksize" in argv:
+        chunksize = int(argv[argv.index("--chunksize") + 1])
+    if "--max-steps" in argv:
+        max_steps = int(argv[argv.index("--max-steps") + 1])
+    if "--out" in argv:
+        out = argv[argv.index("--out") + 1]
+    if "--parquet" in argv:
+        parquet = argv[argv.index("--parquet") + 1]
+    if "--replays" in argv:
+        replay_dir = argv[argv.index("--replays") + 1]
+        os.makedirs(replay_dir, exist_ok=True)
+
+    unknown = [name for name in maps if name not in MAPS] + [name for name in algorithms if name not in ALGORITHMS]
+    if unknown:
+        print(f"Unknown maps or algorithms: {', '.join(unknown)}")
+        print(f"Maps: {', '.join(MAPS)}; algorithms: {', '.join(ALGORITHMS)}")
+        return 1
+
+    tasks = [(seed, map_name, algorithm, max_steps, replay_dir)
+             for seed in range(seeds) for map_name in maps for algorithm in algorithms]
+    if chunksize is None:
+        chunksize = max(1, len(tasks) // (workers * CHUNKS_PER_WORKER))
+
+    writer = ResultWriter(out, parquet)
+    totals = {}  # algorithm -> [tasks, paths found, path length, expanded, wall ns, survival steps]
+    begin = time.perf_counter()
+    with Pool(workers) as pool:
+        for row in pool.imap_unordered(run_task, tasks, chunksize):
+            writer.write(row)
+            total = totals.setdefault(row[2], [0] * 6)
+            total[0] += 1
+            if row[3] is not None:
+                total[1] += 1
+                total[2] += row[3]
+            total[3] += row[4] or 0
+            total[4] += row[5]
+            total[5] += row[7]
+    writer.close()
+    elapsed = time.perf_counter() - begin
+
+    print(f"{len(tasks)} tasks on {workers} workers in {elapsed:.1f} s ({len(tasks) / elapsed:.0f} tasks/s), results in {out}")
+    print(f"{'algorithm':<10} {'found':>7} {'avg path':>9} {'avg expanded':>13} {'avg us':>8} {'avg survival':>13}")
+    for algorithm in algorithms:
+        count, found, length, expanded, wall_ns, survival = totals[algorithm]
+        avg_path = length / found if found else 0
+        print(f"{algorithm:<10} {found:>7} {avg_path:>9.1f} {expanded / count:>13.1f} "
+              f"{wall_ns / count / 1000:>8.1f} {survival / count:>13.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
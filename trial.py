@@ -1,7 +1,8 @@
-import pygame
 import sys
 import heapq
 import random
+from grid_engine import _record
+from maze_grid import MazeGrid
 
 # Define colors
 WHITE = (255, 255, 255)
@@ -13,42 +14,29 @@ RED = (255, 0, 0)
 GRID_SIZE = 30
 GRID_WIDTH = 20
 GRID_HEIGHT = 15
-
-# Define classes
-class Node:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.parent = None
-        self.g = 0
-        self.h = 0
-
-    def __lt__(self, other):
-        return (self.g + self.h) < (other.g + other.h)
+OBSTACLE_SEED = None  # Seed for the obstacles; None draws a new one (printed at the start)
 
 def heuristic(node, goal):
     return abs(node.x - goal.x) + abs(node.y - goal.y)
 
-def get_neighbors(grid, node):
-    neighbors = []
-    if node.x > 0 and not grid[node.x - 1][node.y]:
-        neighbors.append(Node(node.x - 1, node.y))
-    if node.x < GRID_WIDTH - 1 and not grid[node.x + 1][node.y]:
-        neighbors.append(Node(node.x + 1, node.y))
-    if node.y > 0 and not grid[node.x][node.y - 1]:
-        neighbors.append(Node(node.x, node.y - 1))
-    if node.y < GRID_HEIGHT - 1 and not grid[node.x][node.y + 1]:
-        neighbors.append(Node(node.x, node.y + 1))
-    return neighbors
-
-def astar_search(grid, start, goal):
+
+# Each search takes an optional stats dict and fills it with the same counts
+# as the grid_engine searches (see _record there)
+
+def astar_search(grid, start, goal, stats=None):
+    grid.reset_nodes()
     open_list = []
-    closed_list = []
+    closed_list = set()
 
     heapq.heappush(open_list, (0, start))
     came_from = {}
+    path = None
+    track = stats is not None
+    expanded = duplicates = peak_open = 0
 
     while open_list:
+        if track and len(open_list) > peak_open:
+            peak_open = len(open_list)
         _, current = heapq.heappop(open_list)
 
         if current == goal:
@@ -56,29 +44,45 @@ def astar_search(grid, start, goal):
             while current in came_from:
                 path.append(current)
                 current = came_from[current]
-            return path
+            break
 
-        closed_list.append(current)
+        closed_list.add(current)
+        expanded += 1  # Stale entries are expanded again, so closed_list undercounts
 
-        for neighbor in get_neighbors(grid, current):
+        for neighbor in grid.neighbors(current):
             if neighbor in closed_list:
                 continue
             tentative_g = current.g + 1
 
-            if neighbor not in [n[1] for n in open_list] or tentative_g < neighbor.g:
+            queued = neighbor in [n[1] for n in open_list]
+            if not queued or tentative_g < neighbor.g:
+                if queued:
+                    duplicates += 1
                 neighbor.g = tentative_g
                 neighbor.h = heuristic(neighbor, goal)
                 came_from[neighbor] = current
                 heapq.heappush(open_list, (neighbor.g + neighbor.h, neighbor))
 
-    return None
+    if track:
+        # The start, the first push of every cell in came_from, and the re-pushes
+        _record(stats, expanded, 1 + len(came_from) + duplicates, duplicates, peak_open)
+    return path
 
-def breadth_first_search(grid, start, goal):
+def breadth_first_search(grid, start, goal, stats=None):
     queue = [start]
     visited = set()
+    came_from = {}
+    path = None
+    track = stats is not None
+    generated = 1
+    duplicates = peak_open = 0
 
     while queue:
+        if track and len(queue) > peak_open:
+            peak_open = len(queue)
         current = queue.pop(0)
+        if current in visited:
+            continue
         visited.add(current)
 
         if current == goal:
@@ -88,21 +92,36 @@ def breadth_first_search(grid, start, goal):
                 current = came_from[current]
             path.append(start)
             path.reverse()
-            return path
+            break
 
-        for neighbor in get_neighbors(grid, current):
+        for neighbor in grid.neighbors(current):
             if neighbor not in visited:
+                # Already in came_from but unvisited means already queued
+                if neighbor in came_from:
+                    duplicates += 1
                 queue.append(neighbor)
                 came_from[neighbor] = current
+                generated += 1
 
-    return None
+    if track:
+        _record(stats, len(visited) - (path is not None), generated, duplicates, peak_open)
+    return path
 
-def depth_first_search(grid, start, goal):
+def depth_first_search(grid, start, goal, stats=None):
     stack = [start]
     visited = set()
+    came_from = {}
+    path = None
+    track = stats is not None
+    generated = 1
+    duplicates = peak_open = 0
 
     while stack:
+        if track and len(stack) > peak_open:
+            peak_open = len(stack)
         current = stack.pop()
+        if current in visited:
+            continue
         visited.add(current)
 
         if current == goal:
@@ -112,23 +131,34 @@ def depth_first_search(grid, start, goal):
                 current = came_from[current]
             path.append(start)
             path.reverse()
-            return path
+            break
 
-        for neighbor in get_neighbors(grid, current):
+        for neighbor in grid.neighbors(current):
             if neighbor not in visited:
+                # Already in came_from but unvisited means already queued
+                if neighbor in came_from:
+                    duplicates += 1
                 stack.append(neighbor)
                 came_from[neighbor] = current
+                generated += 1
 
-    return None
+    if track:
+        _record(stats, len(visited) - (path is not None), generated, duplicates, peak_open)
+    return path
 
-def greedy_best_first_search(grid, start, goal):
+def greedy_best_first_search(grid, start, goal, stats=None):
     open_list = []
-    closed_list = []
+    closed_list = set()
 
     heapq.heappush(open_list, (heuristic(start, goal), start))
     came_from = {}
+    path = None
+    track = stats is not None
+    peak_open = 0
 
     while open_list:
+        if track and len(open_list) > peak_open:
+            peak_open = len(open_list)
         _, current = heapq.heappop(open_list)
 
         if current == goal:
@@ -136,11 +166,11 @@ def greedy_best_first_search(grid, start, goal):
             while current in came_from:
                 path.append(current)
                 current = came_from[current]
-            return path
+            break
 
-        closed_list.append(current)
+        closed_list.add(current)
 
-        for neighbor in get_neighbors(grid, current):
+        for neighbor in grid.neighbors(current):
             if neighbor in closed_list:
                 continue
 
@@ -148,60 +178,76 @@ def greedy_best_first_search(grid, start, goal):
                 heapq.heappush(open_list, (heuristic(neighbor, goal), neighbor))
                 came_from[neighbor] = current
 
-def generate_obstacles(grid):
+    if track:
+        # Queued cells are never pushed again, so each came_from entry is one push
+        _record(stats, len(closed_list), 1 + len(came_from), 0, peak_open)
+    return path
+
+# Drop 50 obstacles at positions drawn from rng, a random.Random, so a seed rebuilds them
+def generate_obstacles(grid, rng):
     obstacles = []
     for _ in range(50):
-        x = random.randint(0, GRID_WIDTH - 1)
-        y = random.randint(0, GRID_HEIGHT - 1)
+        x = rng.randint(0, GRID_WIDTH - 1)
+        y = rng.randint(0, GRID_HEIGHT - 1)
         if grid[x][y] == 0:
             obstacles.append((x, y))
             grid[x][y] = 1
     return obstacles
 
-# Initialize the game
-pygame.init()
-screen = pygame.display.set_mode((GRID_SIZE * GRID_WIDTH, GRID_SIZE * GRID_HEIGHT))
-pygame.display.set_caption("Search Algorithm Demo")
-
-grid = [[0 for _ in range(GRID_HEIGHT)] for _ in range(GRID_WIDTH)]
-start = Node(2, 2)
-goal = Node(17, 12)
-
-# Create obstacles
-obstacles = generate_obstacles(grid)
-
-# Find the path using search algorithms
-came_from = {}
-for algo in [astar_search, breadth_first_search, depth_first_search, greedy_best_first_search]:
-    path = algo(grid, start, goal)
-    for node in path:
-        came_from[node] = None
-
-# Main loop
-running = True
-while running:
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-
-    screen.fill(WHITE)
-
-    # Draw the grid
-    for x in range(GRID_WIDTH):
-        for y in range(GRID_HEIGHT):
-            color = GREEN if grid[x][y] == 0 else BLACK
-            pygame.draw.rect(screen, color, (x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE, GRID_SIZE))
-
-    # Draw the obstacles
-    for x, y in obstacles:
-        pygame.draw.rect(screen, BLACK, (x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE, GRID_SIZE))
-
-    # Draw the path
-    for node in came_from:
-        if came_from[node]:
+
+# The demo: draw random obstacles and the cells on the four paths
+def main():
+    import pygame
+
+    # Initialize the game
+    pygame.init()
+    screen = pygame.display.set_mode((GRID_SIZE * GRID_WIDTH, GRID_SIZE * GRID_HEIGHT))
+    pygame.display.set_caption("Search Algorithm Demo")
+
+    grid = MazeGrid(GRID_WIDTH, GRID_HEIGHT)
+    start = grid.node(2, 2)
+    goal = grid.node(17, 12)
+
+    # Create obstacles
+    obstacle_seed = OBSTACLE_SEED if OBSTACLE_SEED is not None else random.getrandbits(63)
+    print(f"Obstacle seed: {obstacle_seed}")
+    obstacles = generate_obstacles(grid, random.Random(obstacle_seed))
+
+    # Find the path using search algorithms
+    path_nodes = set()
+    for algo in [astar_search, breadth_first_search, depth_first_search, greedy_best_first_search]:
+        path = algo(grid, start, goal)
+        if path:
+            path_nodes.update(path)
+
+    # Main loop
+    running = True
+    while running:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+
+        screen.fill(WHITE)
+
+        # Draw the grid
+        for x in range(GRID_WIDTH):
+            for y in range(GRID_HEIGHT):
+                color = GREEN if grid[x][y] == 0 else BLACK
+                pygame.draw.rect(screen, color, (x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE, GRID_SIZE))
+
+        # Draw the obstacles
+        for x, y in obstacles:
+            pygame.draw.rect(screen, BLACK, (x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE, GRID_SIZE))
+
+        # Draw the path
+        for node in path_nodes:
             x, y = node.x, node.y
             pygame.draw.rect(screen, RED, (x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE, GRID_SIZE))
 
-    pygame.display.flip()
+        pygame.display.flip()
+
+    pygame.quit()
+
 
-pygame.quit()
+if __name__ == "__main__":
+    main()